@@ -1,4 +1,16 @@
 import os
 
 USER_DATA = os.path.join(os.path.dirname(__file__), ".." ,"database", "users.json")
+TOKEN_CACHE_PATH = os.getenv("TOKEN_CACHE_PATH", os.path.join(os.path.dirname(__file__), "..", "database", "token_cache.sqlite"))
+# 형태소 분석기 백엔드(okt/kiwi)와 API 기동 시 전처리 작업 프로세스에서 미리 띄워둘지 여부
+TOKENIZER_BACKEND = os.getenv("TOKENIZER_BACKEND", "okt")
+TOKENIZER_WARMUP = os.getenv("TOKENIZER_WARMUP", "1") == "1"
+# 전처리 작업을 실행할 프로세스 수 (프로세스마다 형태소 분석기를 하나씩 띄움)
+PREPROCESS_JOB_WORKERS = int(os.getenv("PREPROCESS_JOB_WORKERS", "1"))
+# /review/preprocess가 MongoDB 커서에서 한 번에 읽어 전처리기에 넘길 문서 수
+PREPROCESS_BATCH_SIZE = int(os.getenv("PREPROCESS_BATCH_SIZE", "5000"))
+# {site}_processed 컬렉션에 한 번의 bulk_write로 보낼 최대 작업 수
+PROCESSED_WRITE_BATCH_SIZE = int(os.getenv("PROCESSED_WRITE_BATCH_SIZE", "1000"))
+# 분석(집계) API 결과를 프로세스 내에 캐시해 둘 시간(초). 전처리 작업이 끝나면 해당 사이트는 바로 무효화됨
+ANALYTICS_CACHE_TTL = float(os.getenv("ANALYTICS_CACHE_TTL", "300"))
 PORT = 8000
\ No newline at end of file
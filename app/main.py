@@ -6,7 +6,12 @@ import os
 
 from app.user.user_router import user
 from app.review.review_router import review
-from app.config import PORT
+from app.config import PORT, TOKENIZER_WARMUP
+from app.review.review_jobs import job_manager
+from app.review.review_repository import ProcessedReviewRepository
+from database.mongodb_connection import mongo_db
+from pymongo.errors import PyMongoError
+from review_analysis.preprocessing.registry import PROCESSORS
 
 # 기본 FastAPI 앱 생성(커스텀 JSON 응답 클래스 사용하지 않음)
 app = FastAPI()
@@ -16,6 +21,25 @@ from database.mysql_connection import engine
 from app.user.user_repository import Base
 Base.metadata.create_all(bind=engine)
 
+@app.on_event("startup")
+def start_preprocess_workers():
+    # 첫 전처리 요청이 프로세스/분석기(Okt는 JVM) 기동 비용을 떠안지 않도록 기동 시 작업 프로세스를 미리 띄움
+    job_manager.start(warm_up=TOKENIZER_WARMUP, prespawn=True)
+
+@app.on_event("startup")
+def create_review_indexes():
+    # GET /review/{site} 필터/페이지네이션용 복합 인덱스 (이미 있으면 그대로 둠)
+    try:
+        for site_name in PROCESSORS:
+            ProcessedReviewRepository(mongo_db[f"{site_name}_processed"]).ensure_indexes()
+    except PyMongoError as e:
+        # MongoDB에 연결할 수 없어도 사용자 API는 동작하도록 경고만 남김
+        print(f"⚠️ 리뷰 인덱스 생성 실패: {e}")
+
+@app.on_event("shutdown")
+def stop_preprocess_workers():
+    job_manager.shutdown()
+
 static_path = os.path.join(os.path.dirname(__file__), "static")
 app.mount("/static", StaticFiles(directory=static_path), name="static")
 
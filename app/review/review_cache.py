@@ -0,0 +1,51 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from app.config import ANALYTICS_CACHE_TTL
+
+class TTLCache:
+    """
+    만료 시간이 있는 프로세스 내 캐시 (스레드 안전)
+
+    키는 (사이트 이름, ...) 튜플이며, 전처리 작업이 끝나면 invalidate(site_name)으로
+    해당 사이트의 값만 지운다. uvicorn 워커가 여러 개면 워커마다 따로 캐시하므로
+    다른 워커의 값은 최대 ttl초까지 이전 결과일 수 있다.
+    """
+
+    def __init__(self, ttl: float = 300.0) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+        """
+        캐시된 값이 있고 만료되지 않았으면 반환하고, 없으면 compute()로 계산해 저장하는 메서드
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        # 집계는 락 밖에서 실행 (같은 키가 동시에 계산될 수는 있지만 다른 키 조회를 막지 않음)
+        value = compute()
+        with self._lock:
+            self._values[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate(self, site_name: str) -> None:
+        with self._lock:
+            for key in [key for key in self._values if key[0] == site_name]:
+                del self._values[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._values)}
+
+
+# 분석 API가 함께 쓰는 집계 결과 캐시 (전처리 작업이 성공하면 JobManager가 해당 사이트를 무효화)
+analytics_cache = TTLCache(ttl=ANALYTICS_CACHE_TTL)
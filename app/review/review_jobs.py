@@ -0,0 +1,214 @@
+import multiprocessing
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+from app.review.review_cache import analytics_cache
+from review_analysis.preprocessing.tokenizer import get_tokenizer_service
+from app.config import PREPROCESS_JOB_WORKERS, TOKENIZER_BACKEND
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+def _init_job_worker(warm_up: bool) -> None:
+    # 작업 프로세스마다 형태소 분석기를 한 번만 띄워두고 이후 작업들이 재사용
+    if not warm_up:
+        return
+    try:
+        get_tokenizer_service(TOKENIZER_BACKEND, pool_size=1).warm_up()
+    except Exception as e:
+        # Java/konlpy(또는 kiwipiepy)가 없는 환경에서도 작업 프로세스는 기동되도록 경고만 남김
+        print(f"⚠️ 토크나이저 워밍업 실패: {e}")
+
+def _worker_metrics() -> Tuple[int, Dict[str, Any]]:
+    return os.getpid(), get_tokenizer_service(TOKENIZER_BACKEND).metrics()
+
+def _run_job(site_name: str, incremental: bool, progress: MutableMapping[str, Any]) -> Tuple[Dict[str, Any], str]:
+    # 작업 프로세스에서 실행 (pandas 등 무거운 모듈은 이 프로세스에만 임포트됨)
+    from app.review.review_service import preprocess_site
+
+    progress.update(status="running", started_at=_now())
+    return preprocess_site(site_name, incremental, progress)
+
+class JobManager:
+    """
+    리뷰 전처리 작업을 spawn 프로세스 풀에서 실행하고 상태를 관리하는 클래스
+
+    - submit()은 작업을 큐에 넣고 바로 작업 id를 반환한다.
+    - 같은 사이트, 같은 모드(전체/증분)의 작업이 대기/실행 중이면 새로 만들지 않고 그 작업 id를 돌려준다.
+      (전체 처리 요청이 증분 작업에 합쳐지지 않도록 모드가 다르면 새 작업을 만듦)
+    - 한 사이트의 작업은 한 번에 하나만 실행한다. 다른 모드의 작업은 실행 중인 작업이 끝날 때까지
+      기다렸다가 실행되므로 {site}_processed와 처리 이력을 두 작업이 동시에 고쳐 쓰지 않는다.
+    - 작업 프로세스는 진행 상황(stage, raw_rows 등)을 Manager dict에 기록하고,
+      get()은 이를 작업 상태와 합쳐 반환한다.
+    - 끝난 작업은 최근 max_finished개만 보관한다.
+    - 작업이 성공하면 해당 사이트의 분석 API 캐시(analytics_cache)를 무효화한다.
+    """
+
+    def __init__(self, max_workers: int = 1, max_finished: int = 100):
+        self.max_workers = max_workers
+        self.max_finished = max_finished
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._progress: Dict[str, MutableMapping[str, Any]] = {}
+        # 사이트 → 프로세스 풀에 넣은 작업 id, 사이트 → 그 작업이 끝나기를 기다리는 (다른 모드의) 작업 id
+        self._active: Dict[str, str] = {}
+        self._waiting: Dict[str, str] = {}
+        self._worker_metrics: Dict[int, Dict[str, Any]] = {}
+
+    def start(self, warm_up: bool = True, prespawn: bool = False) -> None:
+        """
+        작업 프로세스 풀을 만드는 메서드 (이미 만들어졌으면 아무것도 하지 않음)
+
+        Parameters:
+        - warm_up (bool): 작업 프로세스가 뜰 때 형태소 분석기를 미리 띄울지 여부
+        - prespawn (bool): 첫 작업을 기다리지 않고 지금 max_workers개의 프로세스를 모두 띄울지 여부
+        """
+        with self._lock:
+            if self._executor is not None:
+                return
+            # JVM을 띄운 프로세스를 fork하지 않도록 spawn 사용
+            context = multiprocessing.get_context("spawn")
+            self._manager = context.Manager()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context,
+                                                 initializer=_init_job_worker, initargs=(warm_up,))
+            if prespawn:
+                for _ in range(self.max_workers):
+                    self._executor.submit(_worker_metrics).add_done_callback(self._record_worker_metrics)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._manager.shutdown()
+                self._executor = None
+                self._manager = None
+
+    def submit(self, site_name: str, incremental: bool = False) -> Tuple[Dict[str, Any], bool]:
+        """
+        사이트 전처리 작업을 큐에 넣는 메서드
+
+        Returns:
+        - Tuple[Dict[str, Any], bool]: (작업 상태, 이미 대기/실행 중인 작업에 합쳐졌는지 여부)
+        """
+        self.start()
+        with self._lock:
+            for queued_id in (self._active.get(site_name), self._waiting.get(site_name)):
+                if queued_id is not None and self._jobs[queued_id]["incremental"] == incremental:
+                    return self._snapshot(queued_id), True
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "site_name": site_name,
+                "incremental": incremental,
+                "status": "queued",
+                "submitted_at": _now(),
+                "started_at": None,
+                "finished_at": None,
+                "progress": {},
+                "result": None,
+                "message": None,
+                "error": None,
+            }
+            if site_name in self._active:
+                # 같은 사이트의 다른 모드 작업이 실행 중이면 끝난 뒤에 실행 (_finish에서 제출)
+                self._waiting[site_name] = job_id
+                return self._snapshot(job_id), False
+            future = self._launch(job_id)
+            job = self._snapshot(job_id)
+        # 콜백은 락 밖에서 등록 (이미 끝난 future면 즉시 호출되므로)
+        future.add_done_callback(partial(self._finish, job_id))
+        return job, False
+
+    def _launch(self, job_id: str) -> Future:
+        # 락을 잡은 상태에서 호출
+        job = self._jobs[job_id]
+        progress = self._manager.dict()
+        self._progress[job_id] = progress
+        self._active[job["site_name"]] = job_id
+        return self._executor.submit(_run_job, job["site_name"], job["incremental"], progress)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if job_id not in self._jobs:
+                return None
+            return self._snapshot(job_id)
+
+    def worker_metrics(self) -> Dict[int, Dict[str, Any]]:
+        """
+        작업 프로세스별 토크나이저 통계 (워커 기동 직후 또는 마지막 작업이 끝난 시점 기준)
+        """
+        with self._lock:
+            return dict(self._worker_metrics)
+
+    def _snapshot(self, job_id: str) -> Dict[str, Any]:
+        job = dict(self._jobs[job_id])
+        progress = self._progress.get(job_id)
+        if progress is not None:
+            live = dict(progress)
+            job["status"] = live.pop("status", job["status"])
+            job["started_at"] = live.pop("started_at", job["started_at"])
+            job["progress"] = live
+        return job
+
+    def _record_worker_metrics(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            pid, metrics = future.result()
+            with self._lock:
+                self._worker_metrics[pid] = metrics
+
+    def _finish(self, job_id: str, future: Future) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            try:
+                job.update(self._snapshot(job_id))
+            except Exception:
+                # Manager가 이미 종료된 경우 (앱 종료 중)
+                pass
+            self._progress.pop(job_id, None)
+            site_name = job["site_name"]
+            if self._active.get(site_name) == job_id:
+                del self._active[site_name]
+            job["finished_at"] = _now()
+            if future.cancelled():
+                job["status"] = "cancelled"
+            elif future.exception() is not None:
+                error = future.exception()
+                job["status"] = "failed"
+                job["error"] = f"{type(error).__name__}: {error}"
+            else:
+                data, message = future.result()
+                job["status"] = "succeeded"
+                job["result"] = data
+                job["message"] = message
+                self._worker_metrics[data["worker_pid"]] = data["tokenizer"]
+                # {site}_processed가 바뀌었으므로 이 프로세스의 집계 캐시를 비움
+                analytics_cache.invalidate(job["site_name"])
+            next_id, next_future = self._waiting.pop(site_name, None), None
+            if next_id is not None:
+                if self._executor is None:
+                    # 앱 종료로 풀이 닫힌 경우
+                    self._jobs[next_id].update(status="cancelled", finished_at=_now())
+                else:
+                    next_future = self._launch(next_id)
+            self._prune()
+        if next_future is not None:
+            next_future.add_done_callback(partial(self._finish, next_id))
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job["finished_at"] is not None]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+
+# API 프로세스 전체가 함께 쓰는 작업 관리자
+job_manager = JobManager(max_workers=PREPROCESS_JOB_WORKERS)
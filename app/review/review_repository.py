@@ -0,0 +1,292 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from pymongo import ASCENDING, DESCENDING, DeleteMany, ReplaceOne, UpdateOne
+from pymongo.collection import Collection
+
+# 조회 API의 정렬 순서 (최신순, 같은 날짜는 review_hash 역순) = keyset 페이지네이션 키
+PAGE_SORT = [("date", DESCENDING), ("review_hash", DESCENDING)]
+
+# 조회 API의 필터(동등 조건) → 정렬 키 순서의 복합 인덱스
+PAGE_INDEXES = {
+    "date_review_hash": PAGE_SORT,
+    "rating_date_review_hash": [("rating", ASCENDING)] + PAGE_SORT,
+    "year_month_date_review_hash": [("year_month", ASCENDING)] + PAGE_SORT,
+    "book_id_date_review_hash": [("book_id", ASCENDING)] + PAGE_SORT,
+}
+
+def _batched(items: Sequence[Any], batch_size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+def document_hash(document: Dict[str, Any]) -> str:
+    """
+    전처리 결과 문서 내용의 해시 (같은 review_hash라도 토큰화 결과 등이 바뀌면 달라짐)
+    """
+    content = {key: value for key, value in document.items() if key not in ("_id", "doc_hash")}
+    encoded = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+def encode_cursor(document: Dict[str, Any]) -> str:
+    """
+    페이지의 마지막 문서로 다음 페이지를 가리키는 커서 토큰을 만드는 함수
+    """
+    key = {"date": document["date"].isoformat(), "review_hash": document["review_hash"]}
+    return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
+
+def decode_cursor(token: str) -> Tuple[datetime, str]:
+    """
+    커서 토큰을 (date, review_hash)로 되돌리는 함수
+
+    Raises:
+    - ValueError: 올바르지 않은 토큰인 경우
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        return datetime.fromisoformat(key["date"]), str(key["review_hash"])
+    except (TypeError, KeyError, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+class ProcessedReviewRepository:
+    """
+    {site_name}_processed 컬렉션을 review_hash 기준으로 동기화하는 레포지토리 클래스
+
+    컬렉션을 비우고 다시 넣는 대신 기존 문서와 비교해 새로 생긴 문서는 삽입,
+    내용(doc_hash)이 바뀐 문서는 교체, 사라진 문서는 삭제하고 나머지는 건드리지 않는다.
+    쓰기는 batch_size개씩 ordered=False bulk_write로 나눠 보낸다.
+    """
+
+    def __init__(self, collection: Collection, batch_size: int = 1000) -> None:
+        """
+        Parameters:
+        - collection (Collection): 전처리 결과 컬렉션 (mongo_db[f"{site_name}_processed"])
+        - batch_size (int): bulk_write 한 번에 보낼 최대 작업 수
+        """
+        self.collection = collection
+        self.batch_size = batch_size
+
+    def ensure_indexes(self) -> None:
+        """
+        조회 API용 복합 인덱스를 만드는 메서드 (이미 있으면 아무것도 하지 않음)
+        """
+        for name, keys in PAGE_INDEXES.items():
+            self.collection.create_index(keys, name=name)
+
+    def find_page(self, rating: Optional[int] = None, date_from: Optional[datetime] = None,
+                  date_to: Optional[datetime] = None, year_month: Optional[str] = None,
+                  book_id: Optional[str] = None, after: Optional[str] = None,
+                  limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        필터에 맞는 전처리 리뷰를 최신순으로 한 페이지 조회하는 메서드
+
+        skip 대신 직전 페이지 마지막 문서의 (date, review_hash) 다음부터 읽으므로
+        (keyset 페이지네이션) 뒤쪽 페이지도 인덱스 범위 탐색 한 번으로 조회된다.
+        다음 페이지가 있는지 알 수 있도록 최대 limit + 1개를 반환한다.
+
+        Parameters:
+        - rating (Optional[int]): 별점
+        - date_from (Optional[datetime]): 이 시각 이후(포함)
+        - date_to (Optional[datetime]): 이 시각 이전(미포함)
+        - year_month (Optional[str]): "YYYY-MM"
+        - book_id (Optional[str]): 도서 ID
+        - after (Optional[str]): 직전 응답의 next_cursor
+        - limit (int): 페이지 크기
+
+        Raises:
+        - ValueError: 커서가 올바르지 않은 경우
+        """
+        query: Dict[str, Any] = {}
+        if rating is not None:
+            query["rating"] = rating
+        if year_month is not None:
+            query["year_month"] = year_month
+        if book_id is not None:
+            query["book_id"] = book_id
+        date_range = {}
+        if date_from is not None:
+            date_range["$gte"] = date_from
+        if date_to is not None:
+            date_range["$lt"] = date_to
+        if date_range:
+            query["date"] = date_range
+        if after is not None:
+            last_date, last_hash = decode_cursor(after)
+            keyset = {"$or": [{"date": {"$lt": last_date}}, {"date": last_date, "review_hash": {"$lt": last_hash}}]}
+            query = {"$and": [query, keyset]} if query else keyset
+        return iter(self.collection.find(query, {"_id": 0, "doc_hash": 0}).sort(PAGE_SORT).limit(limit + 1))
+
+    def rating_distribution(self) -> List[Dict[str, Any]]:
+        """
+        별점별 리뷰 수를 집계하는 메서드 (별점 오름차순)
+        """
+        pipeline = [
+            {"$group": {"_id": "$rating", "count": {"$sum": 1}}},
+            {"$sort": {"_id": 1}},
+        ]
+        return [{"rating": row["_id"], "count": row["count"]} for row in self.collection.aggregate(pipeline)]
+
+    def monthly_summary(self) -> List[Dict[str, Any]]:
+        """
+        작성 연월별 리뷰 수와 평균 별점을 집계하는 메서드 (연월 오름차순)
+        """
+        pipeline = [
+            {"$group": {"_id": "$year_month", "count": {"$sum": 1}, "avg_rating": {"$avg": "$rating"}}},
+            {"$sort": {"_id": 1}},
+        ]
+        return [
+            {"year_month": row["_id"], "count": row["count"], "avg_rating": round(row["avg_rating"], 3)}
+            for row in self.collection.aggregate(pipeline)
+        ]
+
+    def keyword_counts(self, top: int = 20) -> List[Dict[str, Any]]:
+        """
+        clean_review의 토큰(공백 구분) 빈도 상위 top개를 집계하는 메서드
+        """
+        pipeline = [
+            {"$project": {"_id": 0, "token": {"$split": ["$clean_review", " "]}}},
+            {"$unwind": "$token"},
+            {"$match": {"token": {"$ne": ""}}},
+            {"$group": {"_id": "$token", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}},
+            {"$limit": top},
+        ]
+        return [{"keyword": row["_id"], "count": row["count"]}
+                for row in self.collection.aggregate(pipeline, allowDiskUse=True)]
+
+    def _existing(self, review_hashes: Optional[List[str]]) -> Iterator[Dict[str, Any]]:
+        projection = {"_id": 1, "review_hash": 1, "doc_hash": 1}
+        if review_hashes is None:
+            yield from self.collection.find({}, projection)
+            return
+        for chunk in _batched(review_hashes, self.batch_size):
+            yield from self.collection.find({"review_hash": {"$in": list(chunk)}}, projection)
+
+    def _write(self, operations: List[Any]) -> int:
+        deleted = 0
+        for chunk in _batched(operations, self.batch_size):
+            deleted += self.collection.bulk_write(list(chunk), ordered=False).deleted_count
+        return deleted
+
+    def sync(self, documents: Iterable[Dict[str, Any]], removed: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        전처리 결과 문서들을 컬렉션에 반영하는 메서드
+
+        Parameters:
+        - documents (Iterable[Dict]): review_hash 필드를 가진 전처리 결과 문서
+        - removed (Optional[Iterable[str]]): 삭제할 review_hash 목록.
+          None이면 documents가 전체 결과라고 보고 documents에 없는 기존 문서를 모두 삭제 (전체 모드),
+          주어지면 documents는 새/변경 문서이고 나머지 기존 문서는 그대로 둔다 (증분 모드)
+
+        Returns:
+        - Dict[str, int]: inserted / updated / deleted / unchanged 문서 수
+        """
+        self.collection.create_index("review_hash")
+        incoming: Dict[str, Dict[str, Any]] = {}
+        for document in documents:
+            # 원본이 완전히 같은 중복 행은 같은 review_hash를 가지므로 하나만 저장
+            incoming[document["review_hash"]] = {**document, "doc_hash": document_hash(document)}
+
+        full_sync = removed is None
+        existing: Dict[str, Optional[str]] = {}
+        duplicate_ids = []
+        for document in self._existing(None if full_sync else list(incoming)):
+            if document["review_hash"] in existing:
+                # 예전 insert_many 방식으로 중복 저장된 문서는 하나만 남김
+                duplicate_ids.append(document["_id"])
+            else:
+                existing[document["review_hash"]] = document.get("doc_hash")
+
+        counts = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        operations: List[Any] = []
+        for review_hash, document in incoming.items():
+            if review_hash not in existing:
+                counts["inserted"] += 1
+            elif existing[review_hash] != document["doc_hash"]:
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+                continue
+            operations.append(ReplaceOne({"review_hash": review_hash}, document, upsert=True))
+
+        stale = [h for h in existing if h not in incoming] if full_sync else [h for h in set(removed) if h not in incoming]
+        operations.extend(DeleteMany({"review_hash": {"$in": list(chunk)}}) for chunk in _batched(stale, self.batch_size))
+        # 중복 문서는 교체 대상({"review_hash": ...})과 겹치지 않도록 먼저 삭제
+        counts["deleted"] = self._write([DeleteMany({"_id": {"$in": list(chunk)}})
+                                         for chunk in _batched(duplicate_ids, self.batch_size)])
+        counts["deleted"] += self._write(operations)
+        return counts
+
+class PreprocessStateRepository:
+    """
+    사이트별로 지금까지 전처리한 원본 행 해시를 preprocess_state 컬렉션에 해시마다 문서 하나({site, review_hash})로
+    저장하는 레포지토리 클래스 (증분 전처리의 기준점)
+
+    해시 목록을 사이트당 문서 하나의 배열로 두면 리뷰가 수십만 건을 넘을 때 16MB BSON 한도에 걸리므로,
+    (site, review_hash) 고유 인덱스를 두고 배치마다 $in 쿼리로 이미 처리한 해시를 확인한다.
+    """
+
+    def __init__(self, collection: Collection, site_name: str, batch_size: int = 1000) -> None:
+        """
+        Parameters:
+        - collection (Collection): 처리 이력 컬렉션 (mongo_db["preprocess_state"])
+        - site_name (str): 사이트 이름
+        - batch_size (int): 한 번의 $in 조회 / bulk_write로 보낼 최대 해시 수
+        """
+        self.collection = collection
+        self.site_name = site_name
+        self.batch_size = batch_size
+
+    def ensure_indexes(self) -> None:
+        """
+        (site, review_hash) 고유 인덱스를 만드는 메서드
+
+        예전 형식({"_id": site, "hashes": [...]}) 문서는 고유 인덱스와 맞지 않으므로 지운다.
+        (해당 사이트는 처리 이력이 없는 것으로 보고 다음 실행에서 전체 처리)
+        """
+        self.collection.delete_many({"hashes": {"$exists": True}})
+        self.collection.create_index([("site", ASCENDING), ("review_hash", ASCENDING)],
+                                     name="site_review_hash", unique=True)
+
+    def has_state(self) -> bool:
+        return self.collection.find_one({"site": self.site_name}, {"_id": 1}) is not None
+
+    def seen(self, review_hashes: List[str]) -> Set[str]:
+        """
+        review_hashes 중 이미 처리한 해시를 반환하는 메서드
+        """
+        found: Set[str] = set()
+        for chunk in _batched(review_hashes, self.batch_size):
+            query = {"site": self.site_name, "review_hash": {"$in": list(chunk)}}
+            found.update(document["review_hash"] for document in self.collection.find(query, {"_id": 0, "review_hash": 1}))
+        return found
+
+    def removed(self, current: Set[str]) -> List[str]:
+        """
+        처리 이력에는 있지만 현재 원본(current)에는 없는 해시를 반환하는 메서드
+        """
+        cursor = self.collection.find({"site": self.site_name}, {"_id": 0, "review_hash": 1})
+        return [document["review_hash"] for document in cursor if document["review_hash"] not in current]
+
+    def update(self, added: Iterable[str], removed: Iterable[str] = ()) -> None:
+        """
+        새로 처리한 해시를 추가하고 사라진 해시를 지우는 메서드
+        """
+        operations: List[Any] = [
+            UpdateOne({"site": self.site_name, "review_hash": review_hash},
+                      {"$setOnInsert": {"site": self.site_name, "review_hash": review_hash}}, upsert=True)
+            for review_hash in added
+        ]
+        operations.extend(DeleteMany({"site": self.site_name, "review_hash": {"$in": list(chunk)}})
+                          for chunk in _batched(list(removed), self.batch_size))
+        for chunk in _batched(operations, self.batch_size):
+            self.collection.bulk_write(list(chunk), ordered=False)
+
+    def replace(self, hashes: Iterable[str]) -> None:
+        """
+        사이트의 처리 이력을 hashes로 바꾸는 메서드 (전체 처리 후)
+        """
+        self.collection.delete_many({"site": self.site_name})
+        self.update(hashes)
@@ -1,56 +1,178 @@
-from fastapi import APIRouter
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 from app.responses.base_response import BaseResponse
+from app.review.review_cache import analytics_cache
+from app.review.review_jobs import job_manager
+from app.review.review_repository import ProcessedReviewRepository, encode_cursor
 from database.mongodb_connection import mongo_db
-from review_analysis.preprocessing.kyobo_processor import KyoboProcessor
-from review_analysis.preprocessing.yes24_processor import Yes24Processor
-from review_analysis.preprocessing.aladin_processor import AladinProcessor
-
-import pandas as pd
-import io
+from review_analysis.preprocessing.registry import PROCESSORS
 
 review = APIRouter(prefix="/review")
 
+@review.get("/tokenizer/metrics")
+def tokenizer_metrics():
+    """
+    전처리 작업 프로세스별 토크나이저 서비스의 워밍업 시간과 호출 지연 시간 통계를 반환하는 API
+    """
+    return BaseResponse(status="success", data=job_manager.worker_metrics(), message="Tokenizer metrics.")
+
 @review.post("/preprocess/{site_name}")
-def preprocess_reviews(site_name: str):
+def preprocess_reviews(site_name: str, incremental: bool = False):
     """
-    주어진 사이트의 크롤링 데이터를 MongoDB에서 불러와 전처리하고, 
-    전처리된 데이터를 다시 MongoDB에 저장하는 API
+    주어진 사이트의 크롤링 데이터를 MongoDB에서 불러와 전처리하고,
+    전처리된 데이터를 다시 MongoDB에 저장하는 작업을 백그라운드로 등록하는 API
+
+    전처리는 작업 프로세스에서 실행되며, 응답으로 받은 job_id로 GET /review/jobs/{job_id}를
+    조회해 진행 상황과 결과를 확인한다. 같은 사이트, 같은 모드(전체/증분)의 작업이 이미 대기/실행 중이면
+    새 작업을 만들지 않고 그 작업의 id를 돌려준다. (coalesced=True)
+    한 사이트의 작업은 한 번에 하나씩 실행되므로 다른 모드의 작업은 앞선 작업이 끝난 뒤 실행된다.
 
     Parameters:
     - site_name (str): 전처리할 대상 사이트 이름. 예) "kyobo", "yes24", "aladin"
+    - incremental (bool): True면 지난 실행 이후 새로 추가되거나 바뀐 원본 리뷰만 전처리하여
+      {site_name}_processed 컬렉션에 반영 (사라진 리뷰는 삭제)
 
     Returns:
-    - BaseResponse: 전처리 성공 여부 및 전처리된 데이터 개수를 포함한 응답
+    - BaseResponse: 등록된 작업의 id와 상태를 포함한 응답
     """
-    collection = mongo_db[site_name]
-    raw_data = list(collection.find({}, {"_id": 0}))  
-    print("raw_data:", raw_data[:2])
-    if not raw_data:
+    if site_name not in PROCESSORS:
+        return BaseResponse(status="fail", data=None, message=f"Unsupported site: {site_name}")
+    if mongo_db[site_name].find_one({}, {"_id": 1}) is None:
         return BaseResponse(status="fail", data=None, message="No data found")
 
-    df = pd.DataFrame(raw_data)
-    print("초기 DF shape:", df.shape)
+    job, coalesced = job_manager.submit(site_name, incremental)
+    data = {"job_id": job["job_id"], "status": job["status"], "coalesced": coalesced}
+    message = "Preprocessing already in progress." if coalesced else "Preprocessing job queued."
+    return BaseResponse(status="success", data=data, message=message)
+
+@review.get("/jobs/{job_id}")
+def get_preprocess_job(job_id: str):
+    """
+    전처리 작업의 상태(queued/running/succeeded/failed), 진행 상황, 단계별 소요 시간과 결과를 반환하는 API
+
+    Parameters:
+    - job_id (str): POST /review/preprocess/{site_name}이 돌려준 작업 id
 
-    temp_input_path = f"temp_raw_{site_name}.csv"
-    df.to_csv(temp_input_path, index=False)
+    Returns:
+    - BaseResponse: 작업 상태를 포함한 응답 (없는 id면 fail)
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return BaseResponse(status="fail", data=None, message=f"Job not found: {job_id}")
+    return BaseResponse(status="success", data=job, message=f"Job {job['status']}.")
 
-    if site_name == "kyobo":
-        processor = KyoboProcessor(input_path=temp_input_path, output_path="output")
-    elif site_name == "yes24":
-        processor = Yes24Processor(input_path=temp_input_path, output_path="output")
-    elif site_name == "aladin":
-        processor = AladinProcessor(input_path=temp_input_path, output_path="output")
-    else:
+def _cached_aggregate(site_name: str, kind: str, *params: Any) -> BaseResponse:
+    if site_name not in PROCESSORS:
         return BaseResponse(status="fail", data=None, message=f"Unsupported site: {site_name}")
-    
-    processor.preprocess()
-    processor.feature_engineering()
-    print("전처리 후 DF shape:", processor.df.shape)
-
-    result = processor.df.to_dict(orient="records")
-    print("✅ 전처리 결과 개수:", len(result))
-    result_collection = mongo_db[f"{site_name}_processed"]
-    result_collection.delete_many({})  
-    result_collection.insert_many(result)
-
-    return BaseResponse(status="success", data={"count": len(result)}, message="Preprocessing completed.")
+    repository = ProcessedReviewRepository(mongo_db[f"{site_name}_processed"])
+    compute = {
+        "ratings": repository.rating_distribution,
+        "monthly": repository.monthly_summary,
+        "keywords": repository.keyword_counts,
+    }[kind]
+    data = analytics_cache.get_or_compute((site_name, kind) + params, lambda: compute(*params))
+    return BaseResponse(status="success", data=data, message=None)
+
+@review.get("/{site_name}/analytics/ratings")
+def rating_distribution(site_name: str):
+    """
+    {site_name}_processed 컬렉션의 별점별 리뷰 수를 반환하는 API (별점 분포 그래프용)
+
+    집계 결과는 ANALYTICS_CACHE_TTL초 동안 캐시되며, 해당 사이트의 전처리 작업이 끝나면 바로 갱신된다.
+
+    Returns:
+    - BaseResponse: [{"rating", "count"}, ...]
+    """
+    return _cached_aggregate(site_name, "ratings")
+
+@review.get("/{site_name}/analytics/monthly")
+def monthly_summary(site_name: str):
+    """
+    {site_name}_processed 컬렉션의 연월별 리뷰 수와 평균 별점을 반환하는 API (시계열 그래프용)
+
+    Returns:
+    - BaseResponse: [{"year_month", "count", "avg_rating"}, ...] (연월 오름차순)
+    """
+    return _cached_aggregate(site_name, "monthly")
+
+@review.get("/{site_name}/analytics/keywords")
+def keyword_frequency(site_name: str, top: int = Query(20, ge=1, le=200)):
+    """
+    {site_name}_processed 컬렉션의 토큰화된 리뷰에서 많이 나온 단어 top개를 반환하는 API (키워드 빈도 그래프용)
+
+    Parameters:
+    - top (int): 반환할 단어 수 (최대 200)
+
+    Returns:
+    - BaseResponse: [{"keyword", "count"}, ...] (빈도 내림차순)
+    """
+    return _cached_aggregate(site_name, "keywords", top)
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def _stream_page(documents: Iterator[Dict[str, Any]], limit: int) -> Iterator[str]:
+    # BaseResponse와 같은 모양의 JSON을 문서 단위로 흘려보냄 (페이지 전체를 메모리에 모으지 않음)
+    yield '{"status": "success", "data": {"items": ['
+    last = None
+    has_more = False
+    for i, document in enumerate(documents):
+        if i == limit:
+            has_more = True
+            break
+        yield ("," if i else "") + json.dumps(document, ensure_ascii=False, default=_json_default)
+        last = document
+    next_cursor = encode_cursor(last) if has_more else None
+    yield '], "next_cursor": ' + json.dumps(next_cursor) + '}, "message": null}'
+
+@review.get("/{site_name}")
+def list_processed_reviews(site_name: str,
+                           rating: Optional[int] = Query(None, ge=1, le=5),
+                           date_from: Optional[date] = None,
+                           date_to: Optional[date] = None,
+                           year_month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+                           book_id: Optional[str] = None,
+                           cursor: Optional[str] = None,
+                           limit: int = Query(100, ge=1, le=1000)):
+    """
+    {site_name}_processed 컬렉션의 전처리 리뷰를 최신순으로 조회하는 API
+
+    결과가 더 있으면 data.next_cursor가 채워지며, 이 값을 cursor로 넘기면 다음 페이지를 조회한다.
+    (skip 없이 인덱스를 따라 이어 읽으므로 뒤쪽 페이지도 느려지지 않음)
+
+    Parameters:
+    - site_name (str): 사이트 이름. 예) "kyobo", "yes24", "aladin"
+    - rating (Optional[int]): 별점
+    - date_from (Optional[date]): 작성일 시작 (포함)
+    - date_to (Optional[date]): 작성일 끝 (포함)
+    - year_month (Optional[str]): 작성 연월 "YYYY-MM"
+    - book_id (Optional[str]): 도서 ID (없으면 사이트의 모든 도서)
+    - cursor (Optional[str]): 직전 응답의 next_cursor
+    - limit (int): 페이지 크기 (최대 1000)
+
+    Returns:
+    - StreamingResponse: {"status", "data": {"items", "next_cursor"}, "message"} 형태의 JSON
+    """
+    if site_name not in PROCESSORS:
+        return BaseResponse(status="fail", data=None, message=f"Unsupported site: {site_name}")
+
+    repository = ProcessedReviewRepository(mongo_db[f"{site_name}_processed"])
+    try:
+        documents = repository.find_page(
+            rating=rating,
+            date_from=datetime.combine(date_from, time.min) if date_from else None,
+            date_to=datetime.combine(date_to + timedelta(days=1), time.min) if date_to else None,
+            year_month=year_month,
+            book_id=book_id,
+            after=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        return BaseResponse(status="fail", data=None, message=str(e))
+    return StreamingResponse(_stream_page(documents, limit), media_type="application/json")
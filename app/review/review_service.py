@@ -0,0 +1,116 @@
+import os
+from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional, Set, Tuple
+
+from app.review.review_repository import PreprocessStateRepository, ProcessedReviewRepository
+from database.mongodb_connection import mongo_db
+from review_analysis.preprocessing.record_batches import iter_record_batches
+from review_analysis.preprocessing.registry import PROCESSORS, get_processor_class
+from review_analysis.preprocessing.token_cache import TokenCache
+from review_analysis.preprocessing.tokenizer import get_tokenizer_service, tokenizer_version
+from app.config import PREPROCESS_BATCH_SIZE, PROCESSED_WRITE_BATCH_SIZE, TOKEN_CACHE_PATH, TOKENIZER_BACKEND
+
+def _report(progress: Optional[MutableMapping[str, Any]], **values: Any) -> None:
+    if progress is not None:
+        progress.update(values)
+
+def _counted(batches: Iterable[List[Dict[str, Any]]],
+             progress: Optional[MutableMapping[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    # 커서에서 읽은 원본 문서 수를 배치마다 진행 상황에 기록
+    raw_rows = 0
+    for batch in batches:
+        raw_rows += len(batch)
+        _report(progress, raw_rows=raw_rows)
+        yield batch
+
+def preprocess_site(site_name: str, incremental: bool = False,
+                    progress: Optional[MutableMapping[str, Any]] = None) -> Tuple[Dict[str, Any], str]:
+    """
+    주어진 사이트의 크롤링 데이터를 MongoDB에서 불러와 전처리하고,
+    전처리된 데이터를 {site_name}_processed 컬렉션에 저장하는 함수
+
+    백그라운드 작업 프로세스에서 실행되며, progress(공유 dict)가 주어지면
+    진행 단계(stage)와 읽은 원본 문서 수(raw_rows) 등을 기록한다.
+
+    Parameters:
+    - site_name (str): 전처리할 대상 사이트 이름. 예) "kyobo", "yes24", "aladin"
+    - incremental (bool): True면 지난 실행 이후 새로 추가되거나 바뀐 원본 리뷰만 전처리하여
+      반영 (사라진 리뷰는 삭제, 처리 이력이 없으면 전체 처리)
+    - progress (Optional[MutableMapping]): 진행 상황을 기록할 dict
+
+    Raises:
+    - KeyError: 등록되지 않은 사이트인 경우
+    - LookupError: 원본 컬렉션이 비어 있는 경우
+
+    Returns:
+    - Tuple[Dict[str, Any], str]: (결과 데이터, 메시지)
+    """
+    if site_name not in PROCESSORS:
+        raise KeyError(f"Unsupported site: {site_name}")
+
+    collection = mongo_db[site_name]
+    if collection.find_one({}, {"_id": 1}) is None:
+        raise LookupError("No data found")
+
+    # 컬렉션 전체를 리스트/임시 CSV로 만들지 않고 커서에서 배치 단위로 바로 전처리기에 넘김
+    _report(progress, stage="preprocess")
+    cursor = collection.find({}, {"_id": 0}, batch_size=PREPROCESS_BATCH_SIZE)
+    raw_batches = _counted(iter_record_batches(cursor, PREPROCESS_BATCH_SIZE), progress)
+
+    # SQLite 연결은 스레드 간 공유할 수 없으므로 작업마다 연다
+    token_cache = TokenCache(TOKEN_CACHE_PATH, tokenizer_version(TOKENIZER_BACKEND))
+    # 형태소 분석기는 작업 프로세스 기동 시 워밍업해 둔 전역 토크나이저 서비스에서 빌려 쓴다
+    processor_class = get_processor_class(site_name)
+    processor = processor_class(input_path=raw_batches, output_path="output", token_cache=token_cache,
+                                tokenizer_backend=TOKENIZER_BACKEND)
+
+    # 사이트별로 지금까지 처리한 원본 행 해시 (증분 모드의 기준점, 해시마다 문서 하나)
+    state = PreprocessStateRepository(mongo_db["preprocess_state"], site_name, batch_size=PROCESSED_WRITE_BATCH_SIZE)
+    state.ensure_indexes()
+    if incremental and not state.has_state():
+        # 처리 이력이 없으면 기존 컬렉션과 맞춰볼 기준이 없으므로 전체 처리로 전환
+        incremental = False
+    known: Set[str] = set()
+
+    def seen(review_hashes: List[str]) -> Set[str]:
+        # 배치마다 이력 컬렉션을 조회해 이미 처리한 해시만 가져옴
+        found = state.seen(review_hashes)
+        known.update(found)
+        return found
+
+    try:
+        # 이력이 비어 있으면 모든 행이 새 행이므로 전체 전처리와 같은 결과가 된다
+        current, _ = processor.preprocess_incremental(seen if incremental else set())
+        _report(progress, stage="feature_engineering", processed_rows=len(processor.df))
+        if processor.df.empty:
+            # 새로/바뀐 행이 없으면 TF-IDF를 학습할 문서가 없음 (API는 행렬을 저장하지 않으므로 year_month만 계산)
+            processor.df['year_month'] = processor.df['date'].dt.to_period('M').astype(str)
+        else:
+            processor.feature_engineering()
+    finally:
+        cursor.close()
+        token_cache.close()
+    print("전처리 후 DF shape:", processor.df.shape)
+
+    _report(progress, stage="save")
+    result = processor.df.to_dict(orient="records")
+    print("✅ 전처리 결과 개수:", len(result))
+    result_collection = mongo_db[f"{site_name}_processed"]
+    # 컬렉션을 비우지 않고 review_hash 기준으로 바뀐 문서만 반영 (증분 모드에서는 사라진 원본 행만 삭제)
+    repository = ProcessedReviewRepository(result_collection, batch_size=PROCESSED_WRITE_BATCH_SIZE)
+    removed = state.removed(current) if incremental else None
+    changes = repository.sync(result, removed=removed)
+    print("✅ 반영 결과:", changes)
+    if incremental:
+        state.update(current - known, removed)
+    else:
+        state.replace(current)
+
+    stats = {
+        "timings": {stage: round(seconds, 4) for stage, seconds in processor.timings.items()},
+        "tokenizer": get_tokenizer_service(TOKENIZER_BACKEND).metrics(),
+        "worker_pid": os.getpid(),
+    }
+    data = {"count": result_collection.count_documents({}), **changes, **stats}
+    if incremental:
+        return data, "Incremental preprocessing completed."
+    return data, "Preprocessing completed."
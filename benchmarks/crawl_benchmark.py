@@ -0,0 +1,133 @@
+"""
+저장된 페이지(PageCache)로 세 크롤러의 페이지 순회와 파싱을 사이트 접속 없이 재현하는 벤치마크
+
+사이트마다 별도 프로세스에서 replay 모드 크롤러로 scrape_reviews() + save_to_database()를 실행하고
+수집 페이지/리뷰 수, 소요 시간, 단계별(fetch / parse 등) 지연 시간 백분위를 JSON으로 보고한다.
+- --cache_dir: `python -m review_analysis.crawling.main ... --cache_mode record`로 실제 사이트에서 저장한 캐시
+- --synthetic N: 사이트마다 합성 리뷰 N개로 만든 페이지를 임시 캐시에 넣고 재현
+- --via server: YES24는 캐시 대신 로컬 대역 서버(benchmarks.replay_server)에 HTTP로 요청 (동시 요청 경로 포함)
+
+예) python -m benchmarks.crawl_benchmark --synthetic 5000
+    python -m benchmarks.crawl_benchmark --cache_dir database/.page_cache --sites yes24 --via server --output crawl_bench.json
+"""
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from benchmarks.preprocessing_benchmark import _git_commit, _peak_rss_mb
+
+SITES = ["yes24", "kyobo", "aladin"]
+
+def _build_crawler(site_name: str, output_dir: str, cache, concurrency: int, site_url: Optional[str] = None):
+    from review_analysis.crawling.main import CRAWLER_CLASSES
+
+    if site_name == "yes24":
+        options = {"site_url": site_url} if site_url else {}
+        return CRAWLER_CLASSES[site_name](output_dir, fetch_mode="http", concurrency=concurrency, cache=cache, **options)
+    return CRAWLER_CLASSES[site_name](output_dir, cache=cache)
+
+def run_single(site_name: str, cache_dir: str, output_dir: str, via: str, concurrency: int,
+               synthetic: int, seed: int) -> Dict[str, object]:
+    """
+    (벤치마크용 자식 프로세스에서 실행) 크롤러 하나를 replay 모드로 실행하고 결과를 반환하는 함수
+    """
+    from review_analysis.crawling.page_cache import PageCache
+
+    # 크롤러 로그 파일은 작업 디렉토리에 쓰이므로 임시 출력 디렉토리로 이동
+    os.chdir(output_dir)
+    cache = PageCache(cache_dir, "replay")
+    if synthetic:
+        from benchmarks.synthetic_pages import record_synthetic_pages
+
+        recorder = _build_crawler(site_name, output_dir, PageCache(cache_dir, "record"), concurrency)
+        record_synthetic_pages(recorder, synthetic, seed=seed)
+
+    server = None
+    if site_name == "yes24" and via == "server":
+        from benchmarks.replay_server import start_replay_server
+
+        server = start_replay_server(cache, "https://www.yes24.com")
+        site_url = f"http://127.0.0.1:{server.server_address[1]}"
+        crawler = _build_crawler(site_name, output_dir, None, concurrency, site_url=site_url)
+    else:
+        crawler = _build_crawler(site_name, output_dir, cache, concurrency)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    try:
+        start = time.perf_counter()
+        crawler.scrape_reviews()
+        crawler.save_to_database()
+        total = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    return {
+        "pages": crawler.pages,
+        "rows": crawler.collected,
+        "total_seconds": round(total, 4),
+        "pages_per_sec": round(crawler.pages / total, 1) if total else None,
+        "phases": crawler.metrics.summary()["phases"],
+        "cache": cache.stats(),
+        **_peak_rss_mb(),
+    }
+
+def benchmark(sites: List[str], cache_dir: Optional[str], synthetic: int, via: str, concurrency: int,
+              seed: int) -> Dict[str, object]:
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as workdir:
+        cache_dir = os.path.abspath(cache_dir) if cache_dir else os.path.join(workdir, "page_cache")
+        for site_name in sites:
+            output_dir = os.path.join(workdir, site_name)
+            os.makedirs(output_dir, exist_ok=True)
+            # 최대 RSS와 로그 설정이 이전 실행의 영향을 받지 않도록 사이트마다 새 프로세스에서 실행
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_single, site_name, cache_dir, output_dir, via, concurrency,
+                                         synthetic, seed).result()
+            result = {"site": site_name, "via": via if site_name == "yes24" else "cache", **result}
+            print(f"✅ {site_name}: {result['pages']}페이지, {result['rows']}건, {result['total_seconds']}s", file=sys.stderr)
+            results.append(result)
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "source": f"synthetic:{synthetic}" if synthetic else "recorded",
+            "concurrency": concurrency,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument('--sites', type=str, default=",".join(SITES), help="Comma-separated site names.")
+    parser.add_argument('--cache_dir', type=str, default=None, help="Recorded page cache directory.")
+    parser.add_argument('--synthetic', type=int, default=0, help="Generate this many synthetic reviews per site instead.")
+    parser.add_argument('--via', type=str, default="cache", choices=["cache", "server"],
+                        help="Replay YES24 straight from the cache or through the local stand-in server.")
+    parser.add_argument('--concurrency', type=int, default=8, help="Concurrent YES24 requests.")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the synthetic pages.")
+    parser.add_argument('--output', type=str, default=None, help="Write the JSON report to this path.")
+    return parser
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    if not args.cache_dir and not args.synthetic:
+        raise SystemExit("--cache_dir or --synthetic is required")
+    report = benchmark(args.sites.split(","), args.cache_dir, args.synthetic, args.via, args.concurrency, args.seed)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
@@ -0,0 +1,76 @@
+"""
+모듈 임포트(콜드 스타트) 시간을 `python -X importtime`으로 측정하는 벤치마크
+
+예) python -m benchmarks.import_time_benchmark
+    python -m benchmarks.import_time_benchmark --module app.review.review_router --top 15
+"""
+import json
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+from typing import Dict, List
+
+DEFAULT_MODULES = [
+    "app.review.review_router",
+    "review_analysis.preprocessing.registry",
+    "review_analysis.preprocessing.kyobo_processor",
+]
+
+HEAVY_PACKAGES = ["pandas", "sklearn", "scipy", "konlpy", "jpype", "pyarrow"]
+
+def _importtime(code: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    # MongoClient는 생성 시 접속하지 않으므로 임포트 측정에는 더미 주소로 충분
+    env.setdefault("MONGO_URL", "mongodb://localhost:27017/benchmark")
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, env=env)
+
+def _parse(stderr: str) -> List[Dict[str, object]]:
+    rows: List[Dict[str, object]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        # 들여쓰기 깊이 = 임포트 중첩 단계 (0이 직접 임포트한 모듈)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append({"module": name.strip(), "depth": depth, "cumulative_ms": int(cumulative_us) / 1000})
+    return rows
+
+def measure(module: str, top: int) -> Dict[str, object]:
+    """
+    새 인터프리터에서 module을 임포트하며 -X importtime 출력을 파싱하는 함수
+
+    Returns:
+    - Dict[str, object]: 전체 누적 시간(ms), 누적 시간 상위 모듈, 로드된 무거운 패키지 목록
+    """
+    # 인터프리터 기동 시 임포트되는 모듈(site 등)은 제외
+    startup = {row["module"] for row in _parse(_importtime("pass").stderr)}
+    proc = _importtime(f"import {module}")
+    rows = [row for row in _parse(proc.stderr) if row["module"] not in startup]
+    loaded = {str(row["module"]).split(".")[0] for row in rows}
+    target = next((row for row in rows if row["module"] == module), None)
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "total_ms": target["cumulative_ms"] if target else None,
+        "heavy_packages_loaded": [pkg for pkg in HEAVY_PACKAGES if pkg in loaded],
+        "top_modules": [
+            {"module": row["module"], "cumulative_ms": row["cumulative_ms"]}
+            for row in sorted(rows, key=lambda row: row["cumulative_ms"], reverse=True)
+            if row is not target and row["depth"] <= 1
+        ][:top],
+        "error": proc.stderr.strip().splitlines()[-1] if proc.returncode else None,
+    }
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument('--module', action='append', default=None,
+                        help="Module to import (repeatable). Default: review router, registry, a processor.")
+    parser.add_argument('--top', type=int, default=10, help="Number of top-level packages to list.")
+    return parser
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    report = [measure(module, args.top) for module in (args.module or DEFAULT_MODULES)]
+    print(json.dumps(report, indent=2, ensure_ascii=False))
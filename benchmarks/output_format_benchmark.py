@@ -0,0 +1,67 @@
+"""
+전처리 결과 CSV와 parquet의 파일 크기 / 로드 시간을 비교하는 벤치마크
+
+예) python -m benchmarks.output_format_benchmark --input_dir database --scale 50
+"""
+import glob
+import json
+import os
+import statistics
+import tempfile
+import time
+from argparse import ArgumentParser
+from typing import Callable, Dict
+
+import pandas as pd
+
+from review_analysis.preprocessing.output_format import read_output, write_output
+
+def _median_seconds(func: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def benchmark_file(csv_path: str, workdir: str, scale: int, repeat: int) -> Dict[str, float]:
+    df = read_output(csv_path, fmt="csv")
+    if scale > 1:
+        df = pd.concat([df] * scale, ignore_index=True)
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    csv_out = os.path.join(workdir, f"{name}.csv")
+    parquet_out = os.path.join(workdir, f"{name}.parquet")
+    write_output(df, csv_out, "csv")
+    write_output(df, parquet_out, "parquet")
+
+    return {
+        "rows": len(df),
+        "csv_bytes": os.path.getsize(csv_out),
+        "parquet_bytes": os.path.getsize(parquet_out),
+        # 전체 컬럼 + date 파싱 (feature_engineering / 분석용 로드)
+        "csv_full_load_s": _median_seconds(lambda: read_output(csv_out), repeat),
+        "parquet_full_load_s": _median_seconds(lambda: read_output(parquet_out), repeat),
+        # review 컬럼만 (build_faiss_index 용 로드)
+        "csv_review_only_s": _median_seconds(lambda: read_output(csv_out, columns=["review"]), repeat),
+        "parquet_review_only_s": _median_seconds(lambda: read_output(parquet_out, columns=["review"]), repeat),
+    }
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument('--input_dir', type=str, default="database", help="Directory with preprocessed_reviews_*.csv")
+    parser.add_argument('--scale', type=int, default=1, help="Repeat each file's rows this many times.")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed repetitions per measurement (median reported).")
+    parser.add_argument('--output', type=str, default=None, help="Write the JSON report to this path.")
+    return parser
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    report = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for csv_path in sorted(glob.glob(os.path.join(args.input_dir, "preprocessed_reviews_*.csv"))):
+            report[os.path.basename(csv_path)] = benchmark_file(csv_path, workdir, args.scale, args.repeat)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
@@ -0,0 +1,119 @@
+"""
+/review/preprocess의 입력 전달 방식별 지연 시간/메모리를 비교하는 벤치마크
+
+- temp_csv: 커서 전체를 리스트로 만든 뒤 DataFrame → 임시 CSV → 전처리기가 다시 read_csv (이전 방식)
+- batches: 커서를 iter_record_batches로 묶어 전처리기에 바로 전달 (현재 방식)
+
+MongoDB 대신 미리 만들어 둔 합성 리뷰 CSV를 csv.DictReader로 한 건씩 읽는 제너레이터를 커서로 사용하며,
+방식마다 새 프로세스에서 실행해 최대 RSS를 따로 잰다. (--trace_memory를 주면 tracemalloc 최대 할당량도
+측정하지만 실행 시간이 크게 늘어나므로 시간 비교와는 따로 돌리는 것이 좋다.)
+커서에서 문서를 읽는 시간은 두 방식 모두 전체 시간에 포함되며, batches 방식에서는 load 단계에 잡힌다.
+
+예) python -m benchmarks.preprocess_handoff_benchmark --rows 100000 --tokenizer kiwi
+"""
+import csv
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator
+
+from benchmarks.synthetic_reviews import SCHEMAS, write_synthetic_csv
+
+MODES = ["temp_csv", "batches"]
+
+def fake_cursor(raw_path: str) -> Iterator[dict]:
+    # 커서처럼 문서를 한 건씩 내보냄 (MongoDB 문서처럼 숫자 필드는 int로)
+    with open(raw_path, encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            for field in ("rating", "sympathy"):
+                if field in row:
+                    row[field] = int(row[field])
+            yield row
+
+def run_mode(mode: str, site_name: str, raw_path: str, batch_size: int, tokenizer: str,
+             trace_memory: bool) -> Dict[str, object]:
+    """
+    (자식 프로세스에서 실행) 한 가지 전달 방식으로 preprocess + feature_engineering을 수행
+    """
+    import pandas as pd
+    from review_analysis.preprocessing.record_batches import iter_record_batches
+    from review_analysis.preprocessing.registry import get_processor_class
+    from review_analysis.preprocessing.tokenizer import get_tokenizer_service
+
+    # 분석기 기동 시간은 두 방식에 공통이므로 측정 전에 워밍업
+    get_tokenizer_service(tokenizer).warm_up()
+    processor_class = get_processor_class(site_name)
+    with tempfile.TemporaryDirectory() as workdir:
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        cursor = fake_cursor(raw_path)
+        if mode == "temp_csv":
+            raw_data = list(cursor)
+            temp_input_path = os.path.join(workdir, f"temp_raw_{site_name}.csv")
+            pd.DataFrame(raw_data).to_csv(temp_input_path, index=False)
+            source = temp_input_path
+        else:
+            source = iter_record_batches(cursor, batch_size)
+        processor = processor_class(source, workdir, tokenizer_backend=tokenizer)
+        processor.preprocess()
+        processor.feature_engineering()
+        elapsed = time.perf_counter() - start
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    result: Dict[str, object] = {
+        "seconds": round(elapsed, 4),
+        "stage_seconds": {stage: round(seconds, 4) for stage, seconds in processor.timings.items()},
+        "output_rows": len(processor.df),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor, 1),
+    }
+    if trace_memory:
+        result["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 1)
+        tracemalloc.stop()
+    return result
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument('--site', type=str, default="yes24", choices=SCHEMAS.keys(), help="Raw schema to synthesize.")
+    parser.add_argument('--rows', type=int, default=50000, help="Number of synthetic raw reviews.")
+    parser.add_argument('--batch_size', type=int, default=5000, help="Records per batch in batches mode.")
+    parser.add_argument('-t', '--tokenizer', type=str, default="okt", help="Tokenizer backend (okt or kiwi).")
+    parser.add_argument('--trace_memory', action='store_true', help="Also report the tracemalloc peak (slow).")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the synthetic corpus.")
+    parser.add_argument('--output', type=str, default=None, help="Write the JSON report to this path.")
+    return parser
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    with tempfile.TemporaryDirectory() as datadir:
+        raw_path = os.path.join(datadir, f"reviews_{args.site}.csv")
+        write_synthetic_csv(args.site, args.rows, raw_path, seed=args.seed)
+        for mode in MODES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results[mode] = executor.submit(run_mode, mode, args.site, raw_path, args.batch_size,
+                                                args.tokenizer, args.trace_memory).result()
+    saved = {
+        key: round(results["temp_csv"][key] - results["batches"][key], 4)
+        for key in ("seconds", "peak_rss_mb", "peak_traced_mb") if key in results["batches"]
+    }
+    report = {
+        "site": args.site,
+        "rows": args.rows,
+        "batch_size": args.batch_size,
+        "tokenizer": args.tokenizer,
+        "results": results,
+        "saved": saved,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
@@ -0,0 +1,116 @@
+"""
+합성 말뭉치로 전처리 파이프라인(preprocess + feature_engineering)의 확장성을 측정하는 벤치마크
+
+사이트 x 행 수 조합마다 별도 프로세스에서 전처리기를 실행하고
+단계별 소요 시간(load / clean / tokenize / filter / tfidf), 최대 RSS, 초당 처리 행 수를 JSON으로 보고한다.
+커밋 간 비교를 위해 보고서에 git 커밋 해시를 함께 기록한다.
+
+예) python -m benchmarks.preprocessing_benchmark --sizes 10000 --sites kyobo --output bench.json
+    python -m benchmarks.preprocessing_benchmark --sizes 10000,100000,1000000 --workers 4 --tokenizer kiwi
+"""
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from benchmarks.synthetic_reviews import SCHEMAS, write_synthetic_csv
+from review_analysis.preprocessing.tokenizer import DEFAULT_BACKEND, TOKENIZER_BACKENDS
+
+STAGES = ["load", "clean", "tokenize", "filter", "tfidf"]
+
+def _peak_rss_mb() -> Dict[str, float]:
+    # ru_maxrss 단위는 리눅스 KB, macOS 바이트 (병렬 토큰화 워커는 children에 집계됨)
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor, 1),
+        "peak_rss_children_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / divisor, 1),
+    }
+
+def run_single(site_name: str, input_path: str, output_dir: str, n_jobs: int,
+               tokenizer_backend: str = DEFAULT_BACKEND) -> Dict[str, object]:
+    """
+    (벤치마크용 자식 프로세스에서 실행) 전처리기 하나를 돌리고 단계별 시간을 반환하는 함수
+    """
+    from review_analysis.preprocessing.registry import get_processor_class
+
+    processor = get_processor_class(site_name)(input_path, output_dir, n_jobs=n_jobs,
+                                               tokenizer_backend=tokenizer_backend)
+    start = time.perf_counter()
+    processor.preprocess()
+    processor.feature_engineering()
+    total = time.perf_counter() - start
+    return {
+        "stage_seconds": {stage: round(processor.timings.get(stage, 0.0), 4) for stage in STAGES},
+        "total_seconds": round(total, 4),
+        "output_rows": len(processor.df),
+        **_peak_rss_mb(),
+    }
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+def benchmark(sites: List[str], sizes: List[int], n_jobs: int, seed: int,
+              tokenizer_backend: str = DEFAULT_BACKEND) -> Dict[str, object]:
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as workdir:
+        for site_name in sites:
+            for n_rows in sizes:
+                input_path = os.path.join(workdir, f"reviews_{site_name}_{n_rows}.csv")
+                write_synthetic_csv(site_name, n_rows, input_path, seed=seed)
+                # 최대 RSS가 이전 실행의 영향을 받지 않도록 조합마다 새 프로세스에서 실행
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(run_single, site_name, input_path, workdir, n_jobs,
+                                             tokenizer_backend).result()
+                result.update({
+                    "site": site_name,
+                    "rows": n_rows,
+                    "rows_per_sec": round(n_rows / result["total_seconds"], 1) if result["total_seconds"] else None,
+                })
+                print(f"✅ {site_name} {n_rows} rows: {result['total_seconds']}s", file=sys.stderr)
+                results.append(result)
+                os.remove(input_path)
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "workers": n_jobs,
+            "tokenizer": tokenizer_backend,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument('--sites', type=str, default=",".join(SCHEMAS), help="Comma-separated site names.")
+    parser.add_argument('--sizes', type=str, default="10000,100000,1000000", help="Comma-separated row counts.")
+    parser.add_argument('-w', '--workers', type=int, default=1, help="Tokenizer worker processes per run.")
+    parser.add_argument('-t', '--tokenizer', type=str, default=DEFAULT_BACKEND, choices=TOKENIZER_BACKENDS.keys(),
+                        help="Morphological analyzer backend. kiwi needs no JVM. Default to $TOKENIZER_BACKEND or okt.")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the synthetic corpus.")
+    parser.add_argument('--output', type=str, default=None, help="Write the JSON report to this path.")
+    return parser
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    report = benchmark(args.sites.split(","), [int(n) for n in args.sizes.split(",")], args.workers, args.seed,
+                       args.tokenizer)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
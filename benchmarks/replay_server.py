@@ -0,0 +1,65 @@
+"""
+PageCache에 저장된 페이지를 원래 사이트 대신 돌려주는 로컬 대역 서버
+
+요청 경로를 origin 뒤에 붙인 URL로 캐시를 찾아 응답하므로(없으면 404), YES24 크롤러를
+site_url=서버 주소로 만들면 HTTP 클라이언트(커넥션 풀, 동시 요청, 재시도)까지 포함해 오프라인으로 재현할 수 있다.
+
+예) python -m benchmarks.replay_server --cache_dir database/.page_cache --origin https://www.yes24.com --port 8765
+"""
+import threading
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from review_analysis.crawling.page_cache import PageCache
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        entry = self.server.cache.load(self.server.origin + self.path)
+        if entry is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = entry["html"].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def create_replay_server(cache: PageCache, origin: str, port: int = 0) -> ThreadingHTTPServer:
+    """
+    대역 서버를 만드는 함수 (port=0이면 빈 포트 사용, 주소는 server.server_address)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), ReplayHandler)
+    server.cache = cache
+    server.origin = origin.rstrip("/")
+    return server
+
+def start_replay_server(cache: PageCache, origin: str, port: int = 0) -> ThreadingHTTPServer:
+    """
+    대역 서버를 백그라운드 스레드에서 실행하고 반환하는 함수 (끝나면 shutdown() / server_close())
+    """
+    server = create_replay_server(cache, origin, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument('--cache_dir', type=str, required=True, help="Page cache directory recorded with --cache_mode record.")
+    parser.add_argument('--origin', type=str, default="https://www.yes24.com", help="Site origin the pages were recorded from.")
+    parser.add_argument('--port', type=int, default=8765, help="Port to listen on.")
+    return parser
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    server = create_replay_server(PageCache(args.cache_dir, "replay"), args.origin, args.port)
+    print(f"✅ replay server: http://127.0.0.1:{server.server_address[1]} → {args.origin}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,82 @@
+"""
+크롤러 재현(replay) 벤치마크용 합성 리뷰 페이지 생성기
+
+benchmarks.synthetic_reviews의 합성 리뷰로 세 사이트의 리뷰 목록 HTML을 만들어,
+각 크롤러가 record 모드에서 저장하는 것과 같은 키/형태로 PageCache에 넣는다.
+- yes24: 한줄평 AJAX 페이지 URL마다 div.cmtInfoGrp 목록 (마지막에 빈 페이지)
+- kyobo: 상품 URL + "page=N" 상태마다 .comment_item 목록 (다음 페이지가 없으면 마지막 페이지)
+- aladin: 상품 URL + "blocks=앞서 붙은 블록 수" 상태마다 새로 붙은 div.hundred_list 블록 (마지막에 0개)
+"""
+from html import escape
+from typing import List
+
+import pandas as pd
+
+from benchmarks.synthetic_reviews import generate_reviews
+
+def _reviews(site_name: str, n_reviews: int, seed: int) -> pd.DataFrame:
+    # 페이지에는 본문이 있는 리뷰만 보이고 별점은 1점 이상이다
+    df = generate_reviews(site_name, n_reviews, seed=seed).dropna(subset=["review"])
+    df["rating"] = df["rating"].clip(lower=1)
+    return df.reset_index(drop=True)
+
+def yes24_box(rating: int, date: str, review: str, sympathy: int) -> str:
+    return (
+        f'<div class="cmtInfoGrp"><div class="cmt_rating"><span class="rating rating_{rating}"></span></div>'
+        f'<div class="cmt_etc"><em class="txt_date">{date}</em></div>'
+        f'<div class="cmt_cont"><span class="txt">{escape(review)}</span></div>'
+        f'<a class="btnC"><em class="txt">{sympathy}</em></a></div>'
+    )
+
+def kyobo_item(review: str, rating: int, date: str) -> str:
+    lines = "<br>".join(escape(line) for line in review.split("\n"))
+    return (
+        f'<div class="comment_item"><div class="info_item">구매자</div><div class="info_item">{date}</div>'
+        f'<div class="filled-stars" style="width: {rating * 25}%;"></div>'
+        f'<div class="comment_text">{lines}</div></div>'
+    )
+
+def aladin_block(review: str, rating: int, date: str) -> str:
+    stars = "".join(f'<img src="//image.aladin.co.kr/img/icon_star_{"on" if i < rating else "off"}.png">'
+                    for i in range(5))
+    return (
+        f'<div class="hundred_list"><div class="HL_star">{stars}</div>'
+        f'<span id="spnPaper1">{escape(review)}</span>'
+        f'<span class="Ere_sub_gray8 Ere_fs13 Ere_PR10">{date}</span></div>'
+    )
+
+def _chunks(items: List[str], size: int) -> List[List[str]]:
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+def record_synthetic_pages(crawler, n_reviews: int, per_page: int = 10, seed: int = 0) -> int:
+    """
+    crawler.cache에 합성 리뷰 페이지를 저장하고 저장한 리뷰 수를 반환하는 함수
+
+    Parameters:
+    - crawler: cache가 설정된 Yes24Crawler / KyoboCrawler / AladinCrawler
+    - n_reviews (int): 생성할 리뷰 수 (본문 결측 행을 빼므로 실제 저장 수는 약간 적음)
+    - per_page (int): 페이지(더보기 한 번)당 리뷰 수
+    - seed (int): 난수 시드
+    """
+    site_name = crawler.metrics.site_name
+    cache = crawler.cache
+    df = _reviews(site_name, n_reviews, seed)
+    if site_name == "yes24":
+        boxes = [yes24_box(row.rating, row.date, row.review, row.sympathy) for row in df.itertuples()]
+        pages = _chunks(boxes, per_page)
+        for page_num, page in enumerate(pages, start=1):
+            cache.save(crawler.review_list_url(page_num), "", f"<div class='reviewList'>{''.join(page)}</div>")
+        cache.save(crawler.review_list_url(len(pages) + 1), "", "<div class='reviewList'></div>")
+    elif site_name == "kyobo":
+        items = [kyobo_item(row.review, row.rating, row.date) for row in df.itertuples()]
+        for page_num, page in enumerate(_chunks(items, per_page), start=1):
+            cache.save(crawler.base_url, f"page={page_num}", "".join(page))
+    elif site_name == "aladin":
+        blocks = [aladin_block(row.review, row.rating, row.date) for row in df.itertuples()]
+        for start in range(0, len(blocks), per_page):
+            batch = blocks[start:start + per_page]
+            cache.save(crawler.url, f"blocks={start}", "".join(batch), count=len(batch))
+        cache.save(crawler.url, f"blocks={len(blocks)}", "", count=0)
+    else:
+        raise ValueError(f"Unsupported site: {site_name}")
+    return len(df)
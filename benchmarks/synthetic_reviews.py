@@ -0,0 +1,79 @@
+"""
+벤치마크용 합성 한국어 리뷰 생성기
+
+세 사이트의 원본 CSV 스키마를 그대로 따른다.
+- kyobo: review,rating,date (별점 1~4, 날짜 "%Y.%m.%d", BOM 포함, 줄바꿈이 들어간 리뷰)
+- yes24: rating,date,review,sympathy (별점 1~5, 날짜 "%Y-%m-%d", BOM 포함)
+- aladin: review,rating,date (별점 1~5, 날짜 "%Y-%m-%d")
+
+전처리 필터가 실제로 일하도록 결측치, 범위를 벗어난 별점, 너무 짧은 리뷰를 일부 섞는다.
+"""
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+SUBJECTS = ["이 책", "소설", "작가의 문장", "이야기", "주인공", "번역", "마지막 장", "표지", "구성", "전개", "결말", "등장인물들"]
+OBJECTS = ["역사", "오월의 광주", "사람의 존엄", "슬픔", "기억", "상처", "국가 폭력", "희생", "용기", "고통", "진실", "양심"]
+ADVERBS = ["정말", "너무", "조용히", "오래", "다시", "끝까지", "천천히", "단숨에", "자꾸", "깊이"]
+PREDICATES = [
+    "마음이 아팠습니다", "눈물이 났어요", "잊지 말아야 합니다", "생각하게 됩니다", "읽기 힘들었지만 좋았어요",
+    "추천합니다", "가슴이 먹먹합니다", "아름답고 잔인하다", "계속 떠오릅니다", "읽어야 할 책입니다",
+]
+EMOTICONS = ["", "", "", "ㅠㅠ", "!!", "...", "♡", "ㅎㅎ", "👍"]
+
+SCHEMAS: Dict[str, Dict[str, object]] = {
+    "kyobo": {"columns": ["review", "rating", "date"], "max_rating": 4, "date_format": "%Y.%m.%d", "encoding": "utf-8-sig"},
+    "yes24": {"columns": ["rating", "date", "review", "sympathy"], "max_rating": 5, "date_format": "%Y-%m-%d", "encoding": "utf-8-sig"},
+    "aladin": {"columns": ["review", "rating", "date"], "max_rating": 5, "date_format": "%Y-%m-%d", "encoding": "utf-8"},
+}
+
+def _sentence(rng: np.random.Generator) -> str:
+    return (f"{rng.choice(SUBJECTS)}을 통해 {rng.choice(OBJECTS)}에 대해 "
+            f"{rng.choice(ADVERBS)} {rng.choice(PREDICATES)}{rng.choice(EMOTICONS)}")
+
+def generate_reviews(site_name: str, n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    사이트 스키마에 맞는 합성 원본 리뷰 DataFrame을 생성하는 함수
+
+    Parameters:
+    - site_name (str): "kyobo", "yes24", "aladin"
+    - n_rows (int): 생성할 행 수
+    - seed (int): 난수 시드 (같은 시드면 같은 데이터)
+    """
+    schema = SCHEMAS[site_name]
+    rng = np.random.default_rng(seed)
+    separator = "\n" if site_name == "kyobo" else " "
+
+    n_sentences = rng.integers(1, 4, size=n_rows)
+    reviews: List[object] = [separator.join(_sentence(rng) for _ in range(k)) for k in n_sentences]
+    # 약 3%는 토큰화 후 너무 짧아 걸러지는 리뷰, 약 1%는 리뷰 결측
+    short = rng.random(n_rows) < 0.03
+    missing = rng.random(n_rows) < 0.01
+    for i in np.flatnonzero(short):
+        reviews[i] = str(rng.choice(ADVERBS))
+    for i in np.flatnonzero(missing):
+        reviews[i] = None
+
+    # 약 1%는 범위를 벗어난 별점 (0)
+    ratings = rng.integers(1, int(schema["max_rating"]) + 1, size=n_rows)
+    ratings[rng.random(n_rows) < 0.01] = 0
+    days = rng.integers(0, 365 * 8, size=n_rows)
+    dates = (pd.Timestamp("2016-05-19") + pd.to_timedelta(days, unit="D")).strftime(str(schema["date_format"]))
+
+    df = pd.DataFrame({"review": reviews, "rating": ratings, "date": dates})
+    if "sympathy" in schema["columns"]:
+        df["sympathy"] = rng.poisson(3, size=n_rows)
+    return df[schema["columns"]]
+
+def write_synthetic_csv(site_name: str, n_rows: int, path: str, seed: int = 0, chunk_rows: int = 100000) -> None:
+    """
+    합성 리뷰를 chunk_rows 행씩 만들어 원본과 같은 인코딩의 CSV로 저장하는 함수 (대용량 생성 시 메모리 제한)
+    """
+    encoding = str(SCHEMAS[site_name]["encoding"])
+    for i, start in enumerate(range(0, n_rows, chunk_rows)):
+        chunk = generate_reviews(site_name, min(chunk_rows, n_rows - start), seed=seed + i)
+        if i == 0:
+            chunk.to_csv(path, index=False, encoding=encoding)
+        else:
+            chunk.to_csv(path, mode="a", header=False, index=False, encoding="utf-8")
@@ -0,0 +1,110 @@
+"""
+토크나이저 백엔드(okt / kiwi)의 처리량과 clean_review 품질을 실제 리뷰 데이터로 비교하는 벤치마크
+
+- 처리량: 워밍업 시간, 초당 처리 리뷰 수, 리뷰당 지연 시간 분위수
+- 품질: 기준 백엔드(기본 okt) 결과와 비교한
+  - token_f1: 리뷰별 토큰 (다중집합) F1 평균
+  - filter_agreement: 길이 필터(10 < len < 100) 통과 여부가 같은 리뷰 비율
+  - tfidf_vocab_jaccard: TF-IDF 상위 100개 어휘의 자카드 유사도
+
+설치되지 않았거나 기동에 실패한 백엔드는 error만 기록하고 건너뛴다.
+
+예) python -m benchmarks.tokenizer_benchmark --input_dir database --output tokenizer_bench.json
+"""
+import glob
+import json
+import os
+import time
+from argparse import ArgumentParser
+from collections import Counter
+from typing import Dict, List
+
+import pandas as pd
+
+from review_analysis.preprocessing.review_processor import SPECIAL_CHARS
+from review_analysis.preprocessing.tfidf import StreamingTfidf
+from review_analysis.preprocessing.tokenizer import TOKENIZER_BACKENDS, TokenizerService
+
+def load_texts(input_dir: str, limit: int) -> List[str]:
+    # 전처리기의 clean_frame과 같은 특수문자 제거까지 적용한 토큰화 직전 텍스트
+    texts: List[str] = []
+    for csv_path in sorted(glob.glob(os.path.join(input_dir, "reviews_*.csv"))):
+        reviews = pd.read_csv(csv_path, usecols=["review"])["review"].dropna().astype(str)
+        if limit:
+            reviews = reviews.head(limit)
+        texts.extend(reviews.str.replace(SPECIAL_CHARS, '', regex=True).tolist())
+    return texts
+
+def _token_f1(tokens: str, reference: str) -> float:
+    predicted, expected = Counter(tokens.split()), Counter(reference.split())
+    if not predicted and not expected:
+        return 1.0
+    overlap = sum((predicted & expected).values())
+    if overlap == 0:
+        return 0.0
+    precision = overlap / sum(predicted.values())
+    recall = overlap / sum(expected.values())
+    return 2 * precision * recall / (precision + recall)
+
+def _kept(tokens: str) -> bool:
+    return 10 < len(tokens) < 100
+
+def _top_terms(docs: List[str]) -> set:
+    return set(StreamingTfidf(max_features=100).partial_fit(docs).finalize().vocabulary_)
+
+def run_backend(backend: str, texts: List[str]) -> Dict[str, object]:
+    service = TokenizerService(backend=backend)
+    try:
+        service.warm_up()
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+    start = time.perf_counter()
+    tokens = service.tokenize(texts)
+    elapsed = time.perf_counter() - start
+    metrics = service.metrics()
+    return {
+        "warmup_ms": metrics["warmup_ms"],
+        "total_seconds": round(elapsed, 4),
+        "texts_per_sec": round(len(texts) / elapsed, 1) if elapsed else None,
+        "latency_ms_p50": metrics.get("latency_ms_p50"),
+        "latency_ms_p95": metrics.get("latency_ms_p95"),
+        "kept_ratio": round(sum(map(_kept, tokens)) / len(tokens), 4) if tokens else None,
+        "tokens": tokens,
+    }
+
+def compare(results: Dict[str, Dict[str, object]], reference: str) -> None:
+    expected = results.get(reference, {}).get("tokens")
+    if expected is None:
+        return
+    reference_terms = _top_terms(expected)
+    for backend, result in results.items():
+        tokens = result.get("tokens")
+        if tokens is None:
+            continue
+        result["token_f1"] = round(sum(map(_token_f1, tokens, expected)) / len(tokens), 4)
+        result["filter_agreement"] = round(sum(_kept(a) == _kept(b) for a, b in zip(tokens, expected)) / len(tokens), 4)
+        terms = _top_terms(tokens)
+        result["tfidf_vocab_jaccard"] = round(len(terms & reference_terms) / len(terms | reference_terms), 4)
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument('--input_dir', type=str, default="database", help="Directory with reviews_*.csv")
+    parser.add_argument('--backends', type=str, default=",".join(TOKENIZER_BACKENDS), help="Comma-separated backends to compare.")
+    parser.add_argument('--reference', type=str, default="okt", help="Backend whose output is treated as ground truth.")
+    parser.add_argument('--limit', type=int, default=0, help="Use at most this many reviews per site (0 = all).")
+    parser.add_argument('--output', type=str, default=None, help="Write the JSON report to this path.")
+    return parser
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    texts = load_texts(args.input_dir, args.limit)
+    results = {backend: run_backend(backend, texts) for backend in args.backends.split(",")}
+    compare(results, args.reference)
+    for result in results.values():
+        result.pop("tokens", None)
+    report = {"texts": len(texts), "reference": args.reference, "backends": results}
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
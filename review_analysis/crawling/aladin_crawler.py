@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -6,32 +7,80 @@ from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException
 from bs4 import BeautifulSoup
-import pandas as pd
 import time
 from utils.logger import setup_logger
 from review_analysis.crawling.base_crawler import BaseCrawler
+from review_analysis.crawling.books import BOOK_ID_COLUMN, DEFAULT_BOOK_IDS, job_name, legacy_fill
+from review_analysis.crawling.checkpoint import CrawlCheckpoint, ResumeError, SeenReviews
+from review_analysis.crawling.metrics import CrawlMetrics
+from review_analysis.crawling.page_cache import PageCache
+from review_analysis.crawling.politeness import Throttle
+from review_analysis.crawling.sinks import RowSink, rewrite_csv, write_rows
 
 class AladinCrawler(BaseCrawler):
     """
     알라딘 전체 리뷰(별점, 날짜, 본문) 634개 크롤링 자동화 크롤러 (별점 정확히 파싱)
+
+    sink가 주어지면 더보기로 새로 붙은 리뷰를 모아 두지 않고 바로 sink(CSV/MongoDB)로 내보낸다.
+    cache가 주어지면 클릭마다 새로 붙은 블록 HTML을 "blocks=앞서 붙은 블록 수" 상태로 저장(record)하거나,
+    브라우저 없이 저장된 블록으로 더보기 순회/파싱을 재현(replay)한다.
+    book_id(ItemId)로 수집할 도서를 정하며, 모든 행에 도서 ID를 붙인다.
     """
 
-    def __init__(self, output_dir: str):
+    OUTPUT_COLUMNS = ['review', 'rating', 'date', BOOK_ID_COLUMN]
+
+    def __init__(self, output_dir: str, resume: bool = False, incremental: bool = False, checkpoint_every: int = 10,
+                 headless: bool = False, min_interval: float = 0.0, sink: Optional[RowSink] = None,
+                 cache: Optional[PageCache] = None, book_id: Optional[str] = None,
+                 throttle: Optional[Throttle] = None):
         self.output_dir = output_dir
         self.logger = setup_logger('aladin_crawler.log')
         self.reviews: list[str] = []
         self.ratings: list[float] = []
         self.dates: list[str] = [] 
-        self.url = "https://www.aladin.co.kr/shop/wproduct.aspx?ItemId=40869703&start=slayer#K662930932_CommentReview"
+        self.book_id = book_id or DEFAULT_BOOK_IDS['aladin']
+        self.url = f"https://www.aladin.co.kr/shop/wproduct.aspx?ItemId={self.book_id}&start=slayer"
+        # 출력은 도서와 관계없이 사이트마다 하나 (book_id 컬럼으로 구분)
+        self.output_path = f"{self.output_dir}/reviews_aladin.csv"
+        # 이어서 수집할지 여부, 도서별 진행 체크포인트, 증분 수집용 기존 CSV의 이 도서 리뷰 목록
+        self.resume = resume
+        self.checkpoint = CrawlCheckpoint(self.output_dir, job_name('aladin', self.book_id), checkpoint_every)
+        self.seen = (SeenReviews(self.output_path, fill=legacy_fill('aladin'), book_id=self.book_id)
+                     if incremental else None)
+        # 브라우저 창 없이 실행할지 여부(동시 실행 시 사용)와 더보기 클릭 사이 최소 간격 (스케줄러에서는 사이트 단위로 공유)
+        self.headless = headless
+        self.throttle = throttle or Throttle(min_interval)
+        self.pages = 0
+        # 리뷰를 바로 내보낼 출력 대상 (None이면 모아서 save_to_database에서 CSV로 저장)
+        self.sink = sink
+        # 더보기 클릭/대기/파싱 시간 기록
+        self.metrics = CrawlMetrics('aladin')
+        # 블록 HTML 저장/재현용 캐시와 재현 중인 블록 수
+        self.cache = cache
+        self.driver: Optional[WebDriver] = None
+        self._replay_count = 0
+
+    @property
+    def _replaying(self) -> bool:
+        return self.cache is not None and self.cache.replaying
+
+    @property
+    def collected(self) -> int:
+        """
+        이번 실행에서 수집한 리뷰 수
+        """
+        return self.sink.written if self.sink is not None else len(self.reviews)
 
     def start_browser(self):
         """
         Selenium WebDriver 실행 및 리뷰 전체 탭 클릭
         """
         chrome_options = Options()
-        # chrome_options.add_argument("--headless")  # 테스트 중엔 주석
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -41,118 +90,249 @@ class AladinCrawler(BaseCrawler):
         )
 
         self.driver.get(self.url)
-        time.sleep(2)
         # "전체" 탭 클릭 (id="tabTotal")
         try:
-            total_tab = self.driver.find_element(By.ID, "tabTotal")
+            total_tab = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.ID, "tabTotal"))
+            )
             self.driver.execute_script("arguments[0].click();", total_tab)
             self.logger.info("'전체' 탭 클릭 성공")
-            time.sleep(2.5)
+            # 전체 리뷰 목록 요청이 끝나고 블록이 붙을 때까지 대기
+            with self.metrics.timed("wait"):
+                WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                    lambda driver: self._ajax_idle() and self._block_count() > 0
+                )
         except Exception as e:
             self.logger.warning("'전체' 탭 클릭 실패: " + str(e))
 
         self.logger.info("알라딘 전체 리뷰 탭 진입 완료")
 
-    def scrape_reviews(self):
+    def _ajax_idle(self) -> bool:
+        # 진행 중인 jQuery AJAX 요청이 없고 문서 로딩이 끝났으면 True
+        return self.driver.execute_script(
+            "return document.readyState === 'complete' && (!window.jQuery || window.jQuery.active === 0);"
+        )
+
+    def _block_count(self) -> int:
+        # page_source를 파싱하지 않고 브라우저에서 리뷰 블록 수만 센다
+        if self._replaying:
+            return self._replay_count
+        return self.driver.execute_script("return document.querySelectorAll('div.hundred_list').length;")
+
+    def _block_html(self, start: int) -> Tuple[str, int]:
+        # start번째 이후에 새로 붙은 리뷰 블록의 outerHTML만 가져와 (HTML, 블록 수)로 반환한다
+        state = f"blocks={start}"
+        if self._replaying:
+            entry = self.cache.load(self.url, state)
+            return (entry["html"], entry["count"]) if entry is not None else ("", 0)
+        blocks = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll('div.hundred_list'))"
+            ".slice(arguments[0]).map(function (el) { return el.outerHTML; });",
+            start,
+        )
+        html = "".join(blocks)
+        if self.cache is not None:
+            self.cache.save(self.url, state, html, count=len(blocks))
+        return html, len(blocks)
+
+    def parse_block(self, block) -> Optional[Tuple[str, int, str]]:
         """
-        전체 리뷰 수집 ('리뷰 더보기' 반복 클릭, 스포일러 본문 포함, 별점 on만 카운트)
+        리뷰 블록(div.hundred_list) 하나에서 (리뷰, 별점, 날짜)를 추출 (본문이나 날짜가 없으면 None)
         """
-        self.start_browser()
-        prev_count = -1
-        loop_count = 0
+        # ⭐ 별점: 켜진 별만 카운트!
+        star_div = block.select_one('.HL_star')
+        rating = 0
+        if star_div:
+            for img in star_div.find_all('img'):
+                if 'icon_star_on' in img.get('src', ''):
+                    rating += 1
 
-        while True:
-            soup_pre = BeautifulSoup(self.driver.page_source, "html.parser")
-            blocks_pre = soup_pre.select('div.hundred_list')
-            cur_count = len(blocks_pre)
-            try:
-                more_wrap = self.driver.find_element(By.ID, "divReviewPageMore")
-                more_btn = more_wrap.find_element(By.CSS_SELECTOR, "div.Ere_btn_more a")
-                if more_btn.is_displayed() and more_btn.is_enabled():
-                    self.logger.info(f"{loop_count+1}회 더보기 클릭 (현재 {cur_count}개)")
-                    self.driver.execute_script("arguments[0].click();", more_btn)
-                    time.sleep(2.3)
-                    # AJAX가 붙을 때까지 대기
-                    wait_try = 0
-                    while wait_try < 7:
-                        soup_now = BeautifulSoup(self.driver.page_source, "html.parser")
-                        blocks_now = soup_now.select('div.hundred_list')
-                        if len(blocks_now) > cur_count:
-                            break
-                        time.sleep(1)
-                        wait_try += 1
-                else:
-                    self.logger.info("더보기 버튼이 비활성/없음으로 종료")
-                    break
-            except Exception:
-                self.logger.info("더보기 버튼이 아예 없음/예외로 종료")
+        # 리뷰 본문: 스포일러 안내문이 아닌 본문 찾기
+        review = None
+        review_spans = block.select('span[id^="spnPaper"]')
+        for span in review_spans:
+            txt = span.text.strip()
+            if txt and not txt.startswith("이 글에는 스포일러가 포함되어 있습니다."):
+                review = txt
                 break
+        if review is None and review_spans:
+            review = review_spans[0].text.strip()
 
-            soup_after = BeautifulSoup(self.driver.page_source, "html.parser")
-            after_count = len(soup_after.select('div.hundred_list'))
-            if after_count == cur_count:
-                self.logger.info(f"더보기 눌렀는데 리뷰 수가 늘지 않음 ({cur_count}), 루프 종료")
+        # 날짜: yyyy-mm-dd
+        date = None
+        for s in block.select('span.Ere_sub_gray8.Ere_fs13.Ere_PR10'):
+            text = s.text.strip()
+            if len(text) == 10 and text.count('-') == 2:
+                date = text
                 break
-            prev_count = cur_count
-            loop_count += 1
 
-        time.sleep(2)  # AJAX 최종 동기화
+        if review and date and rating is not None:
+            return review, rating, date
+        return None
 
-        # === 리뷰 파싱 ===
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        review_blocks = soup.select('div.hundred_list')
-        total_collected = 0
+    def _collect_new_blocks(self, parsed: int) -> Tuple[int, bool]:
+        """
+        parsed개 이후에 새로 붙은 블록만 파싱해 리뷰 목록에 추가하는 메서드
 
-        for block in review_blocks:
+        Returns:
+        - Tuple[int, bool]: (지금까지 파싱한 블록 수, 증분 수집에서 새 블록이 모두 기존 리뷰라 멈춰야 하는지 여부)
+        """
+        new_html, count = self._block_html(parsed)
+        soup = BeautifulSoup(new_html, "html.parser")
+        rows = []
+        for block in soup.select('div.hundred_list'):
             try:
-                # ⭐ 별점: 켜진 별만 카운트!
-                star_div = block.select_one('.HL_star')
-                rating = 0
-                if star_div:
-                    for img in star_div.find_all('img'):
-                        if 'icon_star_on' in img.get('src', ''):
-                            rating += 1
-
-                # 리뷰 본문: 스포일러 안내문이 아닌 본문 찾기
-                review = None
-                review_spans = block.select('span[id^="spnPaper"]')
-                for span in review_spans:
-                    txt = span.text.strip()
-                    if txt and not txt.startswith("이 글에는 스포일러가 포함되어 있습니다."):
-                        review = txt
-                        break
-                if review is None and review_spans:
-                    review = review_spans[0].text.strip()
-
-                # 날짜: yyyy-mm-dd
-                date = None
-                for s in block.select('span.Ere_sub_gray8.Ere_fs13.Ere_PR10'):
-                    text = s.text.strip()
-                    if len(text) == 10 and text.count('-') == 2:
-                        date = text
-                        break
-
-                if review and date and rating is not None:
-                    self.reviews.append(review)
-                    self.ratings.append(rating)
-                    self.dates.append(date)
-                    total_collected += 1
+                row = self.parse_block(block)
             except Exception as e:
                 self.logger.warning(f"리뷰 파싱 중 오류: {e}")
                 continue
+            if row is not None:
+                rows.append([*row, self.book_id])
+        if self.seen is not None and self.seen.all_seen([row[0] for row in rows], [row[2] for row in rows]):
+            return parsed + count, True
+        self._add_rows(rows)
+        return parsed + count, False
+
+    def _add_rows(self, rows) -> None:
+        if self.sink is not None:
+            write_rows(self.sink, rows, self.OUTPUT_COLUMNS, self.seen)
+            return
+        for review, rating, date, *_ in rows:
+            self.reviews.append(review)
+            self.ratings.append(rating)
+            self.dates.append(date)
+
+    def _rows(self) -> list[list]:
+        return [[*row, self.book_id] for row in zip(self.reviews, self.ratings, self.dates)]
+
+    def _load_more(self, cur_count: int, loop_count: int) -> Optional[float]:
+        """
+        "더보기"를 눌러 블록이 cur_count개보다 늘어날 때까지 기다리는 메서드
 
-        self.logger.info(f"총 {total_collected}건의 리뷰를 수집하였습니다.")
+        replay 모드면 cur_count 다음 블록이 캐시에 있을 때 그만큼 블록이 붙은 것으로 본다.
+
+        Returns:
+        - Optional[float]: 기다린 시간(초). 버튼이 없거나 블록이 늘지 않으면 None
+        """
+        if self._replaying:
+            entry = self.cache.load(self.url, f"blocks={cur_count}")
+            if entry is None or entry["count"] == 0:
+                self.logger.info("저장된 다음 블록이 없어 종료 (replay)")
+                return None
+            self._replay_count = cur_count + entry["count"]
+            self.pages += 1
+            return 0.0
+        try:
+            more_wrap = self.driver.find_element(By.ID, "divReviewPageMore")
+            more_btn = more_wrap.find_element(By.CSS_SELECTOR, "div.Ere_btn_more a")
+            if not (more_btn.is_displayed() and more_btn.is_enabled()):
+                self.logger.info("더보기 버튼이 비활성/없음으로 종료")
+                return None
+            self.logger.info(f"{loop_count+1}회 더보기 클릭 (현재 {cur_count}개)")
+            self.metrics.record("throttle", self.throttle.wait())
+            with self.metrics.timed("fetch"):
+                self.driver.execute_script("arguments[0].click();", more_btn)
+        except Exception:
+            self.logger.info("더보기 버튼이 아예 없음/예외로 종료")
+            return None
+
+        # AJAX로 블록이 붙을 때까지 대기
+        wait_start = time.perf_counter()
+        try:
+            WebDriverWait(self.driver, 9.3, poll_frequency=0.1).until(
+                lambda driver: self._block_count() > cur_count
+            )
+        except TimeoutException:
+            self.logger.info(f"더보기 눌렀는데 리뷰 수가 늘지 않음 ({cur_count}), 루프 종료")
+            return None
+        waited = time.perf_counter() - wait_start
+        self.metrics.record("wait", waited)
+        self.pages += 1
+        return waited
+
+    def scrape_reviews(self):
+        """
+        전체 리뷰 수집 ('리뷰 더보기' 반복 클릭, 스포일러 본문 포함, 별점 on만 카운트)
+
+        - 리뷰 수는 JS로 블록 개수만 세어 확인하고, 클릭 후 개수가 늘어날 때까지 기다림
+        - 매 클릭마다 새로 붙은 블록의 HTML만 파싱하므로 반복당 작업량이 페이지 크기와 무관하게 일정
+        - 반복마다 대기/파싱 시간을 로그로 남김
+        - checkpoint_every번 클릭마다 파싱한 블록 수와 리뷰를 체크포인트로 저장하고,
+          이어서 수집하면 저장된 블록 수만큼 더보기만 누른 뒤 그 다음 블록부터 파싱
+          (그만큼 블록을 불러오지 못하면 체크포인트를 남긴 채 ResumeError 발생)
+        - 증분 수집이면 새로 붙은 블록의 리뷰가 모두 기존 CSV에 있을 때 종료
+        """
+        if self._replaying:
+            entry = self.cache.load(self.url, "blocks=0")
+            self._replay_count = entry["count"] if entry is not None else 0
+        else:
+            self.start_browser()
+        self.pages = 1
+        loop_count = 0
+        state = self.checkpoint.load() if self.resume else None
+        if state is not None:
+            self._add_rows(state["rows"])
+            parsed = state["cursor"]
+            self.logger.info(f"체크포인트에서 이어서 수집: {parsed}개 블록까지 {len(state['rows'])}건 복원")
+            while self._block_count() < parsed:
+                if self._load_more(self._block_count(), loop_count) is None:
+                    raise ResumeError(f"Could not load the {parsed} checkpointed review blocks "
+                                      f"(stopped at {self._block_count()}); the checkpoint is kept for the next resume")
+                loop_count += 1
+            stop = False
+        else:
+            parsed, stop = self._collect_new_blocks(0)
+
+        while not stop:
+            waited = self._load_more(self._block_count(), loop_count)
+            if waited is None:
+                break
+
+            parse_start = time.perf_counter()
+            before = parsed
+            parsed, stop = self._collect_new_blocks(parsed)
+            parse_seconds = time.perf_counter() - parse_start
+            self.metrics.record("parse", parse_seconds)
+            self.logger.info(
+                f"{loop_count+1}회: +{parsed - before}개 블록 (누적 {parsed}개), "
+                f"대기 {waited:.2f}s, 파싱 {parse_seconds:.3f}s"
+            )
+            loop_count += 1
+            if loop_count % self.checkpoint.every == 0:
+                if self.sink is not None:
+                    self.sink.flush()
+                self.checkpoint.save(parsed, self._rows())
+
+        if stop:
+            self.logger.info("새로 붙은 리뷰가 모두 기존 CSV에 있어 종료 (증분 수집)")
+        else:
+            # 마지막 더보기 요청이 끝날 때까지(최대 5초) 기다린 뒤 남은 블록 파싱
+            try:
+                if not self._replaying:
+                    WebDriverWait(self.driver, 5, poll_frequency=0.1).until(lambda driver: self._ajax_idle())
+            except TimeoutException:
+                self.logger.warning("AJAX 요청이 5초 안에 끝나지 않음")
+            parsed, _ = self._collect_new_blocks(parsed)
+
+        self.logger.info(f"총 {self.collected}건의 리뷰를 수집하였습니다. ({parsed}개 블록)")
 
     def save_to_database(self):
         """
-        크롤링한 리뷰 데이터를 database/reviews_aladin.csv로 저장
+        크롤링한 리뷰 데이터를 database/reviews_aladin.csv로 저장 (증분 수집이면 기존 리뷰를 뒤에 이어붙임)
+
+        다른 도서의 행은 그대로 두고 이 도서의 행만 교체함
+
+        sink로 내보낸 경우 남은 리뷰만 내보내고 닫음
         """
-        data = {
-            'review': self.reviews,
-            'rating': self.ratings,
-            'date': self.dates
-        }
-        df = pd.DataFrame(data)
-        output_path = f"{self.output_dir}/reviews_aladin.csv"
-        df.to_csv(output_path, index=False)
-        self.logger.info(f"{len(df)}건 리뷰를 {output_path}에 저장 완료")
+        if self.sink is not None:
+            self.sink.close()
+            self.checkpoint.clear()
+            self.logger.info(f"{self.sink.written}건 리뷰 출력 완료")
+            return
+        columns = self.OUTPUT_COLUMNS
+        rows = self.seen.merge(self._rows(), columns) if self.seen is not None else self._rows()
+        output_path = self.output_path
+        total = rewrite_csv(output_path, columns, rows, fill=legacy_fill('aladin'),
+                            drop=lambda row: row[BOOK_ID_COLUMN] == self.book_id)
+        self.checkpoint.clear()
+        self.logger.info(f"{len(rows)}건 리뷰를 {output_path}에 저장 완료 (신규 {len(self.reviews)}건, 전체 {total}건)")
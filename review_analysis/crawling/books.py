@@ -0,0 +1,73 @@
+import csv
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+# 사이트별 기본 도서 ID (소년이 온다)
+# - yes24: 상품 번호(goods_id), kyobo: 상품 코드, aladin: ItemId
+DEFAULT_BOOK_IDS = {
+    "yes24": "13137546",
+    "kyobo": "S000000610612",
+    "aladin": "40869703",
+}
+
+# 출력 행에 붙는 도서 ID 컬럼
+BOOK_ID_COLUMN = "book_id"
+
+def legacy_fill(site_name: str) -> Dict[str, str]:
+    """
+    도서 ID 컬럼이 생기기 전에 저장한 출력(기본 도서만 수집함) 행의 빈 도서 ID를 채울 값
+    """
+    return {BOOK_ID_COLUMN: DEFAULT_BOOK_IDS[site_name]}
+
+class CrawlJob(NamedTuple):
+    site: str
+    book_id: str
+
+def job_name(site_name: str, book_id: Optional[str] = None) -> str:
+    """
+    체크포인트와 실행 결과에 쓰는 작업 이름
+
+    기본 도서는 기존과 같은 사이트 이름을, 다른 도서는 "{사이트}_{도서 ID}"를 사용한다.
+    (출력은 도서와 관계없이 사이트마다 하나이며 book_id 컬럼으로 도서를 구분한다)
+    """
+    if book_id is None or book_id == DEFAULT_BOOK_IDS.get(site_name):
+        return site_name
+    return f"{site_name}_{book_id}"
+
+def book_query(site_name: str, book_id: str) -> Dict[str, Any]:
+    """
+    사이트 컬렉션에서 한 도서의 리뷰 문서를 찾는 MongoDB 조건 (book_id가 없는 예전 문서는 기본 도서로 봄)
+    """
+    if book_id == DEFAULT_BOOK_IDS.get(site_name):
+        return {BOOK_ID_COLUMN: {"$in": [book_id, None]}}
+    return {BOOK_ID_COLUMN: book_id}
+
+def read_jobs(path: str, sites: Iterable[str]) -> List[CrawlJob]:
+    """
+    크롤링 작업 파일(site,book_id 헤더의 CSV)을 읽어 작업 목록을 반환하는 함수 (중복 작업은 한 번만)
+
+    Parameters:
+    - path (str): 작업 파일 경로
+    - sites (Iterable[str]): 지원하는 사이트 이름
+
+    Raises:
+    - ValueError: 헤더가 없거나 지원하지 않는 사이트가 있는 경우
+    """
+    sites = set(sites)
+    jobs: List[CrawlJob] = []
+    seen: Set[CrawlJob] = set()
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None or not {"site", BOOK_ID_COLUMN} <= set(reader.fieldnames):
+            raise ValueError(f"Jobs file needs a 'site,{BOOK_ID_COLUMN}' header: {path}")
+        for line_num, row in enumerate(reader, start=2):
+            site_name = (row["site"] or "").strip()
+            book_id = (row[BOOK_ID_COLUMN] or "").strip()
+            if not site_name and not book_id:
+                continue
+            if site_name not in sites or not book_id:
+                raise ValueError(f"Invalid job on line {line_num}: {row}")
+            job = CrawlJob(site_name, book_id)
+            if job not in seen:
+                seen.add(job)
+                jobs.append(job)
+    return jobs
@@ -0,0 +1,157 @@
+import csv
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from review_analysis.crawling.books import BOOK_ID_COLUMN
+
+STATE_DIR = ".crawl_state"
+
+def review_key(review: Any, date: Any) -> str:
+    """
+    리뷰 본문과 작성일로 만든 리뷰 식별 키 (출력 CSV와 새로 수집한 행을 비교할 때 사용)
+
+    본문의 공백/줄바꿈은 모두 무시한다. 같은 리뷰라도 Selenium .text(화면 렌더링 기준)와
+    BeautifulSoup get_text("\n", strip=True)(텍스트 노드 기준)는 줄바꿈/띄어쓰기가 다를 수 있으므로
+    예전 방식으로 수집한 CSV의 리뷰도 같은 키가 되도록 한다.
+    """
+    key = f"{''.join(str(review).split())}\x1f{str(date).strip()}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+class ResumeError(RuntimeError):
+    """
+    이어서 수집할 때 체크포인트 위치까지 이동하지 못한 경우의 예외
+
+    저장까지 진행하면 체크포인트가 지워지므로 크롤링을 중단하고 체크포인트를 남겨 둔다.
+    """
+
+class PageFetchError(RuntimeError):
+    """
+    재시도를 모두 마쳐도 페이지를 받지 못한 경우의 예외
+
+    그 페이지를 건너뛰면 리뷰가 빠진 채 체크포인트가 넘어가므로, 직전 페이지까지 체크포인트를
+    저장하고 중단한다. (--resume으로 실패한 페이지부터 다시 수집)
+    """
+
+def checkpoint_path(output_dir: str, site_name: str) -> str:
+    """
+    사이트별 크롤링 체크포인트 파일 경로를 반환하는 함수
+    """
+    return os.path.join(output_dir, STATE_DIR, f"{site_name}.json")
+
+class CrawlCheckpoint:
+    """
+    크롤링 진행 위치(cursor)와 지금까지 수집한 행을 주기적으로 파일에 저장하는 클래스
+
+    - cursor는 크롤러마다 다르다. (YES24/교보: 마지막으로 수집한 페이지, 알라딘: 파싱한 리뷰 블록 수)
+    - step()은 every번째 cursor마다 저장하며, 파일은 임시 파일에 쓴 뒤 교체하므로
+      저장 도중 중단되어도 직전 체크포인트가 남는다.
+    - 크롤링과 저장이 모두 끝나면 clear()로 지운다.
+    """
+
+    def __init__(self, output_dir: str, site_name: str, every: int = 10):
+        """
+        Parameters:
+        - output_dir (str): 크롤링 결과 디렉토리 (체크포인트는 그 아래 .crawl_state/에 저장)
+        - site_name (str): 사이트 이름
+        - every (int): 몇 번째 cursor마다 저장할지
+        """
+        self.path = checkpoint_path(output_dir, site_name)
+        self.every = max(1, every)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        저장된 체크포인트({"cursor", "rows", "saved_at"})를 반환 (없으면 None)
+        """
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, cursor: int, rows: Sequence[Sequence[Any]]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"cursor": cursor, "rows": [list(row) for row in rows], "saved_at": time.time()},
+                      f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def step(self, cursor: int, rows: Sequence[Sequence[Any]], sink=None, force: bool = False) -> None:
+        """
+        every번째 cursor마다 체크포인트를 저장하는 메서드 (force=True면 cursor와 관계없이 저장)
+
+        sink(RowSink)로 행을 내보내는 중이면 행은 저장하지 않고, 버퍼를 먼저 내보낸 뒤 cursor만 저장한다.
+        (이어서 수집할 때는 출력에 이미 쓰인 행 뒤에 이어 씀)
+        """
+        if cursor % self.every and not force:
+            return
+        if sink is not None:
+            sink.flush()
+            rows = []
+        self.save(cursor, rows)
+
+    def clear(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class SeenReviews:
+    """
+    기존 출력 CSV에 이미 있는 리뷰 목록 (증분 크롤링에서 조기 종료와 병합에 사용)
+
+    리뷰가 최신순으로 나열된다고 보고, 한 페이지(또는 한 번에 붙은 블록)의 리뷰가 모두
+    이미 본 리뷰면 그 뒤는 지난 크롤링에서 수집한 범위이므로 멈춘다.
+    """
+
+    def __init__(self, csv_path: str, review_column: str = "review", date_column: str = "date",
+                 fill: Optional[Dict[str, str]] = None, book_id: Optional[str] = None):
+        """
+        Parameters:
+        - csv_path (str): 기존 출력 CSV 경로
+        - review_column (str): 리뷰 본문 컬럼
+        - date_column (str): 작성일 컬럼
+        - fill (Optional[Dict[str, str]]): 기존 행에서 비어 있거나 없는 컬럼을 채울 값 (예: 이전 버전 출력의 book_id)
+        - book_id (Optional[str]): 주면 사이트 출력 중 이 도서의 행만 기존 리뷰로 봄 (fill을 적용한 뒤 판단)
+        """
+        self.csv_path = csv_path
+        self.review_column = review_column
+        self.date_column = date_column
+        self.rows: List[Dict[str, str]] = []
+        if os.path.exists(csv_path):
+            # pandas/csv 모듈이 쓴 파일 모두 읽을 수 있도록 BOM이 있으면 제거
+            with open(csv_path, newline="", encoding="utf-8-sig") as f:
+                self.rows = list(csv.DictReader(f))
+        for row in self.rows:
+            for column, value in (fill or {}).items():
+                if not row.get(column):
+                    row[column] = value
+        if book_id is not None:
+            self.rows = [row for row in self.rows if row.get(BOOK_ID_COLUMN) == book_id]
+        self.keys = {review_key(row[review_column], row[date_column]) for row in self.rows}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def is_new(self, review: Any, date: Any) -> bool:
+        return review_key(review, date) not in self.keys
+
+    def all_seen(self, reviews: Iterable[Any], dates: Iterable[Any]) -> bool:
+        """
+        주어진 리뷰가 하나 이상이고 모두 기존 출력에 있으면 True
+        """
+        keys = [review_key(review, date) for review, date in zip(reviews, dates)]
+        return bool(keys) and all(key in self.keys for key in keys)
+
+    def merge(self, new_rows: Sequence[Sequence[Any]], columns: Sequence[str]) -> List[List[Any]]:
+        """
+        새로 수집한 행(columns 순서) 뒤에 기존 출력 행 중 새 행과 겹치지 않는 행을 이어붙여 반환
+        """
+        review_index = columns.index(self.review_column)
+        date_index = columns.index(self.date_column)
+        merged = [list(row) for row in new_rows]
+        new_keys = {review_key(row[review_index], row[date_index]) for row in new_rows}
+        for row in self.rows:
+            if review_key(row[self.review_column], row[self.date_column]) not in new_keys:
+                merged.append([row.get(column, "") for column in columns])
+        return merged
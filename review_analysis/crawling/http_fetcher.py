@@ -0,0 +1,138 @@
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+
+from review_analysis.crawling.metrics import CrawlMetrics
+from review_analysis.crawling.page_cache import CacheMiss, PageCache
+from review_analysis.crawling.politeness import Throttle
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "X-Requested-With": "XMLHttpRequest",
+}
+
+# 잠시 뒤 다시 요청하면 성공할 수 있는 응답 코드
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class HttpPageFetcher:
+    """
+    브라우저 없이 HTML 페이지를 병렬로 받아오는 HTTP 클라이언트
+
+    - 하나의 httpx.Client(커넥션 풀)를 스레드들이 함께 사용해 연결을 재사용
+    - 동시에 보내는 요청 수는 max_workers로 제한
+    - 연결 오류나 429/5xx 응답은 retries번까지 지수 백오프(+지터)로 재시도 (Retry-After가 있으면 따름)
+    - cache가 주어지면 record 모드에서는 받은 페이지를 저장하고, replay 모드에서는 요청 없이 캐시에서 꺼냄
+    """
+
+    def __init__(self, max_workers: int = 8, retries: int = 3, backoff: float = 0.5, timeout: float = 10.0,
+                 headers: Optional[Dict[str, str]] = None, logger: Optional[logging.Logger] = None,
+                 throttle: Optional[Throttle] = None, metrics: Optional[CrawlMetrics] = None,
+                 cache: Optional[PageCache] = None):
+        """
+        Parameters:
+        - max_workers (int): 동시 요청 수 (= 커넥션 풀 크기)
+        - retries (int): 요청 하나당 최대 재시도 횟수
+        - backoff (float): 첫 재시도 전 대기 시간(초). 재시도마다 두 배로 늘어남
+        - timeout (float): 요청 타임아웃(초)
+        - headers (Optional[Dict[str, str]]): 기본 헤더 (None이면 DEFAULT_HEADERS)
+        - logger (Optional[logging.Logger]): 재시도/실패를 기록할 로거
+        - throttle (Optional[Throttle]): 요청(재시도 포함) 사이 최소 간격 (None이면 제한 없음)
+        - metrics (Optional[CrawlMetrics]): 요청마다 throttle/fetch 소요 시간을 기록할 곳
+        - cache (Optional[PageCache]): 페이지를 저장(record)하거나 꺼내 쓸(replay) 캐시
+        """
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.logger = logger or logging.getLogger(__name__)
+        self.throttle = throttle or Throttle()
+        self.metrics = metrics
+        self.cache = cache
+        limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+        self.client = httpx.Client(headers=headers or DEFAULT_HEADERS, timeout=timeout, limits=limits,
+                                   follow_redirects=True)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retried = 0
+
+    def __enter__(self) -> "HttpPageFetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.client.close()
+
+    def _wait(self, attempt: int, response: Optional[httpx.Response] = None) -> None:
+        delay = self.backoff * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        time.sleep(delay * (1 + random.random() * 0.1))
+
+    def fetch(self, url: str) -> str:
+        """
+        페이지 하나를 받아 본문을 반환하는 메서드
+
+        Raises:
+        - httpx.HTTPError: 재시도 후에도 실패한 경우
+        - CacheMiss: replay 모드에서 캐시에 없는 페이지인 경우
+        """
+        if self.cache is not None and self.cache.replaying:
+            started = time.perf_counter()
+            html = self.cache.html(url)
+            if self.metrics is not None:
+                self.metrics.record("fetch", time.perf_counter() - started)
+            return html
+        attempt = 0
+        while True:
+            with self._lock:
+                self.requests += 1
+            waited = self.throttle.wait()
+            started = time.perf_counter()
+            try:
+                response = self.client.get(url)
+            except httpx.TransportError as e:
+                if attempt >= self.retries:
+                    raise
+                self.logger.warning(f"요청 실패, 재시도 {attempt + 1}/{self.retries}: {url} ({e})")
+                response = None
+            else:
+                if self.metrics is not None:
+                    self.metrics.record("throttle", waited)
+                    self.metrics.record("fetch", time.perf_counter() - started)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                    response.raise_for_status()
+                    if self.cache is not None:
+                        self.cache.save(url, "", response.text)
+                    return response.text
+                self.logger.warning(f"HTTP {response.status_code}, 재시도 {attempt + 1}/{self.retries}: {url}")
+            with self._lock:
+                self.retried += 1
+            self._wait(attempt, response)
+            attempt += 1
+
+    def _fetch_or_none(self, url: str) -> Optional[str]:
+        try:
+            return self.fetch(url)
+        except (httpx.HTTPError, CacheMiss) as e:
+            self.logger.warning(f"페이지 수집 실패: {url} ({e})")
+            return None
+
+    def fetch_many(self, urls: Sequence[str]) -> List[Optional[str]]:
+        """
+        여러 페이지를 최대 max_workers개씩 동시에 받아 요청 순서대로 반환하는 메서드
+
+        Returns:
+        - List[Optional[str]]: 각 URL의 본문 (재시도 후에도 실패한 페이지는 None)
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self._fetch_or_none, urls))
@@ -4,16 +4,38 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
+from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from review_analysis.crawling.base_crawler import BaseCrawler
+from review_analysis.crawling.books import BOOK_ID_COLUMN, DEFAULT_BOOK_IDS, job_name, legacy_fill
+from review_analysis.crawling.checkpoint import CrawlCheckpoint, ResumeError, SeenReviews
+from review_analysis.crawling.metrics import CrawlMetrics
+from review_analysis.crawling.page_cache import PageCache
+from review_analysis.crawling.politeness import Throttle
+from review_analysis.crawling.sinks import RowSink, rewrite_csv, write_rows
 from utils.logger import setup_logger
-from typing import List
+from typing import List, Optional
 import time
 import os
 import re
-import pandas as pd
+
+# 현재 페이지의 리뷰 목록 HTML (페이지 이동마다 한 번만 브라우저에서 가져옴)
+REVIEW_LIST_JS = (
+    "return Array.from(document.querySelectorAll('.comment_item'))"
+    ".map(function (el) { return el.outerHTML; }).join('');"
+)
+
+def remove_emoji(text: str) -> str:
+    emoji_pattern = re.compile(
+        "["
+        "\U00010000-\U0010FFFF"
+        "]+",
+        flags=re.UNICODE,
+    )
+    return emoji_pattern.sub(r'', text)
 
 class KyoboCrawler(BaseCrawler):
 
@@ -21,16 +43,54 @@ class KyoboCrawler(BaseCrawler):
     교보문고 웹사이트에서 도서 리뷰를 크롤링하는 크롤러 클래스
 
     Attributes:
+        book_id (str): 크롤링 대상 도서의 상품 코드 (모든 행에 함께 저장됨)
         base_url (str): 크롤링 대상 도서의 URL
         reviews (List[list[str | float]]): 수집한 리뷰, 평점, 날짜를 저장하는 리스트
         logger (logging.Logger): 로깅을 위한 로거 객체
+        checkpoint (CrawlCheckpoint): 수집한 페이지와 리뷰를 주기적으로 저장하는 체크포인트
+        seen (SeenReviews | None): 증분 수집 시 기존 CSV의 리뷰 목록
+        headless (bool): 브라우저 창 없이 실행할지 여부 (동시 실행 시 사용)
+        throttle (Throttle): 페이지 이동 사이 최소 간격 (스케줄러에서는 같은 사이트 작업끼리 공유)
+        sink (RowSink | None): 리뷰를 페이지마다 바로 내보낼 출력 대상 (None이면 모아서 CSV로 저장)
+        metrics (CrawlMetrics): 페이지별 이동/로딩 대기/파싱 시간 기록
+        cache (PageCache | None): 페이지별 리뷰 목록 HTML을 저장(record)하거나 브라우저 없이 재현(replay)할 캐시
     """
 
-    def __init__(self, output_dir: str):
+    OUTPUT_COLUMNS = ["review", "rating", "date", BOOK_ID_COLUMN]
+
+    def __init__(self, output_dir: str, resume: bool = False, incremental: bool = False, checkpoint_every: int = 10,
+                 headless: bool = False, min_interval: float = 0.0, sink: Optional[RowSink] = None,
+                 cache: Optional[PageCache] = None, book_id: Optional[str] = None,
+                 throttle: Optional[Throttle] = None):
         super().__init__(output_dir)
-        self.base_url = 'https://product.kyobobook.co.kr/detail/S000000610612'
+        self.book_id = book_id or DEFAULT_BOOK_IDS['kyobo']
+        self.base_url = f'https://product.kyobobook.co.kr/detail/{self.book_id}'
         self.logger = setup_logger('kyobo.log')
         self.reviews: List[list[str | float]] = []
+        # 출력은 도서와 관계없이 사이트마다 하나 (book_id 컬럼으로 구분), 체크포인트는 도서마다 따로
+        self.output_path = os.path.join(self.output_dir, 'reviews_kyobo.csv')
+        self.resume = resume
+        self.checkpoint = CrawlCheckpoint(self.output_dir, job_name('kyobo', self.book_id), checkpoint_every)
+        self.seen = (SeenReviews(self.output_path, fill=legacy_fill('kyobo'), book_id=self.book_id)
+                     if incremental else None)
+        self.headless = headless
+        self.throttle = throttle or Throttle(min_interval)
+        self.pages = 0
+        self.sink = sink
+        self.metrics = CrawlMetrics('kyobo')
+        self.cache = cache
+        self.driver: Optional[WebDriver] = None
+
+    @property
+    def _replaying(self) -> bool:
+        return self.cache is not None and self.cache.replaying
+
+    @property
+    def collected(self) -> int:
+        """
+        이번 실행에서 수집한 리뷰 수
+        """
+        return self.sink.written if self.sink is not None else len(self.reviews)
 
     def start_browser(self) -> None:
         """
@@ -38,7 +98,11 @@ class KyoboCrawler(BaseCrawler):
         """
         
         chrome_options = Options()
-        chrome_options.add_experimental_option("detach", True)
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1920,1080")
+        else:
+            chrome_options.add_experimental_option("detach", True)
         chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
 
         self.driver = webdriver.Chrome(
@@ -48,15 +112,8 @@ class KyoboCrawler(BaseCrawler):
 
         self.logger.info("교보문고 브라우저 실행 완료")
 
-    def scrape_reviews(self) -> None:
-        """
-        교보문고 리뷰 페이지에서 리뷰 텍스트, 평점, 날짜를 수집하는 메소드
-
-        - 각 리뷰는 (리뷰 내용, 평점, 날짜)의 형태로 self.reviews에 저장됨
-        - 10페이지 단위로 진행 로그를 출력하고, 마지막 페이지에 도달하면 종료됨
-        - 리뷰에 포함된 이모지 및 일부 특수 문자는 제거됨
-        """
-
+    def _open_review_section(self) -> None:
+        # 상품 페이지를 열고 리뷰 섹션으로 스크롤한 뒤 첫 리뷰가 나타날 때까지 대기
         self.start_browser()
 
         self.driver.get(self.base_url)
@@ -64,93 +121,200 @@ class KyoboCrawler(BaseCrawler):
             self.driver.maximize_window()
         except:
             pass
-        time.sleep(1)
 
-        review_section = self.driver.find_element(By.ID, "scrollSpyProdReview")
+        review_section = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.ID, "scrollSpyProdReview"))
+        )
         self.driver.execute_script("arguments[0].scrollIntoView();", review_section)
         self.logger.info("리뷰 섹션 스크롤 완료")
-        time.sleep(1)
+        # 리뷰 목록은 스크롤한 뒤 AJAX로 붙으므로 첫 리뷰가 나타날 때까지 대기
+        try:
+            with self.metrics.timed("wait"):
+                WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "comment_item"))
+                )
+        except TimeoutException:
+            self.logger.warning("리뷰 목록이 나타나지 않음")
+
+    def _review_list_html(self, page: int) -> str:
+        """
+        현재 페이지 리뷰 목록(.comment_item들)의 HTML을 반환하는 메소드
+
+        record 모드면 "page=N" 상태로 캐시에 저장하고, replay 모드면 브라우저 대신 캐시에서 꺼냄
+        """
+        state = f"page={page}"
+        if self._replaying:
+            with self.metrics.timed("fetch"):
+                return self.cache.html(self.base_url, state)
+        html = self.driver.execute_script(REVIEW_LIST_JS)
+        if self.cache is not None:
+            self.cache.save(self.base_url, state, html)
+        return html
+
+    def parse_review_page(self, html: str, page: int = 0) -> List[list]:
+        """
+        리뷰 목록 HTML에서 [리뷰 내용, 평점, 날짜, 도서 ID] 목록을 추출하는 메소드
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        page_reviews = []
+        for item in soup.select(".comment_item"):
+            try:
+                # reviwe
+                review = item.select_one(".comment_text").get_text("\n", strip=True)
+                review = remove_emoji(review)
+
+                # rating
+                style = item.select_one(".filled-stars").get("style")
+                if style is None:
+                    self.logger.warning("스타일 속성 없음. 리뷰 건너뜀")
+                    continue
+                percent = float(re.search(r"([\d.]+)%", style).group(1))
+                rating = round(percent / 25)
+
+                # date
+                info_texts = [span.get_text(strip=True) for span in item.select(".info_item")]
+                date = next((text for text in info_texts if "." in text and len(text) == 10), "날짜없음")
 
-        def remove_emoji(text: str) -> str:
-            emoji_pattern = re.compile(
-                "["
-                "\U00010000-\U0010FFFF"
-                "]+",
-                flags=re.UNICODE,
-            )
-            return emoji_pattern.sub(r'', text) 
+                page_reviews.append([review, rating, date, self.book_id])
+
+            except Exception as e:
+                self.logger.warning(f"{page}페이지에서 리뷰 추출 실패: {e}")
+        return page_reviews
+
+    def scrape_reviews(self) -> None:
+        """
+        교보문고 리뷰 페이지에서 리뷰 텍스트, 평점, 날짜를 수집하는 메소드
+
+        - 각 리뷰는 (리뷰 내용, 평점, 날짜)의 형태로 self.reviews에 저장됨
+        - 10페이지 단위로 진행 로그를 출력하고, 마지막 페이지에 도달하면 종료됨
+        - 리뷰에 포함된 이모지 및 일부 특수 문자는 제거됨
+        - 체크포인트에서 이어서 수집하면 저장된 페이지까지는 파싱 없이 다음 버튼만 눌러 이동함
+          (그 페이지까지 가지 못하면 체크포인트를 남긴 채 ResumeError 발생)
+        - 증분 수집이면 한 페이지의 리뷰가 모두 기존 CSV에 있을 때 종료됨
+        - sink가 있으면 페이지마다 리뷰를 sink로 바로 내보냄
+        - 리뷰 목록은 한 번에 HTML로 가져와 BeautifulSoup으로 파싱함 (캐시에 저장/재현할 수 있도록)
+        """
+
+        if not self._replaying:
+            self._open_review_section()
 
         page = 1
+        state = self.checkpoint.load() if self.resume else None
+        if state is not None:
+            if self.sink is not None:
+                write_rows(self.sink, state["rows"], self.OUTPUT_COLUMNS)
+            else:
+                self.reviews = state["rows"]
+            self.logger.info(f"체크포인트에서 이어서 수집: {state['cursor']}페이지까지 {len(state['rows'])}건 복원")
+            while page <= state["cursor"]:
+                if not self._go_next_page(page):
+                    raise ResumeError(f"Could not reach checkpoint page {state['cursor'] + 1} (stopped at page {page}); "
+                                      f"the checkpoint is kept for the next resume")
+                page += 1
+
         while True:
 
             if page % 10 == 0:
                 self.logger.info(f"{page}페이지 리뷰 수집 중...")
-            review_items = self.driver.find_elements(By.CLASS_NAME, "comment_item")
-
-            for item in review_items:
-                try:
-                    # reviwe
-                    review = item.find_element(By.CLASS_NAME, "comment_text").text
-                    review = remove_emoji(review)
-                    
-                    # rating
-                    style = item.find_element(By.CLASS_NAME, "filled-stars").get_attribute("style")
-                    if style is None:
-                        self.logger.warning("스타일 속성 없음. 리뷰 건너뜀")
-                        continue
-                    percent = int(style.split(":")[1].replace("%;", "").strip())
-                    rating = round(percent / 25)
-
-                    # date
-                    info_items = item.find_elements(By.CLASS_NAME, "info_item")
-                    date = next(
-                        (span.text for span in info_items if "." in span.text and len(span.text.strip()) == 10),
-                        "날짜없음"
-                    )
+            html = self._review_list_html(page)
+            self.pages += 1
+            with self.metrics.timed("parse"):
+                page_reviews = self.parse_review_page(html, page)
 
-                    self.reviews.append([review, rating, date])
-
-                except Exception as e:
-                    self.logger.warning(f"{page}페이지에서 리뷰 추출 실패: {e}")
+            if self.seen is not None and self.seen.all_seen([r[0] for r in page_reviews], [r[2] for r in page_reviews]):
+                self.logger.info(f"{page}페이지의 리뷰가 모두 기존 CSV에 있어 종료 (증분 수집)")
+                break
+            if self.sink is not None:
+                write_rows(self.sink, page_reviews, self.OUTPUT_COLUMNS, self.seen)
+            else:
+                self.reviews.extend(page_reviews)
+            self.checkpoint.step(page, self.reviews, self.sink)
 
             # 다음 페이지
-            try:
-                wait = WebDriverWait(self.driver, 10)
+            if not self._go_next_page(page):
+                break
+            page += 1
 
-                try:
-                    blocker = self.driver.find_element(By.CLASS_NAME, "right_area")
-                    self.driver.execute_script("arguments[0].style.display='none';", blocker)
-                except:
-                    pass 
+    def _first_review_text(self) -> str:
+        # 현재 페이지 첫 리뷰의 본문 (페이지가 바뀌었는지 확인하는 용도, 없으면 빈 문자열)
+        return self.driver.execute_script(
+            "var el = document.querySelector('.comment_item .comment_text');"
+            "return el ? el.textContent : '';"
+        )
 
-                next_button = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "btn_page.next")))
+    def _go_next_page(self, page: int) -> bool:
+        """
+        page 페이지에서 다음 페이지 버튼을 누르는 메소드 (마지막 페이지이거나 넘기지 못하면 False)
 
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                time.sleep(0.3)
+        고정 시간 대신 첫 리뷰의 본문이 바뀔 때까지(최대 10초) 기다린다.
+        replay 모드면 다음 페이지가 캐시에 있는지만 확인한다.
+        """
+        if self._replaying:
+            return self.cache.has(self.base_url, f"page={page + 1}")
+        try:
+            wait = WebDriverWait(self.driver, 10, poll_frequency=0.1)
+
+            try:
+                blocker = self.driver.find_element(By.CLASS_NAME, "right_area")
+                self.driver.execute_script("arguments[0].style.display='none';", blocker)
+            except:
+                pass 
+
+            next_button = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "btn_page.next")))
 
-                if next_button.get_attribute("disabled") is not None:
-                    self.logger.info("마지막 페이지 도달")
-                    break
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
 
+            if next_button.get_attribute("disabled") is not None:
+                self.logger.info("마지막 페이지 도달")
+                return False
+
+            before = self._first_review_text()
+            self.metrics.record("throttle", self.throttle.wait())
+            with self.metrics.timed("fetch"):
                 self.driver.execute_script("arguments[0].click();", next_button)
-                page += 1
-                time.sleep(1)
+            try:
+                with self.metrics.timed("wait"):
+                    WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                        lambda driver: self._first_review_text() != before
+                    )
+            except TimeoutException:
+                self.logger.warning("다음 페이지 리뷰가 10초 안에 바뀌지 않음")
+            return True
 
-            except Exception as e:
-                self.logger.warning(f"페이지 넘기기 실패: {e}")
-                break
+        except Exception as e:
+            self.logger.warning(f"페이지 넘기기 실패: {e}")
+            return False
 
     def save_to_database(self) -> None:
         """
-        스크랩한 리뷰를 csv 파일로 저장하는 메소드
+        스크랩한 리뷰를 csv 파일로 저장하는 메소드 (증분 수집이면 기존 리뷰를 뒤에 이어붙임)
+
+        다른 도서의 행은 그대로 두고 이 도서의 행만 교체함
+
+        sink로 내보낸 경우 남은 리뷰만 내보내고 닫음
         """
 
-        file_path = os.path.join(self.output_dir, 'reviews_kyobo.csv')
+        if self.sink is not None:
+            self.sink.close()
+            self.checkpoint.clear()
+            self.logger.info(f"리뷰 데이터 {self.sink.written}건 출력 완료")
+            self._quit()
+            return
+
+        file_path = self.output_path
+        columns = self.OUTPUT_COLUMNS
+        rows = self.seen.merge(self.reviews, columns) if self.seen is not None else self.reviews
+
+        total = rewrite_csv(file_path, columns, rows, fill=legacy_fill('kyobo'),
+                            drop=lambda row: row[BOOK_ID_COLUMN] == self.book_id)
+        self.checkpoint.clear()
 
-        df = pd.DataFrame(self.reviews, columns=["review", "rating", "date"])
-        df.to_csv(file_path, encoding="utf-8-sig", index=False)
+        self.logger.info(f"리뷰 데이터 {len(rows)}건 저장 완료: {file_path} (신규 {len(self.reviews)}건, 전체 {total}건)")
 
-        self.logger.info(f"리뷰 데이터 {len(df)}건 저장 완료: {file_path}")
+        self._quit()
 
-        self.driver.quit()
+    def _quit(self) -> None:
+        # replay 모드에서는 브라우저를 띄우지 않음
+        if self.driver is not None:
+            self.driver.quit()
 
@@ -1,9 +1,20 @@
-from argparse import ArgumentParser
-from typing import Dict, Type
+import multiprocessing
+import os
+import time
+import traceback
+from argparse import ArgumentParser, ArgumentTypeError
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Type
 from review_analysis.crawling.base_crawler import BaseCrawler
 from review_analysis.crawling.kyobo_crawler import KyoboCrawler
 from review_analysis.crawling.aladin_crawler import AladinCrawler
 from review_analysis.crawling.yes24_crawler import Yes24Crawler
+from review_analysis.crawling.sinks import SINK_KINDS, open_sink
+from review_analysis.crawling.books import DEFAULT_BOOK_IDS, CrawlJob, job_name, read_jobs
+from review_analysis.crawling.politeness import Throttle
+from review_analysis.crawling.scheduler import HOST_CONCURRENCY, CrawlScheduler
+from review_analysis.crawling.metrics import write_metrics_report
+from review_analysis.crawling.page_cache import CACHE_DIR, CACHE_MODES, PageCache
 
 # 모든 크롤링 클래스를 예시 형식으로 적어주세요. 
 CRAWLER_CLASSES: Dict[str, Type[BaseCrawler]] = {
@@ -12,6 +23,19 @@ CRAWLER_CLASSES: Dict[str, Type[BaseCrawler]] = {
     "aladin": AladinCrawler
 }
 
+# 사이트별 페이지 요청(페이지 이동/더보기 클릭/HTTP 요청) 사이 최소 간격(초)
+POLITENESS: Dict[str, float] = {
+    "kyobo": 1.0,
+    "yes24": 0.2,
+    "aladin": 1.0,
+}
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def create_parser() -> ArgumentParser:
     parser = ArgumentParser()
     parser.add_argument('-o', '--output_dir', type=str, required=True, help="Output file directory. Example: ../../database")
@@ -19,24 +43,204 @@ def create_parser() -> ArgumentParser:
                         help=f"Which crawler to use. Choices: {', '.join(CRAWLER_CLASSES.keys())}")
     parser.add_argument('-a', '--all', action='store_true', 
                         help="Run all crawlers. Default to False.")    
+    parser.add_argument('--http', action='store_true',
+                        help="Fetch YES24 review pages with a pooled HTTP client instead of Selenium.")
+    parser.add_argument('--concurrency', type=int, required=False, default=8,
+                        help="Concurrent requests in --http mode. Default to 8.")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue from the last checkpoint in <output_dir>/.crawl_state if one exists.")
+    parser.add_argument('-i', '--incremental', action='store_true',
+                        help="Stop once a page only has reviews already in the output CSV and merge new ones in front.")
+    parser.add_argument('--checkpoint_every', type=int, required=False, default=10,
+                        help="Save a checkpoint every N pages (load-more clicks for aladin). Default to 10.")
+    parser.add_argument('-j', '--jobs', type=int, required=False, default=1,
+                        help="With --all, run up to N crawlers at once, each in its own process with a headless browser. "
+                             "With --jobs_file, run up to N jobs at once in threads. "
+                             "This is also the cap on live browsers. Default to 1.")
+    parser.add_argument('--min_interval', type=float, required=False, default=None,
+                        help="Minimum seconds between page requests to one site. Default to the per-site POLITENESS values.")
+    parser.add_argument('--headless', action='store_true',
+                        help="Run browsers headless. Always on with --jobs > 1.")
+    parser.add_argument('--sink', type=str, required=False, default=None, choices=SINK_KINDS,
+                        help="Write rows as each page is scraped instead of holding them until the end. "
+                             "csv appends to <output_dir>/reviews_<site>.csv, mongo inserts into the <site> collection. "
+                             "With --resume/--incremental the existing output is appended to; otherwise only the crawled "
+                             "book's rows are replaced.")
+    parser.add_argument('--cache_mode', type=str, required=False, default=None, choices=CACHE_MODES,
+                        help="record: save every fetched page to the page cache. "
+                             "replay: crawl from the page cache only, without a browser or network access.")
+    parser.add_argument('--cache_dir', type=str, required=False, default=None,
+                        help=f"Page cache directory. Default to <output_dir>/{CACHE_DIR}.")
+    parser.add_argument('--jobs_file', type=str, required=False, default=None,
+                        help="CSV with a 'site,book_id' header. Crawl every listed book with a shared per-site rate limit; "
+                             "every book of a site goes to the same <output_dir>/reviews_<site>.csv (or <site> collection) "
+                             "and every row carries its book_id.")
+    parser.add_argument('--per_host', type=positive_int, required=False, default=None,
+                        help=f"With --jobs_file, run at most N jobs per site at once. Default to {HOST_CONCURRENCY}.")
+    parser.add_argument('--metrics', type=str, required=False, default=None,
+                        help="Write per-site results with per-page throttle/fetch/wait/parse latency percentiles to this JSON file.")
     return parser
 
+def min_interval(crawler_name: str, args) -> float:
+    return args.min_interval if args.min_interval is not None else POLITENESS[crawler_name]
+
+def build_crawler(crawler_name: str, args, book_id: Optional[str] = None, throttle: Optional[Throttle] = None) -> BaseCrawler:
+    options = dict(resume=args.resume, incremental=args.incremental, checkpoint_every=args.checkpoint_every,
+                   min_interval=min_interval(crawler_name, args), book_id=book_id, throttle=throttle)
+    if args.cache_mode is not None:
+        options["cache"] = PageCache(args.cache_dir or os.path.join(args.output_dir, CACHE_DIR), args.cache_mode)
+    if args.sink is not None:
+        # 출력 파일/DB 연결은 크롤러를 실행하는 프로세스에서 연다
+        # 도서가 여러 권이어도 사이트 파일/컬렉션 하나에 쓰고, 이 도서의 행/문서만 교체함
+        csv_path = os.path.join(args.output_dir, f"reviews_{crawler_name}.csv")
+        options["sink"] = open_sink(args.sink, crawler_name, csv_path, CRAWLER_CLASSES[crawler_name].OUTPUT_COLUMNS,
+                                    append=args.resume or args.incremental,
+                                    book_id=book_id or DEFAULT_BOOK_IDS[crawler_name])
+    if crawler_name == "yes24":
+        # YES24는 항상 headless로 실행
+        if args.http:
+            return Yes24Crawler(args.output_dir, fetch_mode="http", concurrency=args.concurrency, **options)
+        return Yes24Crawler(args.output_dir, **options)
+    return CRAWLER_CLASSES[crawler_name](args.output_dir, headless=args.headless, **options)
+
+def run_crawler(crawler_name: str, args, book_id: Optional[str] = None,
+                throttle: Optional[Throttle] = None) -> Dict[str, Any]:
+    """
+    크롤러 하나를 실행하고 저장까지 마친 뒤 {"pages", "rows", "seconds", "metrics"}를 반환하는 함수
+    (동시 실행 시 작업 프로세스 또는 스케줄러 스레드에서 실행됨)
+
+    Parameters:
+    - crawler_name (str): 사이트 이름
+    - book_id (Optional[str]): 수집할 도서 ID (None이면 기본 도서)
+    - throttle (Optional[Throttle]): 같은 사이트 작업끼리 함께 쓸 요청 간격 제한
+    """
+    started = time.perf_counter()
+    crawler = build_crawler(crawler_name, args, book_id, throttle)
+    try:
+        crawler.scrape_reviews()
+        crawler.save_to_database()
+        if crawler.cache is not None:
+            crawler.logger.info(f"페이지 캐시: {crawler.cache.stats()}")
+    finally:
+        # 작업 프로세스가 끝나도 브라우저가 남지 않도록 정리 (이미 종료된 경우는 무시)
+        driver = getattr(crawler, "driver", None)
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    return {"pages": crawler.pages, "rows": crawler.collected, "seconds": time.perf_counter() - started,
+            "metrics": crawler.metrics.summary()}
+
+def run_crawlers(crawler_names: List[str], args) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 사이트를 크롤링하고 사이트별 결과를 반환하는 함수
+
+    args.jobs가 2 이상이면 사이트마다 별도 프로세스(spawn)에서 headless 브라우저로 동시에 실행하며,
+    동시에 떠 있는 브라우저 수는 args.jobs개를 넘지 않는다. 한 사이트가 실패해도 나머지는 계속 진행한다.
+
+    Returns:
+    - Dict[str, Dict[str, Any]]: 사이트 → {"status", "pages", "rows", "seconds", "metrics", "error"}
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def record(crawler_name: str, stats: Optional[Dict[str, Any]] = None, error: Optional[BaseException] = None,
+               seconds: float = 0.0) -> None:
+        if error is None:
+            results[crawler_name] = {"status": "succeeded", **stats, "error": None}
+            print(f"✅ [{crawler_name}] 완료: {stats['pages']}페이지, {stats['rows']}건 ({stats['seconds']:.1f}s)")
+        else:
+            results[crawler_name] = {"status": "failed", "pages": None, "rows": None, "seconds": seconds,
+                                     "metrics": None, "error": f"{type(error).__name__}: {error}"}
+            print(f"⚠️ [{crawler_name}] 실패: {results[crawler_name]['error']}")
+
+    if args.jobs <= 1 or len(crawler_names) <= 1:
+        for crawler_name in crawler_names:
+            started = time.perf_counter()
+            try:
+                record(crawler_name, run_crawler(crawler_name, args))
+            except Exception as e:
+                traceback.print_exc()
+                record(crawler_name, error=e, seconds=time.perf_counter() - started)
+        return results
+
+    args.headless = True
+    submitted = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(args.jobs, len(crawler_names)), mp_context=context) as executor:
+        futures = {executor.submit(run_crawler, crawler_name, args): crawler_name for crawler_name in crawler_names}
+        for future in as_completed(futures):
+            crawler_name = futures[future]
+            try:
+                record(crawler_name, future.result())
+            except Exception as e:
+                record(crawler_name, error=e, seconds=time.perf_counter() - submitted)
+    return {crawler_name: results[crawler_name] for crawler_name in crawler_names}
+
+def run_jobs(jobs: List[CrawlJob], args) -> Dict[str, Dict[str, Any]]:
+    """
+    (사이트, 도서 ID) 작업들을 CrawlScheduler로 실행하고 작업별 결과를 반환하는 함수
+
+    전체 동시 작업 수는 args.jobs, 사이트별 동시 작업 수는 args.per_host(없으면 HOST_CONCURRENCY)로 제한하고,
+    같은 사이트의 작업은 요청 간격 제한(min_interval / POLITENESS)을 함께 쓴다.
+
+    Returns:
+    - Dict[str, Dict[str, Any]]: 작업 이름(사이트 또는 "사이트_도서 ID") → {"status", "pages", "rows", "seconds", "metrics", "error"}
+    """
+    if args.jobs > 1:
+        args.headless = True
+    sites = {job.site for job in jobs}
+    host_concurrency = HOST_CONCURRENCY if args.per_host is None else {site: args.per_host for site in sites}
+    scheduler = CrawlScheduler(
+        lambda job, throttle: run_crawler(job.site, args, book_id=job.book_id, throttle=throttle),
+        max_workers=args.jobs,
+        host_concurrency=host_concurrency,
+        host_intervals={site: min_interval(site, args) for site in sites},
+    )
+
+    def report(job: CrawlJob, result: Dict[str, Any]) -> None:
+        name = job_name(job.site, job.book_id)
+        if result["status"] == "succeeded":
+            print(f"✅ [{name}] 완료: {result['pages']}페이지, {result['rows']}건 ({result['seconds']:.1f}s)")
+        else:
+            print(f"⚠️ [{name}] 실패: {result['error']}")
+
+    results = scheduler.run(jobs, on_done=report)
+    empty = {"pages": None, "rows": None, "metrics": None}
+    return {job_name(job.site, job.book_id): {**empty, **result} for job, result in results.items()}
+
+def print_summary(results: Dict[str, Dict[str, Any]]) -> None:
+    width = max([8] + [len(name) + 2 for name in results])
+    print(f"{'site':<{width}}{'status':<11}{'pages':>7}{'rows':>8}{'seconds':>9}  error")
+    for crawler_name, result in results.items():
+        pages = "-" if result["pages"] is None else result["pages"]
+        rows = "-" if result["rows"] is None else result["rows"]
+        print(f"{crawler_name:<{width}}{result['status']:<11}{pages:>7}{rows:>8}{result['seconds']:>9.1f}  {result['error'] or ''}")
+
+    # 단계별 페이지 소요 시간 (어디서 시간이 쓰였는지 확인용)
+    print(f"\n{'site':<{width}}{'phase':<10}{'count':>7}{'total_s':>9}{'p50_ms':>9}{'p95_ms':>9}{'max_ms':>9}")
+    for crawler_name, result in results.items():
+        for phase, stats in ((result.get("metrics") or {}).get("phases") or {}).items():
+            print(f"{crawler_name:<{width}}{phase:<10}{stats['count']:>7}{stats['total_s']:>9.2f}"
+                  f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['max_ms']:>9.1f}")
+
 if __name__ == "__main__":
     parser = create_parser()
     args = parser.parse_args()
 
-    if args.all: 
-        for crawler_name in CRAWLER_CLASSES.keys():
-            Crawler_class = CRAWLER_CLASSES[crawler_name]
-            crawler = Crawler_class(args.output_dir)
-            crawler.scrape_reviews()
-            crawler.save_to_database()
-     
-    elif args.crawler:
-        Crawler_class = CRAWLER_CLASSES[args.crawler]
-        crawler = Crawler_class(args.output_dir)
-        crawler.scrape_reviews()
-        crawler.save_to_database()
-    
+    if args.jobs_file:
+        results = run_jobs(read_jobs(args.jobs_file, CRAWLER_CLASSES.keys()), args)
     else:
-        raise ValueError("No crawlers.")
\ No newline at end of file
+        if args.all: 
+            crawler_names = list(CRAWLER_CLASSES.keys())
+        elif args.crawler:
+            crawler_names = [args.crawler]
+        else:
+            raise ValueError("No crawlers.")
+        results = run_crawlers(crawler_names, args)
+    print_summary(results)
+    if args.metrics:
+        write_metrics_report(results, args.metrics)
+        print(f"✅ 크롤링 지표 저장: {args.metrics}")
+    if any(result["status"] == "failed" for result in results.values()):
+        raise SystemExit(1)
\ No newline at end of file
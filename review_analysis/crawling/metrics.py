@@ -0,0 +1,70 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from utils.stats import percentile
+
+# 페이지 하나를 수집하는 단계
+# - throttle: 요청 간격(politeness)을 지키느라 기다린 시간
+# - fetch: 페이지 요청/이동/더보기 클릭
+# - wait: 요청 후 리뷰가 화면에 나타날 때까지 기다린 시간
+# - parse: HTML에서 리뷰를 추출한 시간
+PHASES = ("throttle", "fetch", "wait", "parse")
+
+class CrawlMetrics:
+    """
+    크롤러의 페이지별 단계 소요 시간을 모아 백분위 요약을 만드는 클래스
+
+    여러 스레드(HTTP 병렬 수집)가 함께 기록해도 되며, summary()는 JSON으로 저장할 수 있는 dict를 반환한다.
+    """
+
+    def __init__(self, site_name: str):
+        self.site_name = site_name
+        self.samples: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self.samples.setdefault(phase, []).append(seconds)
+
+    @contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        단계별 {"count", "total_s", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"} 요약을 반환하는 메서드
+        (기록이 없는 단계는 빠짐)
+        """
+        phases: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            samples = {phase: sorted(values) for phase, values in self.samples.items() if values}
+        for phase, values in samples.items():
+            total = sum(values)
+            phases[phase] = {
+                "count": len(values),
+                "total_s": round(total, 3),
+                "mean_ms": round(total / len(values) * 1000, 1),
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+                "p99_ms": round(percentile(values, 99) * 1000, 1),
+                "max_ms": round(values[-1] * 1000, 1),
+            }
+        return {"site": self.site_name, "phases": phases}
+
+def write_metrics_report(results: Dict[str, Dict[str, Any]], path: str) -> None:
+    """
+    사이트별 크롤링 결과(run_crawlers의 반환값, 단계별 요약 포함)를 JSON 파일로 저장하는 함수
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
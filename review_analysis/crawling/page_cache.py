@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+CACHE_DIR = ".page_cache"
+CACHE_MODES = ("record", "replay")
+
+class CacheMiss(KeyError):
+    """
+    replay 모드에서 캐시에 없는 페이지를 요청한 경우
+    """
+
+def cache_key(url: str, state: str = "") -> str:
+    """
+    페이지 URL과 페이지 상태(교보: "page=3", 알라딘: "blocks=120" 등)로 만든 캐시 키
+    """
+    return hashlib.sha1(f"{url}\x1f{state}".encode("utf-8")).hexdigest()
+
+class PageCache:
+    """
+    크롤러가 받은 페이지 HTML을 (URL, 페이지 상태) 키로 디스크에 저장하고 다시 꺼내 쓰는 캐시
+
+    - record: 실제 사이트에서 받은 페이지를 저장 (같은 키는 덮어씀)
+    - replay: 네트워크/브라우저 없이 저장된 페이지만 사용
+    YES24처럼 페이지마다 URL이 다르면 상태는 비워 두고, 교보/알라딘처럼 한 URL에서
+    클릭으로 내용이 바뀌면 상태로 구분한다. 항목은 {cache_dir}/{키 앞 2글자}/{키}.json에 저장된다.
+    """
+
+    def __init__(self, cache_dir: str, mode: str = "record"):
+        """
+        Parameters:
+        - cache_dir (str): 캐시 디렉토리
+        - mode (str): "record" 또는 "replay"
+
+        Raises:
+        - ValueError: 지원하지 않는 mode인 경우
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unsupported cache mode: {mode}")
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _path(self, url: str, state: str) -> str:
+        key = cache_key(url, state)
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def load(self, url: str, state: str = "") -> Optional[Dict[str, Any]]:
+        """
+        저장된 항목({"url", "state", "html", ..., "saved_at"})을 반환 (없으면 None)
+        """
+        path = self._path(url, state)
+        if not os.path.exists(path):
+            self._count("misses")
+            return None
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+        self._count("hits")
+        return entry
+
+    def html(self, url: str, state: str = "") -> str:
+        """
+        저장된 페이지 HTML을 반환하는 메서드
+
+        Raises:
+        - CacheMiss: 저장된 페이지가 없는 경우
+        """
+        entry = self.load(url, state)
+        if entry is None:
+            raise CacheMiss(f"{url} [{state}]")
+        return entry["html"]
+
+    def has(self, url: str, state: str = "") -> bool:
+        return os.path.exists(self._path(url, state))
+
+    def save(self, url: str, state: str, html: str, **extra: Any) -> None:
+        """
+        페이지 HTML과 추가 정보(extra, 예: 알라딘 블록 수)를 저장하는 메서드
+        """
+        path = self._path(url, state)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 스레드마다 다른 임시 파일에 쓴 뒤 교체 (같은 페이지를 동시에 저장해도 깨지지 않음)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "state": state, "html": html, **extra, "saved_at": time.time()},
+                      f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._count("stored")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses, "stored": self.stored}
@@ -0,0 +1,30 @@
+import threading
+import time
+
+class Throttle:
+    """
+    같은 사이트로 보내는 페이지 요청(페이지 이동, 더보기 클릭, HTTP 요청) 사이의 최소 간격을 지키는 클래스
+
+    여러 스레드가 함께 써도 요청 시작 시각이 min_interval초 이상 벌어지도록 차례로 대기시킨다.
+    """
+
+    def __init__(self, min_interval: float = 0.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+        self.waited = 0.0
+
+    def wait(self) -> float:
+        """
+        직전 요청에서 min_interval초가 지날 때까지 기다리고, 기다린 시간(초)을 반환
+        """
+        if self.min_interval <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next_at - now)
+            if delay > 0:
+                time.sleep(delay)
+                self.waited += delay
+            self._next_at = max(now, self._next_at) + self.min_interval
+            return delay
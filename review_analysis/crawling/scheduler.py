@@ -0,0 +1,110 @@
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from review_analysis.crawling.books import CrawlJob
+from review_analysis.crawling.politeness import Throttle
+
+# 사이트(호스트)별 동시에 실행할 작업(=브라우저/HTTP 크롤러) 수
+HOST_CONCURRENCY: Dict[str, int] = {
+    "kyobo": 1,
+    "yes24": 2,
+    "aladin": 1,
+}
+
+JobRunner = Callable[[CrawlJob, Throttle], Dict[str, Any]]
+
+class CrawlScheduler:
+    """
+    (사이트, 도서 ID) 작업들을 스레드 풀에 나눠 실행하는 크롤링 스케줄러
+
+    - 전체 동시 작업 수는 max_workers, 사이트별 동시 작업 수는 host_concurrency로 제한
+    - 같은 사이트의 작업은 하나의 Throttle을 함께 써서, 도서가 여러 권이어도 그 사이트로 가는
+      요청 간격이 host_intervals초 이상 벌어진다
+    - 사이트를 돌아가며 작업을 꺼내므로 한 사이트 작업이 밀려 있어도 다른 사이트 작업이 함께 진행된다
+    - 한 작업이 실패해도 나머지 작업은 계속 진행한다
+    """
+
+    def __init__(self, run_job: JobRunner, max_workers: int = 4, host_concurrency: Optional[Dict[str, int]] = None,
+                 host_intervals: Optional[Dict[str, float]] = None):
+        """
+        Parameters:
+        - run_job (JobRunner): 작업 하나를 실행하고 결과 dict를 반환하는 함수 (작업, 사이트 Throttle을 받음)
+        - max_workers (int): 전체 동시 작업 수
+        - host_concurrency (Optional[Dict[str, int]]): 사이트별 동시 작업 수 (없는 사이트는 1)
+        - host_intervals (Optional[Dict[str, float]]): 사이트별 요청 사이 최소 간격(초) (없는 사이트는 0)
+
+        Raises:
+        - ValueError: 사이트별 동시 작업 수가 1보다 작을 때 (그 사이트 작업을 영영 꺼내지 못함)
+        """
+        host_concurrency = host_concurrency or HOST_CONCURRENCY
+        invalid = {site_name: limit for site_name, limit in host_concurrency.items() if limit < 1}
+        if invalid:
+            raise ValueError(f"host_concurrency must be at least 1: {invalid}")
+        self.run_job = run_job
+        self.max_workers = max(1, max_workers)
+        self.host_concurrency = host_concurrency
+        self.host_intervals = host_intervals or {}
+        self.throttles: Dict[str, Throttle] = {}
+
+    def _throttle(self, site_name: str) -> Throttle:
+        if site_name not in self.throttles:
+            self.throttles[site_name] = Throttle(self.host_intervals.get(site_name, 0.0))
+        return self.throttles[site_name]
+
+    def _run(self, job: CrawlJob) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            stats = self.run_job(job, self._throttle(job.site))
+        except Exception as e:
+            traceback.print_exc()
+            return {"status": "failed", "seconds": time.perf_counter() - started,
+                    "error": f"{type(e).__name__}: {e}"}
+        return {"status": "succeeded", **stats, "error": None}
+
+    def run(self, jobs: List[CrawlJob], on_done: Optional[Callable[[CrawlJob, Dict[str, Any]], None]] = None
+            ) -> Dict[CrawlJob, Dict[str, Any]]:
+        """
+        작업들을 실행하고 작업별 결과({"status", ..., "error"})를 작업 순서대로 반환하는 메서드
+
+        Parameters:
+        - jobs (List[CrawlJob]): 실행할 작업
+        - on_done (Optional[Callable]): 작업이 끝날 때마다 (작업, 결과)로 호출할 함수
+        """
+        pending: Dict[str, Deque[CrawlJob]] = {}
+        for job in jobs:
+            pending.setdefault(job.site, deque()).append(job)
+        for site_name in pending:
+            self._throttle(site_name)
+        active = {site_name: 0 for site_name in pending}
+        running: Dict[Future, CrawlJob] = {}
+        results: Dict[CrawlJob, Dict[str, Any]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                # 빈 자리가 있는 동안 사이트를 돌아가며 하나씩 제출
+                submitted = True
+                while submitted and len(running) < self.max_workers:
+                    submitted = False
+                    for site_name in list(pending):
+                        if len(running) >= self.max_workers:
+                            break
+                        if active[site_name] >= self.host_concurrency.get(site_name, 1):
+                            continue
+                        job = pending[site_name].popleft()
+                        if not pending[site_name]:
+                            del pending[site_name]
+                        active[site_name] += 1
+                        running[executor.submit(self._run, job)] = job
+                        submitted = True
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    active[job.site] -= 1
+                    results[job] = future.result()
+                    if on_done is not None:
+                        on_done(job, results[job])
+        return {job: results[job] for job in jobs}
@@ -0,0 +1,244 @@
+import csv
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from review_analysis.crawling.books import BOOK_ID_COLUMN, book_query, legacy_fill
+
+Row = Dict[str, Any]
+
+_file_locks: Dict[str, threading.RLock] = {}
+_file_locks_guard = threading.Lock()
+
+def file_lock(path: str) -> threading.RLock:
+    """
+    한 출력 CSV에 대한 프로세스 내 잠금 (같은 사이트의 여러 도서 작업이 스레드에서 한 파일에 함께 씀)
+    """
+    path = os.path.abspath(path)
+    with _file_locks_guard:
+        if path not in _file_locks:
+            _file_locks[path] = threading.RLock()
+        return _file_locks[path]
+
+def rewrite_csv(path: str, columns: Sequence[str], rows: Iterable[Sequence[Any]] = (),
+                fill: Optional[Dict[str, str]] = None, drop: Optional[Callable[[Row], bool]] = None,
+                encoding: str = "utf-8-sig") -> int:
+    """
+    기존 CSV를 columns 헤더로 다시 쓰고 뒤에 rows를 이어붙인 뒤 전체 행 수를 반환하는 함수
+
+    기존 행은 한 줄씩 임시 파일로 옮겨 쓴 뒤 원래 파일과 바꾸므로 파일이 커도 메모리를 쓰지 않고,
+    도중에 실패해도 기존 파일은 그대로 남는다.
+
+    Parameters:
+    - path (str): CSV 경로 (없으면 새로 만듦)
+    - columns (Sequence[str]): 새 헤더 (기존 파일에 없던 컬럼은 빈 값, 기존 파일에만 있던 컬럼은 버림)
+    - rows (Iterable[Sequence[Any]]): columns 순서로 뒤에 붙일 행
+    - fill (Optional[Dict[str, str]]): 기존 행에서 비어 있는 컬럼을 채울 값 (예: 이전 버전 출력의 book_id)
+    - drop (Optional[Callable[[Row], bool]]): True를 반환하는 기존 행은 버림 (fill을 적용한 뒤 판단)
+    - encoding (str): 출력 인코딩
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    count = 0
+    with file_lock(path):
+        with open(temp_path, "w", newline="", encoding=encoding) as out:
+            writer = csv.DictWriter(out, fieldnames=list(columns), extrasaction="ignore")
+            writer.writeheader()
+            if os.path.exists(path):
+                with open(path, newline="", encoding="utf-8-sig") as f:
+                    for row in csv.DictReader(f):
+                        for column, value in (fill or {}).items():
+                            if not row.get(column):
+                                row[column] = value
+                        if drop is not None and drop(row):
+                            continue
+                        writer.writerow(row)
+                        count += 1
+            for row in rows:
+                writer.writerow(dict(zip(columns, row)))
+                count += 1
+        os.replace(temp_path, path)
+    return count
+
+class RowSink(ABC):
+    """
+    크롤러가 페이지를 파싱할 때마다 행을 넘기는 출력 대상
+
+    행은 최대 buffer_size개까지만 메모리에 모았다가 내보내므로(flush) 수집량이 늘어도
+    메모리 사용량이 일정하다. 크롤링이 끝나면 close()로 남은 행을 내보낸다.
+    written은 지금까지 넘겨받은 행 수다.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = max(1, buffer_size)
+        self._buffer: List[Row] = []
+        self.written = 0
+
+    def __enter__(self) -> "RowSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, row: Row) -> None:
+        self._buffer.append(row)
+        self.written += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, rows: Iterable[Row]) -> None:
+        for row in rows:
+            self.write(row)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+
+    @abstractmethod
+    def _write_batch(self, rows: List[Row]) -> None:
+        pass
+
+class CsvSink(RowSink):
+    """
+    CSV 파일에 행을 이어 쓰는 출력 대상 (append=False면 처음 쓸 때 파일을 새로 만듦)
+
+    이어 쓸 기존 파일의 헤더가 columns와 다르면(예: book_id 컬럼이 생기기 전 출력) 먼저 columns
+    헤더로 파일을 다시 쓰고, 기존 행의 빈 값은 fill로 채운다.
+    drop을 주면 append=False여도 파일을 비우지 않고 drop에 해당하는 기존 행(이 작업이 다시 수집할
+    도서의 행)만 지운다. 쓰기는 경로별 잠금 안에서 하므로 여러 스레드가 한 파일에 함께 쓸 수 있다.
+    """
+
+    def __init__(self, path: str, columns: Sequence[str], append: bool = False, buffer_size: int = 100,
+                 encoding: str = "utf-8-sig", fill: Optional[Dict[str, str]] = None,
+                 drop: Optional[Callable[[Row], bool]] = None):
+        super().__init__(buffer_size)
+        self.path = path
+        self.columns = list(columns)
+        self.encoding = encoding
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with file_lock(path):
+            exists = os.path.exists(path) and os.path.getsize(path) > 0
+            if append and exists:
+                with open(path, newline="", encoding="utf-8-sig") as f:
+                    header = next(csv.reader(f), [])
+                if header != self.columns:
+                    rewrite_csv(path, self.columns, fill=fill, encoding=encoding)
+            elif drop is not None and exists:
+                rewrite_csv(path, self.columns, fill=fill, drop=drop, encoding=encoding)
+            else:
+                # 헤더는 바로 써 두어 크롤링 도중에도 파일을 읽을 수 있게 함
+                with open(path, "w", newline="", encoding=encoding) as f:
+                    csv.writer(f).writerow(self.columns)
+
+    def _write_batch(self, rows: List[Row]) -> None:
+        # 이어 쓸 때는 BOM을 다시 쓰지 않도록 utf-8로 연다
+        encoding = "utf-8" if self.encoding == "utf-8-sig" else self.encoding
+        with file_lock(self.path), open(self.path, "a", newline="", encoding=encoding) as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns, extrasaction="ignore")
+            writer.writerows(rows)
+
+class MongoSink(RowSink):
+    """
+    MongoDB 컬렉션(/review/preprocess가 읽는 mongo_db[site])에 insert_many로 행을 나눠 넣는 출력 대상
+
+    reset=True면 처음 쓰기 전에 reset_query에 맞는 문서(기본은 전체)를 지운다.
+    (CSV를 새로 쓰는 것과 같은 전체 수집 의미, 도서별 작업이면 그 도서의 문서만 지움)
+    """
+
+    def __init__(self, collection, buffer_size: int = 1000, reset: bool = False,
+                 reset_query: Optional[Dict[str, Any]] = None):
+        super().__init__(buffer_size)
+        self.collection = collection
+        if reset:
+            collection.delete_many(reset_query or {})
+
+    def _write_batch(self, rows: List[Row]) -> None:
+        # insert_many가 _id를 채워 넣으므로 복사본을 넘김
+        self.collection.insert_many([dict(row) for row in rows], ordered=False)
+
+class MultiSink(RowSink):
+    """
+    같은 행을 여러 출력 대상에 함께 쓰는 출력 대상
+    """
+
+    def __init__(self, sinks: Sequence[RowSink]):
+        super().__init__(buffer_size=1)
+        self.sinks = list(sinks)
+
+    def write(self, row: Row) -> None:
+        for sink in self.sinks:
+            sink.write(row)
+        self.written += 1
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+    def _write_batch(self, rows: List[Row]) -> None:
+        pass
+
+SINK_KINDS = ("csv", "mongo", "csv+mongo")
+
+def open_sink(kind: str, site_name: str, csv_path: str, columns: Sequence[str], append: bool = False,
+              mongo_collection=None, book_id: Optional[str] = None) -> RowSink:
+    """
+    크롤러용 출력 대상을 만드는 함수
+
+    Parameters:
+    - kind (str): "csv", "mongo", "csv+mongo"
+    - site_name (str): 사이트 이름 (MongoDB 컬렉션 이름)
+    - csv_path (str): CSV 출력 경로
+    - columns (Sequence[str]): CSV 컬럼 순서
+    - append (bool): 기존 출력에 이어 쓸지 여부 (이어서 수집/증분 수집)
+    - mongo_collection: 쓸 컬렉션 (None이면 database.mongodb_connection의 mongo_db[site_name])
+    - book_id (Optional[str]): 수집할 도서 ID. 주면 사이트 출력 중 이 도서의 행/문서만 새로 쓰고
+      다른 도서의 행/문서는 남긴다. (book_id가 없는 예전 행은 기본 도서로 봄)
+
+    Raises:
+    - ValueError: 지원하지 않는 kind인 경우
+    """
+    if kind not in SINK_KINDS:
+        raise ValueError(f"Unsupported sink: {kind}")
+    fill = legacy_fill(site_name)
+    drop = (lambda row: row.get(BOOK_ID_COLUMN) == book_id) if book_id is not None else None
+    reset_query = book_query(site_name, book_id) if book_id is not None else None
+    sinks: List[RowSink] = []
+    if "csv" in kind:
+        sinks.append(CsvSink(csv_path, columns, append=append, fill=fill, drop=drop))
+    if "mongo" in kind:
+        if mongo_collection is None:
+            # MongoDB 설정(.env)이 필요하므로 mongo 출력을 쓸 때만 임포트
+            from database.mongodb_connection import mongo_db
+            mongo_collection = mongo_db[site_name]
+        sinks.append(MongoSink(mongo_collection, reset=not append, reset_query=reset_query))
+    return sinks[0] if len(sinks) == 1 else MultiSink(sinks)
+
+def write_rows(sink: RowSink, rows: Sequence[Sequence[Any]], columns: Sequence[str], seen=None) -> int:
+    """
+    columns 순서의 행 목록을 sink에 쓰고 쓴 행 수를 반환하는 함수
+
+    Parameters:
+    - sink (RowSink): 출력 대상
+    - rows (Sequence[Sequence[Any]]): 한 페이지에서 파싱한 행
+    - columns (Sequence[str]): 행의 컬럼 순서
+    - seen (Optional[SeenReviews]): 증분 수집이면 기존 출력 리뷰 목록 (이미 있는 리뷰는 건너뜀)
+    """
+    if seen is not None:
+        review_index = columns.index(seen.review_column)
+        date_index = columns.index(seen.date_column)
+        rows = [row for row in rows if seen.is_new(row[review_index], row[date_index])]
+    sink.write_many(dict(zip(columns, row)) for row in rows)
+    return len(rows)
@@ -1,4 +1,11 @@
 from review_analysis.crawling.base_crawler import BaseCrawler
+from review_analysis.crawling.books import BOOK_ID_COLUMN, DEFAULT_BOOK_IDS, job_name, legacy_fill
+from review_analysis.crawling.checkpoint import CrawlCheckpoint, PageFetchError, SeenReviews
+from review_analysis.crawling.http_fetcher import HttpPageFetcher
+from review_analysis.crawling.metrics import CrawlMetrics
+from review_analysis.crawling.page_cache import PageCache
+from review_analysis.crawling.politeness import Throttle
+from review_analysis.crawling.sinks import RowSink, rewrite_csv, write_rows
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
@@ -6,7 +13,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from utils.logger import setup_logger
 from bs4 import BeautifulSoup
-import csv
+from typing import Optional
 import os
 
 class Yes24Crawler(BaseCrawler):
@@ -16,22 +23,84 @@ class Yes24Crawler(BaseCrawler):
     - 상품 고유 ID(goods_id)에 기반하여 YES24 도서의 한줄평을 수집합니다.
     - Selenium을 통해 AJAX 요청 페이지를 순차적으로 로드하고,
       BeautifulSoup으로 HTML을 파싱하여 리뷰 정보를 추출합니다.
+    - fetch_mode="http"이면 브라우저 없이 같은 AJAX URL을 HTTP 클라이언트로
+      여러 페이지씩 동시에 받아 같은 선택자로 파싱합니다.
     - 수집 항목: 평점, 작성일, 리뷰 내용, 공감 수
     - 수집된 데이터는 CSV 파일로 저장됩니다.
+    - checkpoint_every 페이지마다 진행 페이지와 수집 결과를 체크포인트로 저장하며,
+      resume=True면 마지막 체크포인트 다음 페이지부터 이어서 수집합니다.
+    - incremental=True면 한 페이지의 리뷰가 모두 기존 CSV에 있을 때 멈추고,
+      새 리뷰를 기존 리뷰 앞에 붙여 저장합니다.
+    - sink가 주어지면 리뷰를 모아 두지 않고 페이지마다 sink(CSV/MongoDB)로 바로 내보냅니다.
+      (증분 수집이면 기존 출력에 없는 리뷰만 뒤에 이어 씀)
+    - 페이지마다 요청/로딩 대기/파싱 시간을 metrics에 기록합니다.
+    - cache가 주어지면 받은 페이지를 URL 기준으로 저장(record)하거나, 사이트 접속 없이
+      저장된 페이지로 같은 페이지 순회/파싱을 재현(replay)합니다.
+    - book_id로 수집할 도서를 정하며, 모든 행에 도서 ID를 붙입니다.
     """
 
-    def __init__(self, output_dir: str):
+    OUTPUT_COLUMNS = ['rating', 'date', 'review', 'sympathy', BOOK_ID_COLUMN]
+    # 기본 도서가 아닌 경우의 마지막 페이지 번호 (그 전에 빈 페이지가 나오면 멈춤)
+    MAX_PAGE = 1000
+    # selenium 모드에서 이만큼 연속으로 페이지 로딩에 실패하면 마지막 페이지를 지난 것으로 보고 멈춤
+    MAX_LOAD_FAILURES = 3
+
+    def __init__(self, output_dir: str, fetch_mode: str = "selenium", concurrency: int = 8,
+                 site_url: str = "https://www.yes24.com", resume: bool = False, incremental: bool = False,
+                 checkpoint_every: int = 10, min_interval: float = 0.0, sink: Optional[RowSink] = None,
+                 cache: Optional[PageCache] = None, book_id: Optional[str] = None,
+                 throttle: Optional[Throttle] = None, max_page: Optional[int] = None):
         """
         크롤러 초기화
+
+        Parameters:
+        - output_dir (str): CSV 저장 디렉토리
+        - fetch_mode (str): "selenium"(브라우저로 한 페이지씩) 또는 "http"(HTTP 클라이언트로 병렬 수집)
+        - concurrency (int): http 모드에서 동시에 받을 페이지 수
+        - site_url (str): AJAX 요청을 보낼 사이트 주소 (테스트에서는 로컬 서버 주소)
+        - resume (bool): 체크포인트가 있으면 이어서 수집할지 여부
+        - incremental (bool): 기존 CSV에 있는 리뷰에 도달하면 멈출지 여부
+        - checkpoint_every (int): 체크포인트 저장 간격(페이지)
+        - min_interval (float): 페이지 요청 사이 최소 간격(초)
+        - sink (Optional[RowSink]): 행을 바로 내보낼 출력 대상 (None이면 모아서 save_to_database에서 CSV로 저장)
+        - cache (Optional[PageCache]): 페이지 저장/재현용 캐시
+        - book_id (Optional[str]): 상품 번호(goods_id) (None이면 기본 도서)
+        - throttle (Optional[Throttle]): 같은 사이트 작업끼리 함께 쓸 요청 간격 제한 (None이면 min_interval로 새로 만듦)
+        - max_page (Optional[int]): 마지막 페이지 번호 (None이면 기본 도서는 328, 다른 도서는 MAX_PAGE)
         """
         super().__init__(output_dir)
-        self.base_url = 'https://www.yes24.com/product/goods/13137546'
-        self.goods_id = '13137546'
-        self.max_page = 328
+        if fetch_mode not in ("selenium", "http"):
+            raise ValueError(f"Unsupported fetch mode: {fetch_mode}")
+        self.fetch_mode = fetch_mode
+        self.concurrency = concurrency
+        self.site_url = site_url.rstrip('/')
+        self.book_id = book_id or DEFAULT_BOOK_IDS['yes24']
+        self.goods_id = self.book_id
+        self.base_url = f'https://www.yes24.com/product/goods/{self.goods_id}'
+        if max_page is None:
+            max_page = 328 if self.book_id == DEFAULT_BOOK_IDS['yes24'] else self.MAX_PAGE
+        self.max_page = max_page
         self.reviews: list[list[str]] = [] 
         self.driver = None
         self.logger = setup_logger('yes24_crawler.log')
+        # 출력은 도서와 관계없이 사이트마다 하나 (book_id 컬럼으로 구분), 체크포인트는 도서마다 따로
         self.output_path = os.path.join(self.output_dir, 'reviews_yes24.csv')
+        self.resume = resume
+        self.checkpoint = CrawlCheckpoint(self.output_dir, job_name('yes24', self.book_id), checkpoint_every)
+        self.seen = (SeenReviews(self.output_path, fill=legacy_fill('yes24'), book_id=self.book_id)
+                     if incremental else None)
+        self.throttle = throttle or Throttle(min_interval)
+        self.pages = 0
+        self.sink = sink
+        self.metrics = CrawlMetrics('yes24')
+        self.cache = cache
+
+    @property
+    def collected(self) -> int:
+        """
+        이번 실행에서 수집한 리뷰 수
+        """
+        return self.sink.written if self.sink is not None else len(self.reviews)
 
     def start_browser(self):
         """
@@ -44,6 +113,63 @@ class Yes24Crawler(BaseCrawler):
         chrome_options.add_argument("start-maximized")
         self.driver = webdriver.Chrome(options=chrome_options)
 
+    def review_list_url(self, page_num: int) -> str:
+        """
+        한줄평 목록 AJAX 페이지 URL
+        """
+        return (
+            f"{self.site_url}/Product/communityModules/AwordReviewList/{self.goods_id}"
+            f"?goodsSetYn=N&sort=2&isFirstLoad=1&PageNumber={page_num}"
+        )
+
+    def parse_review_page(self, html: str) -> list[list[str]]:
+        """
+        한줄평 목록 페이지 HTML에서 [평점, 작성일, 내용, 공감 수, 도서 ID] 목록을 추출 (리뷰가 없으면 빈 리스트)
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        rows = []
+        for box in soup.select("div.cmtInfoGrp"):
+            try:
+                content = box.select_one("div.cmt_cont span.txt").text.strip()
+                rating_class = box.select_one("div.cmt_rating span.rating")["class"]
+                rating = next((c.replace("rating_", "") for c in rating_class if c.startswith("rating_")), None)
+                sympathy = box.select_one("a.btnC em.txt").text.strip()
+                date = box.select_one("div.cmt_etc em.txt_date").text.strip()
+                rows.append([rating, date, content, sympathy, self.book_id])
+            except Exception as e:
+                self.logger.warning(f"리뷰 파싱 실패: {e}")
+        return rows
+
+    def _first_page(self) -> int:
+        # 이어서 수집하는 경우 체크포인트의 수집 결과를 복원하고 다음 페이지 번호를 반환
+        state = self.checkpoint.load() if self.resume else None
+        if state is None:
+            return 1
+        if self.sink is not None:
+            # sink로 내보내는 중에 저장한 체크포인트는 행이 비어 있음 (이미 출력에 쓰였음)
+            write_rows(self.sink, state["rows"], self.OUTPUT_COLUMNS)
+        else:
+            self.reviews = state["rows"]
+        self.logger.info(f"체크포인트에서 이어서 수집: {state['cursor']} 페이지까지 {len(state['rows'])}개 복원")
+        return state["cursor"] + 1
+
+    def _add_page(self, page_num: int, rows: list[list[str]]) -> bool:
+        """
+        한 페이지의 파싱 결과를 반영하고, 수집을 멈춰야 하면 True를 반환
+        """
+        if not rows:
+            self.logger.info("리뷰 없음으로 인한 중단")
+            return True
+        if self.seen is not None and self.seen.all_seen([row[2] for row in rows], [row[1] for row in rows]):
+            self.logger.info(f"{page_num} 페이지의 리뷰가 모두 기존 CSV에 있어 중단 (증분 수집)")
+            return True
+        if self.sink is not None:
+            write_rows(self.sink, rows, self.OUTPUT_COLUMNS, self.seen)
+        else:
+            self.reviews.extend(rows)
+        self.checkpoint.step(page_num, self.reviews, self.sink)
+        return False
+
     def scrape_reviews(self):
         """
         YES24 한줄평 리뷰를 페이지 단위로 순회하며 수집
@@ -53,57 +179,100 @@ class Yes24Crawler(BaseCrawler):
         - 평점, 날짜, 내용, 공감 수를 추출하여 self.reviews 리스트에 저장
         - 리뷰가 없으면 크롤링 중단
         """
+        if self.fetch_mode == "http" or (self.cache is not None and self.cache.replaying):
+            # 재현할 때는 브라우저 없이 캐시에서 페이지를 꺼내므로 HTTP 모드와 같은 경로를 사용
+            self.scrape_reviews_http()
+            return
+
         self.start_browser()
 
-        for page_num in range(1, self.max_page + 1):
+        failures = 0
+        for page_num in range(self._first_page(), self.max_page + 1):
             self.logger.info(f"한줄평 {page_num} 페이지 로드 중...")
 
-            ajax_url = (
-                f"https://www.yes24.com/Product/communityModules/AwordReviewList/{self.goods_id}"
-                f"?goodsSetYn=N&sort=2&isFirstLoad=1&PageNumber={page_num}"
-            )
-
-            self.driver.get(ajax_url)
+            self.metrics.record("throttle", self.throttle.wait())
+            with self.metrics.timed("fetch"):
+                self.driver.get(self.review_list_url(page_num))
+            self.pages += 1
 
             try:
                 # AJAX로 리뷰가 로딩될 때까지 최대 5초 기다림
-                WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.cmtInfoGrp"))
-                )
+                with self.metrics.timed("wait"):
+                    WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.cmtInfoGrp"))
+                    )
             except Exception as e:
                 self.logger.warning(f"페이지 {page_num} 로딩 실패: {e}")
+                failures += 1
+                if failures >= self.MAX_LOAD_FAILURES:
+                    self.logger.info(f"{failures}페이지 연속 로딩 실패로 크롤링 종료")
+                    break
                 continue
+            failures = 0
 
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            review_boxes = soup.select("div.cmtInfoGrp")
-            if not review_boxes:
-                self.logger.info("리뷰 없음으로 인한 중단")
+            html = self.driver.page_source
+            if self.cache is not None:
+                self.cache.save(self.review_list_url(page_num), "", html)
+            with self.metrics.timed("parse"):
+                rows = self.parse_review_page(html)
+            if self._add_page(page_num, rows):
                 break
-
-            for box in review_boxes:
-                try:
-                    content = box.select_one("div.cmt_cont span.txt").text.strip()
-                    rating_class = box.select_one("div.cmt_rating span.rating")["class"]
-                    rating = next((c.replace("rating_", "") for c in rating_class if c.startswith("rating_")), None)
-                    sympathy = box.select_one("a.btnC em.txt").text.strip()
-                    date = box.select_one("div.cmt_etc em.txt_date").text.strip()
-                    self.reviews.append([rating, date, content, sympathy])
-                except Exception as e:
-                    self.logger.warning(f"리뷰 파싱 실패: {e}")
             
         self.driver.quit()
-        self.logger.info(f"총 {len(self.reviews)}개 리뷰 수집 완료")
+        self.logger.info(f"총 {self.collected}개 리뷰 수집 완료")
+
+    def scrape_reviews_http(self):
+        """
+        브라우저 없이 한줄평 AJAX 페이지를 concurrency개씩 동시에 받아 수집
+
+        - 커넥션 풀을 공유하는 HttpPageFetcher로 요청하며, 실패한 요청은 백오프 후 재시도
+        - 페이지 순서대로 파싱하고, 리뷰가 없는 페이지가 나오면 그 뒤 페이지는 버리고 중단
+        - 재시도 후에도 받지 못한 페이지가 있으면 직전 페이지까지 체크포인트를 저장하고 PageFetchError 발생
+          (--resume으로 그 페이지부터 다시 수집)
+        """
+        page_num = self._first_page()
+        with HttpPageFetcher(max_workers=self.concurrency, logger=self.logger, throttle=self.throttle,
+                             metrics=self.metrics, cache=self.cache) as fetcher:
+            while page_num <= self.max_page:
+                pages = range(page_num, min(page_num + self.concurrency, self.max_page + 1))
+                self.logger.info(f"한줄평 {pages[0]}~{pages[-1]} 페이지 요청 중...")
+                htmls = fetcher.fetch_many([self.review_list_url(page) for page in pages])
+                self.pages += len(pages)
+                finished = False
+                for page, html in zip(pages, htmls):
+                    if html is None:
+                        self.checkpoint.step(page - 1, self.reviews, self.sink, force=True)
+                        raise PageFetchError(f"Page {page} failed after retries; "
+                                             f"checkpoint saved at page {page - 1} for --resume")
+                    with self.metrics.timed("parse"):
+                        rows = self.parse_review_page(html)
+                    if self._add_page(page, rows):
+                        finished = True
+                        break
+                if finished:
+                    break
+                page_num += len(pages)
+            self.logger.info(f"HTTP 요청 {fetcher.requests}회 (재시도 {fetcher.retried}회)")
+        self.logger.info(f"총 {self.collected}개 리뷰 수집 완료")
 
     def save_to_database(self):
         """
         수집된 리뷰 데이터를 CSV 파일로 저장
 
-        - output_path 위치에 'reviews_yes24.csv' 파일로 저장
+        - output_path 위치에 'reviews_yes24.csv' 파일로 저장 (다른 도서의 행은 그대로 두고 이 도서의 행만 교체)
         - UTF-8-sig 인코딩으로 한글 호환 보장
+        - 증분 수집이면 새 리뷰 뒤에 기존 CSV의 리뷰를 이어서 저장
+        - 저장이 끝나면 체크포인트 삭제
+        - sink로 내보낸 경우 남은 행만 내보내고 닫음
         """
-        os.makedirs(self.output_dir, exist_ok=True)
-        with open(self.output_path, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            writer.writerow(['rating', 'date', 'review', 'sympathy'])
-            writer.writerows(self.reviews)
-        self.logger.info(f"CSV 저장 완료: {self.output_path}")
\ No newline at end of file
+        if self.sink is not None:
+            self.sink.close()
+            self.checkpoint.clear()
+            self.logger.info(f"출력 저장 완료: {self.sink.written}개 리뷰")
+            return
+        columns = self.OUTPUT_COLUMNS
+        rows = self.seen.merge(self.reviews, columns) if self.seen is not None else self.reviews
+        total = rewrite_csv(self.output_path, columns, rows, fill=legacy_fill('yes24'),
+                            drop=lambda row: row[BOOK_ID_COLUMN] == self.book_id)
+        self.checkpoint.clear()
+        self.logger.info(f"CSV 저장 완료: {self.output_path} ({len(self.reviews)}개 신규, 이 도서 {len(rows)}개, 총 {total}개)")
\ No newline at end of file
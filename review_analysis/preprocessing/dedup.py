@@ -0,0 +1,127 @@
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WHITESPACE = re.compile(r"\s+")
+
+def shingles(text: str, k: int = 3) -> List[str]:
+    """
+    공백을 하나로 합친 텍스트의 글자 k-gram 목록 (리뷰가 짧아 단어 단위보다 글자 단위가 안정적)
+    """
+    text = _WHITESPACE.sub(" ", str(text)).strip()
+    if len(text) <= k:
+        return [text] if text else []
+    return [text[i:i + k] for i in range(len(text) - k + 1)]
+
+class MinHasher:
+    """
+    글자 shingle 집합의 MinHash 서명을 계산하는 클래스
+
+    두 서명에서 값이 같은 위치의 비율이 두 shingle 집합의 Jaccard 유사도 추정값이 된다.
+    """
+
+    def __init__(self, num_perm: int = 64, k: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.k = k
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _MAX_HASH, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _MAX_HASH, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = np.array(sorted({zlib.crc32(s.encode("utf-8")) for s in shingles(text, self.k)}), dtype=np.uint64)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # (a * x + b) mod p 를 32비트로 자른 값의 최솟값 (a, x < 2^32 이므로 곱이 uint64 범위를 넘지 않음)
+        permuted = (np.outer(self._a, hashes) % _MERSENNE_PRIME + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+def _band_keys(signature: np.ndarray, bands: int) -> List[Tuple[int, bytes]]:
+    rows = len(signature) // bands
+    return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(bands)]
+
+class NearDuplicateIndex:
+    """
+    MinHash + LSH로 앞서 본 텍스트와 비슷한지 판정하는 스트리밍 인덱스
+
+    텍스트를 순서대로 add()하면서 LSH 밴드 중 하나라도 겹치는 대표 텍스트만 후보로 삼고,
+    서명으로 추정한 Jaccard 유사도가 threshold 이상이면 그 대표에 묶는다.
+    버킷에는 대표만 넣으므로 모든 쌍을 비교하지 않으며, 청크 단위로 나눠 넣어도 결과가 같다.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16, k: int = 3):
+        """
+        Parameters:
+        - threshold (float): 중복으로 볼 Jaccard 유사도 하한
+        - num_perm (int): MinHash 서명 길이 (bands로 나누어 떨어져야 함)
+        - bands (int): LSH 밴드 수. 밴드당 행 수 r = num_perm / bands 일 때 대략 (1/bands)^(1/r) 이상의
+          유사도를 가진 쌍이 후보가 된다
+        - k (int): 글자 shingle 길이
+
+        Raises:
+        - ValueError: num_perm이 bands로 나누어 떨어지지 않는 경우
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm}) must be divisible by bands({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.hasher = MinHasher(num_perm=num_perm, k=k)
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+        self._signatures: Dict[int, np.ndarray] = {}
+        self.size = 0
+
+    def add(self, text: str) -> int:
+        """
+        텍스트를 추가하고 그 텍스트가 속한 묶음의 대표 번호(추가된 순서, 0부터)를 반환하는 메서드
+        """
+        position = self.size
+        self.size += 1
+        signature = self.hasher.signature(text)
+        keys = _band_keys(signature, self.bands)
+        checked = set()
+        for key in keys:
+            for candidate in self._buckets.get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if np.mean(self._signatures[candidate] == signature) >= self.threshold:
+                    return candidate
+        self._signatures[position] = signature
+        for key in keys:
+            self._buckets[key].append(position)
+        return position
+
+    def duplicate_mask(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        텍스트들을 추가하고, 앞에 비슷한 텍스트가 있던(대표가 아닌) 위치가 True인 bool 배열을 반환하는 메서드
+        """
+        mask = []
+        for text in texts:
+            position = self.size
+            mask.append(self.add(text) != position)
+        return np.array(mask, dtype=bool)
+
+def find_near_duplicates(texts: Sequence[str], threshold: float = 0.8, **kwargs) -> List[int]:
+    """
+    비슷한 텍스트를 묶어 각 텍스트의 대표(처음 나온 텍스트) 인덱스를 반환하는 함수
+
+    Parameters:
+    - texts (Sequence[str]): 비교할 텍스트 (예: clean_review)
+    - threshold (float): 중복으로 볼 Jaccard 유사도 하한
+    - kwargs: NearDuplicateIndex의 num_perm / bands / k
+
+    Returns:
+    - List[int]: 각 텍스트가 속한 묶음의 대표 인덱스 (중복이 아니면 자기 자신)
+    """
+    index = NearDuplicateIndex(threshold=threshold, **kwargs)
+    return [index.add(text) for text in texts]
+
+def near_duplicate_mask(texts: Iterable[str], threshold: float = 0.8, **kwargs) -> np.ndarray:
+    """
+    대표가 아닌(앞에 비슷한 텍스트가 있는) 위치가 True인 bool 배열을 반환하는 함수
+    """
+    return NearDuplicateIndex(threshold=threshold, **kwargs).duplicate_mask(texts)
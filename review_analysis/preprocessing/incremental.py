@@ -0,0 +1,75 @@
+import hashlib
+import json
+import os
+from typing import Any, Iterable, List, Set
+
+import pandas as pd
+
+STATE_DIR = ".preprocess_state"
+
+def _normalized_reviews(values: pd.Series) -> List[str]:
+    return ["" if pd.isna(value) else str(value).strip() for value in values]
+
+def _normalized_ratings(values: pd.Series) -> List[str]:
+    # "5", 5, 5.0은 같은 별점 (빈 값이 섞여 컬럼이 float가 되어도 해시가 바뀌지 않도록)
+    numbers = pd.to_numeric(values, errors="coerce")
+    return ["" if pd.isna(number) else str(int(number)) if float(number).is_integer() else str(float(number))
+            for number in numbers]
+
+def _normalized_dates(values: pd.Series) -> List[str]:
+    # "2024.10.01", "2024-10-01", datetime은 같은 날짜. 날짜로 읽을 수 없는 값은 공백만 제거해 그대로 사용
+    parsed = pd.to_datetime(values, errors="coerce", format="mixed")
+    return [
+        date.strftime("%Y-%m-%d") if not pd.isna(date) else "" if pd.isna(raw) else str(raw).strip()
+        for raw, date in zip(values, parsed)
+    ]
+
+def normalize_book_ids(values: Iterable[Any], default: str = "") -> List[str]:
+    """
+    도서 ID를 문자열로 맞추는 함수 (빈 값은 default, 13137546.0처럼 숫자로 읽힌 값은 "13137546")
+    """
+    def normalize(value: Any) -> str:
+        if pd.isna(value) or not str(value).strip():
+            return default
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value).strip()
+
+    return [normalize(value) for value in values]
+
+def compute_review_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    원본 리뷰 행의 (review, rating, date, book_id) 값으로 안정적인 행 해시를 계산하는 함수
+
+    전처리 전 원본 값 기준이므로 같은 리뷰는 실행이 바뀌어도 같은 해시를 갖고,
+    내용/별점/날짜/도서 중 하나라도 바뀌면 다른 해시가 된다. (book_id 컬럼이 없으면 빈 값)
+    값은 정규화해서 해시하므로(리뷰 앞뒤 공백 제거, 별점은 정수, 날짜는 YYYY-MM-DD)
+    pandas가 추론한 컬럼 타입(예: 빈 별점 때문에 5 → 5.0)이나 날짜 표기가 달라도 해시는 같다.
+    """
+    def row_hash(review: str, rating: str, date: str, book_id: str) -> str:
+        key = f"{review}\x1f{rating}\x1f{date}\x1f{book_id}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    book_ids = normalize_book_ids(df['book_id']) if 'book_id' in df.columns else [""] * len(df)
+    rows = zip(_normalized_reviews(df['review']), _normalized_ratings(df['rating']), _normalized_dates(df['date']),
+               book_ids)
+    return pd.Series([row_hash(*values) for values in rows], index=df.index, dtype=object)
+
+def state_path(output_dir: str, site_name: str) -> str:
+    """
+    사이트별 처리 이력(이미 본 원본 행 해시) 파일 경로를 반환하는 함수
+    """
+    return os.path.join(output_dir, STATE_DIR, f"{site_name}.json")
+
+def load_seen_hashes(path: str) -> Set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return set(json.load(f)["hashes"])
+
+def save_seen_hashes(path: str, hashes: Iterable[str]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"hashes": sorted(hashes)}, f)
+    os.replace(tmp_path, path)
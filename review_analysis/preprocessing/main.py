@@ -1,19 +1,18 @@
 import os
 import glob
+import multiprocessing
+import time
+import traceback
 from argparse import ArgumentParser
-from typing import Dict, Type
-from review_analysis.preprocessing.base_processor import BaseDataProcessor
-from review_analysis.preprocessing.kyobo_processor import KyoboProcessor
-from review_analysis.preprocessing.yes24_processor import Yes24Processor
-from review_analysis.preprocessing.aladin_processor import AladinProcessor
-
-PREPROCESS_CLASSES: Dict[str, Type[BaseDataProcessor]] = {
-    # csv basename : 전처리 클래스(클래스명을 대문자로 적기)
-    "reviews_aladin": AladinProcessor,
-    "reviews_kyobo": KyoboProcessor,
-    "reviews_yes24": Yes24Processor
-    # "reviews_example": ExampleProcessor,
-}
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from review_analysis.preprocessing.output_format import OUTPUT_FORMATS
+from review_analysis.preprocessing.registry import PROCESSORS, get_processor_class
+from review_analysis.preprocessing.token_cache import TokenCache
+from review_analysis.preprocessing.tokenizer import DEFAULT_BACKEND, TOKENIZER_BACKENDS, tokenizer_version
+
+# csv basename : 전처리기 사이트 이름 (클래스는 registry.PROCESSORS에 등록)
+PREPROCESS_CLASSES: Dict[str, str] = {f"reviews_{site_name}": site_name for site_name in PROCESSORS}
 
 REVIEW_COLLECTIONS = glob.glob(os.path.join("database", "reviews_*.csv"))
 
@@ -24,35 +23,145 @@ def create_parser() -> ArgumentParser:
     parser.add_argument('-c', '--preprocessor', type=str, required=False, choices=PREPROCESS_CLASSES.keys(),
                         help=f"Which processor to use. Choices: {', '.join(PREPROCESS_CLASSES.keys())}")
     parser.add_argument('-a', '--all', action='store_true', help="Run all data preprocessors. Default to False.")
+    parser.add_argument('-f', '--format', type=str, required=False, default="csv", choices=OUTPUT_FORMATS,
+                        help="Output file format. parquet keeps a typed date column and categorical year_month. Default to csv.")
+    parser.add_argument('-w', '--workers', type=int, required=False, default=1,
+                        help="Number of tokenizer worker processes. 1 runs Okt serially. Default to 1.")
+    parser.add_argument('-t', '--tokenizer', type=str, required=False, default=DEFAULT_BACKEND, choices=TOKENIZER_BACKENDS.keys(),
+                        help="Morphological analyzer backend. kiwi needs no JVM. Default to $TOKENIZER_BACKEND or okt.")
+    parser.add_argument('-j', '--jobs', type=int, required=False, default=1,
+                        help="With --all, number of sites preprocessed concurrently in separate processes. Default to 1.")
+    parser.add_argument('--chunk_size', type=int, required=False, default=500,
+                        help="Reviews per tokenizer batch sent to a worker. Default to 500.")
+    parser.add_argument('--cache', type=str, required=False, default=None,
+                        help="Token cache SQLite file. Example: database/token_cache.sqlite")
+    parser.add_argument('--cache_max_entries', type=int, required=False, default=None,
+                        help="Evict least recently used cache entries beyond this size.")
+    parser.add_argument('--stream_chunksize', type=int, required=False, default=None,
+                        help="Stream the raw CSV in chunks of this many rows instead of loading it whole.")
+    parser.add_argument('-i', '--incremental', action='store_true',
+                        help="Only preprocess new or changed raw reviews and merge them into the existing output.")
+    parser.add_argument('--near_dedup', type=float, required=False, default=None,
+                        help="Drop reviews whose clean_review has MinHash Jaccard similarity >= this value to an earlier review. Example: 0.8")
+    parser.add_argument('--refit_tfidf', action='store_true',
+                        help="With --incremental, refit TF-IDF on all rows instead of updating the saved IDF.")
     return parser
 
+def run_preprocessor(csv_file: str, base_name: str, args, token_cache=None) -> Dict[str, float]:
+    preprocessor_class = get_processor_class(PREPROCESS_CLASSES[base_name])
+    preprocessor = preprocessor_class(csv_file, args.output_dir, n_jobs=args.workers, chunk_size=args.chunk_size,
+                                      token_cache=token_cache, output_format=args.format,
+                                      tokenizer_backend=args.tokenizer, near_dedup=args.near_dedup)
+    if args.incremental:
+        preprocessor.process_incremental(refit_tfidf=args.refit_tfidf)
+    elif args.stream_chunksize:
+        preprocessor.process_in_chunks(args.stream_chunksize)
+    else:
+        preprocessor.preprocess()
+        preprocessor.feature_engineering()
+        preprocessor.save_to_database()
+    return preprocessor.timings
+
+def _open_cache(args) -> Optional[TokenCache]:
+    return TokenCache(args.cache, tokenizer_version(args.tokenizer), args.cache_max_entries) if args.cache else None
+
+def _run_site(csv_file: str, base_name: str, args) -> Tuple[Dict[str, float], float]:
+    # 사이트별 작업 프로세스에서 실행. 토큰 캐시는 같은 SQLite 파일(WAL)을 각자 열어 공유한다
+    print(f"[{base_name}] 전처리 시작 (pid {os.getpid()})")
+    started = time.perf_counter()
+    token_cache = _open_cache(args)
+    try:
+        return run_preprocessor(csv_file, base_name, args, token_cache), time.perf_counter() - started
+    finally:
+        if token_cache is not None:
+            token_cache.close()
+
+def run_sites(targets: List[Tuple[str, str]], args) -> Dict[str, Dict]:
+    """
+    여러 사이트의 전처리를 실행하고 사이트별 결과를 반환하는 함수
+
+    args.jobs가 2 이상이면 사이트마다 별도 프로세스(spawn)에서 동시에 실행한다.
+    한 사이트가 실패해도 나머지 사이트는 계속 처리한다.
+
+    Parameters:
+    - targets (List[Tuple[str, str]]): (원본 csv 경로, csv basename) 목록
+    - args: create_parser()로 파싱한 인자
+
+    Returns:
+    - Dict[str, Dict]: basename → {"status", "seconds", "timings", "error"}
+    """
+    results: Dict[str, Dict] = {}
+
+    def record(base_name: str, seconds: float, timings=None, error: Optional[BaseException] = None) -> None:
+        seconds = round(seconds, 2)
+        results[base_name] = {"status": "failed" if error else "succeeded", "seconds": seconds,
+                              "timings": {stage: round(value, 2) for stage, value in (timings or {}).items()},
+                              "error": f"{type(error).__name__}: {error}" if error else None}
+        if error:
+            print(f"⚠️ [{base_name}] 실패 ({seconds}s): {results[base_name]['error']}")
+        else:
+            print(f"✅ [{base_name}] 완료 ({seconds}s) {results[base_name]['timings']}")
+
+    if args.jobs <= 1 or len(targets) <= 1:
+        token_cache = _open_cache(args)
+        try:
+            for csv_file, base_name in targets:
+                print(f"[{base_name}] 전처리 시작")
+                started = time.perf_counter()
+                try:
+                    timings = run_preprocessor(csv_file, base_name, args, token_cache)
+                except Exception as e:
+                    traceback.print_exc()
+                    record(base_name, time.perf_counter() - started, error=e)
+                else:
+                    record(base_name, time.perf_counter() - started, timings)
+        finally:
+            if token_cache is not None:
+                token_cache.close()
+        return results
+
+    # 각 사이트 프로세스 안에서도 --workers개의 토크나이저 프로세스를 띄우므로 총 프로세스 수에 주의
+    submitted = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(args.jobs, len(targets)), mp_context=context) as executor:
+        futures = {executor.submit(_run_site, csv_file, base_name, args): base_name for csv_file, base_name in targets}
+        for future in as_completed(futures):
+            base_name = futures[future]
+            try:
+                timings, seconds = future.result()
+            except Exception as e:
+                # 작업 프로세스 안에서의 소요 시간은 알 수 없으므로 제출 시점부터 잰 시간 (대기 시간 포함)
+                record(base_name, time.perf_counter() - submitted, error=e)
+            else:
+                record(base_name, seconds, timings)
+    return {base_name: results[base_name] for _, base_name in targets}
+
+def print_summary(results: Dict[str, Dict]) -> None:
+    print(f"{'site':<16}{'status':<11}{'seconds':>9}")
+    for base_name, result in results.items():
+        print(f"{base_name:<16}{result['status']:<11}{result['seconds']:>9}")
+
 if __name__ == "__main__":
     parser = create_parser()
     args = parser.parse_args()
     os.makedirs(args.output_dir, exist_ok=True)
 
     if args.all: 
+        targets = []
         for csv_file in REVIEW_COLLECTIONS:
             base_name = os.path.splitext(os.path.basename(csv_file))[0]
             if base_name in PREPROCESS_CLASSES:
-                preprocessor_class = PREPROCESS_CLASSES[base_name]
-                preprocessor = preprocessor_class(csv_file, args.output_dir)
-                preprocessor.preprocess()
-                preprocessor.feature_engineering()
-                preprocessor.save_to_database()
+                targets.append((csv_file, base_name))
     elif args.preprocessor:
         base_name = args.preprocessor
-        found = False
-        for csv_file in REVIEW_COLLECTIONS:
-            if os.path.splitext(os.path.basename(csv_file))[0] == base_name:
-                preprocessor_class = PREPROCESS_CLASSES[base_name]
-                preprocessor = preprocessor_class(csv_file, args.output_dir)
-                preprocessor.preprocess()
-                preprocessor.feature_engineering()
-                preprocessor.save_to_database()
-                found = True
-                break
-        if not found:
+        targets = [(csv_file, base_name) for csv_file in REVIEW_COLLECTIONS
+                   if os.path.splitext(os.path.basename(csv_file))[0] == base_name][:1]
+        if not targets:
             raise FileNotFoundError(f"해당 csv 파일({base_name}.csv)을 찾을 수 없습니다.")
     else:
         raise ValueError("No preocessors selected. '-a' 또는 '-c [key]' 옵션을 사용하세요.")
+
+    results = run_sites(targets, args)
+    print_summary(results)
+    if any(result["status"] == "failed" for result in results.values()):
+        raise SystemExit(1)
@@ -0,0 +1,98 @@
+import os
+from typing import Iterator, List, Optional
+
+import pandas as pd
+
+OUTPUT_FORMATS = ("csv", "parquet")
+
+def output_path(output_dir: str, site_name: str, fmt: str = "csv") -> str:
+    """
+    사이트별 전처리 결과 파일 경로를 반환하는 함수 (preprocessed_reviews_{site}.{csv|parquet})
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식: {fmt}")
+    return os.path.join(output_dir, f"preprocessed_reviews_{site_name}.{fmt}")
+
+def _typed(df: pd.DataFrame) -> pd.DataFrame:
+    # parquet에는 date를 datetime, year_month를 범주형으로 저장해 읽을 때 다시 파싱하지 않도록 함
+    typed = df.copy()
+    typed['date'] = pd.to_datetime(typed['date'])
+    typed['year_month'] = typed['year_month'].astype('category')
+    return typed
+
+def write_output(df: pd.DataFrame, path: str, fmt: str = "csv") -> None:
+    """
+    전처리 결과 DataFrame을 지정한 형식으로 저장하는 함수
+    """
+    if fmt == "parquet":
+        _typed(df).to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+def read_output(path: str, fmt: Optional[str] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    전처리 결과 파일을 읽는 함수
+
+    - parquet은 필요한 컬럼만 읽고(column projection) date/year_month 타입이 그대로 유지됨
+    - csv는 date 컬럼을 datetime으로 파싱하고, book_id는 숫자처럼 보여도 문자열로 읽어서 반환
+
+    Parameters:
+    - path (str): 결과 파일 경로
+    - fmt (Optional[str]): "csv" 또는 "parquet" (None이면 확장자로 판단)
+    - columns (Optional[List[str]]): 읽을 컬럼 목록 (None이면 전체)
+    """
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.')
+    if fmt == "parquet":
+        return pd.read_parquet(path, columns=columns)
+    df = pd.read_csv(path, usecols=columns, dtype={'book_id': str})
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'])
+    return df
+
+def iter_output_column(path: str, column: str, chunksize: int, fmt: Optional[str] = None) -> Iterator[pd.Series]:
+    """
+    결과 파일의 한 컬럼만 chunksize 행씩 나눠 읽는 제너레이터
+    """
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.')
+    if fmt == "parquet":
+        import pyarrow.parquet as pq # type: ignore
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=[column]):
+            yield batch.to_pandas()[column]
+    else:
+        for chunk in pd.read_csv(path, usecols=[column], chunksize=chunksize):
+            yield chunk[column]
+
+class ChunkedOutputWriter:
+    """
+    스트리밍 전처리 결과를 청크 단위로 이어쓰는 writer (csv 이어쓰기 / parquet row group 추가)
+    """
+
+    def __init__(self, path: str, fmt: str = "csv"):
+        self.path = path
+        self.fmt = fmt
+        self._writer = None
+        self._schema = None
+        self._first = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.fmt == "parquet":
+            import pyarrow as pa # type: ignore
+            import pyarrow.parquet as pq # type: ignore
+            table = pa.Table.from_pandas(_typed(df), preserve_index=False)
+            if self._writer is None:
+                # 청크마다 범주 수가 달라도 같은 스키마가 되도록 인덱스 타입을 고정
+                fields = [
+                    pa.field(f.name, pa.dictionary(pa.int32(), pa.string())) if f.name == 'year_month' else f
+                    for f in table.schema
+                ]
+                self._schema = pa.schema(fields)
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            self._writer.write_table(table.cast(self._schema))
+        else:
+            df.to_csv(self.path, mode='w' if self._first else 'a', header=self._first, index=False)
+        self._first = False
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,16 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+def iter_record_batches(records: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    레코드(dict) 이터러블을 batch_size개씩 묶어 리스트로 내보내는 제너레이터
+
+    MongoDB 커서처럼 한 건씩 가져오는 소스를 전체 리스트로 만들지 않고
+    전처리기에 배치 단위로 넘길 때 사용한다. (pandas 없이 동작하므로 API 임포트 시간에 영향 없음)
+    """
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,36 @@
+import importlib
+from typing import Dict, Type
+
+from review_analysis.preprocessing.base_processor import BaseDataProcessor
+
+# 사이트 이름 : "모듈 경로:클래스명"
+# 전처리기 모듈은 pandas/scikit-learn/konlpy 등 무거운 패키지를 임포트하므로
+# 실제로 해당 사이트를 처리할 때 get_processor_class()에서 임포트한다.
+PROCESSORS: Dict[str, str] = {
+    "aladin": "review_analysis.preprocessing.aladin_processor:AladinProcessor",
+    "kyobo": "review_analysis.preprocessing.kyobo_processor:KyoboProcessor",
+    "yes24": "review_analysis.preprocessing.yes24_processor:Yes24Processor",
+    # "example": "review_analysis.preprocessing.example_processor:ExampleProcessor",
+}
+
+_loaded: Dict[str, Type[BaseDataProcessor]] = {}
+
+def get_processor_class(site_name: str) -> Type[BaseDataProcessor]:
+    """
+    사이트 이름에 해당하는 전처리 클래스를 (처음 요청될 때) 임포트해서 반환하는 함수
+
+    Parameters:
+    - site_name (str): 사이트 이름. 예) "kyobo", "yes24", "aladin"
+
+    Raises:
+    - KeyError: 등록되지 않은 사이트인 경우
+
+    Returns:
+    - Type[BaseDataProcessor]: 전처리 클래스
+    """
+    if site_name not in PROCESSORS:
+        raise KeyError(f"Unsupported site: {site_name}")
+    if site_name not in _loaded:
+        module_path, class_name = PROCESSORS[site_name].split(":")
+        _loaded[site_name] = getattr(importlib.import_module(module_path), class_name)
+    return _loaded[site_name]
@@ -0,0 +1,327 @@
+from scipy import sparse # type: ignore
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+import pandas as pd
+import os
+import re
+import time
+
+from review_analysis.crawling.books import BOOK_ID_COLUMN, DEFAULT_BOOK_IDS
+from review_analysis.preprocessing.base_processor import BaseDataProcessor
+from review_analysis.preprocessing.dedup import NearDuplicateIndex
+from review_analysis.preprocessing.output_format import ChunkedOutputWriter, iter_output_column, output_path, read_output, write_output
+from review_analysis.preprocessing.incremental import compute_review_hashes, load_seen_hashes, normalize_book_ids, save_seen_hashes, state_path
+from review_analysis.preprocessing.tfidf import StreamingTfidf, TfidfFeatures, load_tfidf_features, save_tfidf_features
+from review_analysis.preprocessing.token_cache import TokenCache
+from review_analysis.preprocessing.tokenizer import create_tokenizer_pool, get_tokenizer_service, tokenize_texts
+
+# 문자열이 pyarrow 백엔드여도 파이썬 re 규칙(\u 이스케이프, 유니코드 \w)으로 동작하도록 미리 컴파일
+SPECIAL_CHARS = re.compile(r'[^\x00-\x7F\uAC00-\uD7A3\w\s]')
+
+RAW_COLUMNS = ['review', 'rating', 'date', BOOK_ID_COLUMN]
+OUTPUT_COLUMNS = ['review', 'clean_review', 'rating', 'date', 'year_month', BOOK_ID_COLUMN, 'review_hash']
+
+# 전처리 입력: 원본 CSV 경로, DataFrame, 또는 레코드 배치(DataFrame / dict 리스트)의 이터러블
+ReviewSource = Union[str, pd.DataFrame, Iterable[Union[pd.DataFrame, List[Dict[str, Any]]]]]
+
+class ReviewProcessor(BaseDataProcessor):
+    """
+    사이트별 리뷰 전처리기의 공통 파이프라인
+
+    하위 클래스는 사이트에 따라 달라지는 값만 클래스 속성으로 지정한다.
+    - site_name: 출력 파일명(preprocessed_reviews_{site_name}.csv)에 쓰이는 사이트 키
+    - display_name: 로그에 출력할 사이트 이름
+    - max_rating: 유효한 별점의 최댓값
+    - date_format: 날짜 파싱 포맷 (None이면 pandas 자동 추론)
+
+    input_path에는 원본 CSV 경로 대신 DataFrame이나 레코드 배치 이터러블(예: MongoDB 커서를
+    iter_record_batches로 묶은 것)을 넘길 수 있다. 이터러블은 한 번만 읽을 수 있으므로
+    preprocess / preprocess_incremental / process_in_chunks 중 하나만 호출해야 한다.
+    """
+
+    site_name: str = ""
+    display_name: str = ""
+    max_rating: int = 5
+    date_format: Optional[str] = None
+
+    def __init__(self, input_path: ReviewSource, output_path: str, n_jobs: int = 1, chunk_size: int = 500,
+                 token_cache: Optional[TokenCache] = None, output_format: str = "csv",
+                 tokenizer_backend: Optional[str] = None, near_dedup: Optional[float] = None):
+        super().__init__(input_path, output_path)
+        self.df = None
+        # 형태소 분석기는 인스턴스마다 띄우지 않고 백엔드별 프로세스 전역 서비스에서 빌려 씀
+        # (병렬 모드에서는 워커별 서비스 사용, token_cache는 같은 백엔드의 tokenizer_version으로 열어야 함)
+        self.tokenizer = get_tokenizer_service(tokenizer_backend)
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+        # n_jobs >= 2일 때 한 번의 실행(전체/스트리밍/증분) 동안 모든 청크/배치가 함께 쓰는 토큰화 워커 풀
+        self._executor = None
+        self.token_cache = token_cache
+        self.output_format = output_format
+        self.tfidf_matrix = None
+        # clean_review가 이 Jaccard 유사도 이상인 앞선 리뷰가 있으면 제거 (None이면 정확히 같은 리뷰도 유지)
+        self.near_dedup = near_dedup
+        # (증분 모드에서는 이번에 새로 처리하는 행끼리만 비교)
+        self._dedup_index = NearDuplicateIndex(threshold=near_dedup) if near_dedup is not None else None
+        self.near_duplicates = 0
+        # 단계별 누적 소요 시간(초): load / clean / tokenize / filter / dedup / tfidf
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] = self.timings.get(stage, 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def _tokenizer_pool(self) -> Iterator[None]:
+        """
+        n_jobs가 2 이상이면 토큰화 워커 풀을 한 번만 띄워 블록 안의 모든 clean_frame 호출이 재사용하게 하는 컨텍스트 매니저
+        (이미 열린 풀이 있으면 그대로 사용)
+        """
+        if self.n_jobs <= 1 or self._executor is not None:
+            yield
+            return
+        with create_tokenizer_pool(self.tokenizer.backend, self.n_jobs) as executor:
+            self._executor = executor
+            try:
+                yield
+            finally:
+                self._executor = None
+
+    def _input_batches(self, chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        source = self.input_path
+        if isinstance(source, str):
+            # 도서 ID는 숫자처럼 보여도 문자열로 읽음 (S000000610612 같은 ID와 섞여도 같은 타입)
+            if chunksize:
+                yield from pd.read_csv(source, chunksize=chunksize, dtype={BOOK_ID_COLUMN: str})
+            else:
+                yield pd.read_csv(source, dtype={BOOK_ID_COLUMN: str})
+        elif isinstance(source, pd.DataFrame):
+            step = chunksize or max(len(source), 1)
+            for start in range(0, len(source), step):
+                yield source.iloc[start:start + step]
+        else:
+            # 레코드 배치는 소스가 정한 크기 그대로 사용
+            for batch in source:
+                yield batch if isinstance(batch, pd.DataFrame) else pd.DataFrame.from_records(batch)
+
+    def _iter_input(self, chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        입력 소스를 DataFrame 배치로 읽는 제너레이터 (배치를 가져오는 시간은 load 단계로 집계)
+
+        book_id가 없거나 빈 행(도서 ID 컬럼이 생기기 전 출력)은 사이트 기본 도서로 채운다.
+        """
+        batches = self._input_batches(chunksize)
+        default_book_id = DEFAULT_BOOK_IDS.get(self.site_name, "")
+        while True:
+            with self._timed('load'):
+                batch = next(batches, None)
+            if batch is None:
+                return
+            book_ids = batch[BOOK_ID_COLUMN] if BOOK_ID_COLUMN in batch.columns else [None] * len(batch)
+            yield batch.assign(**{BOOK_ID_COLUMN: normalize_book_ids(book_ids, default_book_id)})
+
+    def _concat_cleaned(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        if not frames:
+            return self.clean_frame(pd.DataFrame(columns=RAW_COLUMNS))
+        return pd.concat(frames, ignore_index=True)
+
+    @property
+    def save_path(self) -> str:
+        return output_path(self.output_dir, self.site_name, self.output_format)
+
+    def clean_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        원본 리뷰 DataFrame(전체 또는 청크)에 결측치/이상치 제거와 토큰화를 적용하는 메서드
+
+        모든 단계가 행 단위로 동작하므로 청크별로 적용한 결과를 이어붙이면
+        전체에 한 번 적용한 결과와 같다. (유사 중복 제거도 청크 간에 인덱스를 유지하므로 같음)
+        """
+        with self._timed('clean'):
+            if 'review_hash' not in df.columns:
+                df = df.assign(review_hash=compute_review_hashes(df))
+            df = df.dropna(subset=['rating', 'review', 'date'])
+            df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
+            df = df[(df['rating'] >= 1) & (df['rating'] <= self.max_rating)]
+            df['date'] = pd.to_datetime(df['date'], format=self.date_format, errors='coerce')
+            df = df.dropna(subset=['date'])
+            df['review'] = df['review'].astype(str)
+            df['clean_review'] = df['review'].str.replace(SPECIAL_CHARS, '', regex=True)
+
+        with self._timed('tokenize'):
+            tokens = tokenize_texts(
+                df['clean_review'].tolist(), service=self.tokenizer,
+                n_jobs=self.n_jobs, chunk_size=self.chunk_size, cache=self.token_cache,
+                executor=self._executor,
+            )
+        with self._timed('filter'):
+            df['clean_review'] = pd.Series(tokens, index=df.index, dtype=object)
+            df = df[df['clean_review'].str.len() > 10]
+            df = df[df['clean_review'].str.len() < 100]
+        if self._dedup_index is not None:
+            with self._timed('dedup'):
+                # 인덱스가 배치 간에 유지되므로 앞선 배치의 리뷰와 비슷한 리뷰도 제거됨
+                before = len(df)
+                df = df[~self._dedup_index.duplicate_mask(df['clean_review'])]
+                self.near_duplicates += before - len(df)
+        return df
+
+    def preprocess(self):
+        print(f"{self.display_name} 데이터 전처리 시작")
+        # 배치마다 바로 정제/토큰화하므로 원본 전체를 한 번에 메모리에 올리지 않음
+        with self._tokenizer_pool():
+            self.df = self._concat_cleaned([self.clean_frame(batch) for batch in self._iter_input()])
+        if self.token_cache is not None:
+            print("토큰 캐시:", self.token_cache.stats())
+        if self._dedup_index is not None:
+            print(f"유사 중복 제거: {self.near_duplicates}건 (threshold={self.near_dedup})")
+        print(f"✅ 전처리 완료: {len(self.df)} rows")
+
+    def feature_engineering(self):
+        self.df['year_month'] = self.df['date'].dt.to_period('M').astype(str)
+        with self._timed('tfidf'):
+            # TfidfVectorizer(max_features=100)과 같은 결과이며, 저장 후 증분 갱신이 가능
+            self.tfidf = StreamingTfidf(max_features=100).partial_fit(self.df['clean_review']).finalize()
+            self.tfidf_matrix = self.tfidf.transform(self.df['clean_review'])
+        print("✅ feature engineering 완료 / TF-IDF shape:", self.tfidf_matrix.shape)
+
+    def save_to_database(self):
+        self.df = self.df[OUTPUT_COLUMNS]
+        os.makedirs(self.output_dir, exist_ok=True)
+        write_output(self.df, self.save_path, self.output_format)
+        print("✅ 저장 완료 →", self.save_path)
+        if self.tfidf_matrix is not None:
+            self.save_features(self.df['review_hash'].tolist())
+
+    def save_features(self, review_hashes) -> None:
+        """
+        TF-IDF 행렬(.npz)과 어휘/idf(.json)를 출력 디렉토리에 저장하는 메서드
+        """
+        save_tfidf_features(self.output_dir, self.site_name,
+                            TfidfFeatures(self.tfidf_matrix, self.tfidf, list(review_hashes)))
+        print("✅ TF-IDF 저장 완료 →", self.output_dir)
+
+    def process_in_chunks(self, chunksize: int = 50000) -> int:
+        """
+        원본을 chunksize 행씩 읽어 전처리/저장하는 스트리밍 모드 메서드 (레코드 배치 입력은 배치 크기 그대로)
+
+        - 청크마다 clean_frame → year_month 파생 → 출력 파일(csv/parquet)에 이어쓰기
+        - TF-IDF는 StreamingTfidf로 1차 패스에서 빈도를 누적하고,
+          저장된 출력 파일의 clean_review 컬럼만 다시 청크로 읽어 행렬을 만든다
+        - 최대 메모리는 말뭉치 크기가 아니라 청크 크기에 비례 (self.df는 채우지 않음)
+
+        Parameters:
+        - chunksize (int): 한 번에 읽을 원본 행 수
+
+        Returns:
+        - int: 저장된 행 수
+        """
+        print(f"{self.display_name} 데이터 스트리밍 전처리 시작 (chunksize={chunksize})")
+        os.makedirs(self.output_dir, exist_ok=True)
+        tfidf = StreamingTfidf(max_features=100)
+        total = 0
+        writer = ChunkedOutputWriter(self.save_path, self.output_format)
+        try:
+            with self._tokenizer_pool():
+                for i, chunk in enumerate(self._iter_input(chunksize)):
+                    chunk = self.clean_frame(chunk)
+                    chunk['year_month'] = chunk['date'].dt.to_period('M').astype(str)
+                    chunk = chunk[OUTPUT_COLUMNS]
+                    tfidf.partial_fit(chunk['clean_review'])
+                    writer.write(chunk)
+                    total += len(chunk)
+                    print(f"  청크 {i + 1}: 누적 {total} rows")
+        finally:
+            writer.close()
+        if self.token_cache is not None:
+            print("토큰 캐시:", self.token_cache.stats())
+
+        tfidf.finalize()
+        blocks = [
+            tfidf.transform(column.fillna(''))
+            for column in iter_output_column(self.save_path, 'clean_review', chunksize)
+        ]
+        self.tfidf = tfidf
+        self.tfidf_matrix = sparse.vstack(blocks).tocsr() if blocks else sparse.csr_matrix((0, len(tfidf.vocabulary_)))
+        print("✅ feature engineering 완료 / TF-IDF shape:", self.tfidf_matrix.shape)
+        print(f"✅ 저장 완료 → {self.save_path} ({total} rows)")
+        hashes = read_output(self.save_path, columns=['review_hash'])['review_hash']
+        self.save_features(hashes)
+        return total
+
+    def preprocess_incremental(self, seen_hashes: Union[Set[str], Callable[[List[str]], Set[str]]]
+                               ) -> Tuple[Set[str], Set[str]]:
+        """
+        이전에 처리한 적 없는(새로 추가되었거나 바뀐) 원본 행만 전처리하는 메서드
+
+        처리 결과는 self.df에 새/변경 행만 담기며, 기존 결과와의 병합은 호출하는 쪽에서 한다.
+
+        Parameters:
+        - seen_hashes (Union[Set[str], Callable]): 지난 실행까지 처리한 원본 행 해시, 또는
+          배치의 해시 목록을 받아 그중 이미 처리한 해시를 돌려주는 함수 (예: DB 조회).
+          함수로 주면 사라진 행 해시는 알 수 없으므로 빈 집합을 반환하고 호출하는 쪽에서 구한다.
+
+        Returns:
+        - Tuple[Set[str], Set[str]]: (현재 원본의 전체 행 해시, 원본에서 사라진 행 해시)
+        """
+        print(f"{self.display_name} 데이터 증분 전처리 시작")
+        current: Set[str] = set()
+        frames = []
+        new_rows = 0
+        with self._tokenizer_pool():
+            for raw in self._iter_input():
+                raw = raw.assign(review_hash=compute_review_hashes(raw))
+                current.update(raw['review_hash'])
+                known = seen_hashes(raw['review_hash'].tolist()) if callable(seen_hashes) else seen_hashes
+                new_raw = raw[~raw['review_hash'].isin(known)]
+                new_rows += len(new_raw)
+                frames.append(self.clean_frame(new_raw))
+        removed = set() if callable(seen_hashes) else set(seen_hashes) - current
+        self.df = self._concat_cleaned(frames)
+        print(f"✅ 증분 전처리 완료: 신규/변경 {new_rows}건 → {len(self.df)} rows, 삭제 {len(removed)}건")
+        return current, removed
+
+    def process_incremental(self, refit_tfidf: bool = False) -> None:
+        """
+        출력 CSV와 사이트별 처리 이력 파일을 기준으로 증분 전처리/병합/저장을 수행하는 메서드
+
+        - 새/변경 행만 토큰화하고, 원본에서 사라지거나 바뀐 행은 기존 출력에서 제거
+        - 기존 출력이나 처리 이력이 없거나, review_hash/book_id 컬럼이 없는 예전 형식이면 전체를 다시 처리
+        - 저장된 TF-IDF가 기존 출력과 행 순서가 맞으면 어휘를 유지한 채 idf만 갱신하고
+          기존 행은 보정, 새 행만 변환 (refit_tfidf=True면 전체 데이터로 다시 학습)
+        """
+        path = state_path(self.output_dir, self.site_name)
+        previous = None
+        # 처리 이력 없이 만들어진 출력(전체 처리 결과 등)은 어떤 원본 행을 반영했는지 알 수 없으므로 재사용하지 않음
+        if os.path.exists(self.save_path) and os.path.exists(path):
+            previous = read_output(self.save_path)
+            if 'review_hash' not in previous.columns or BOOK_ID_COLUMN not in previous.columns:
+                previous = None
+        seen = load_seen_hashes(path) if previous is not None else set()
+
+        current, removed = self.preprocess_incremental(seen)
+        if previous is None:
+            self.feature_engineering()
+            self.save_to_database()
+            save_seen_hashes(path, current)
+            return
+
+        removed_rows = previous['review_hash'].isin(removed)
+        features = None if refit_tfidf else load_tfidf_features(self.output_dir, self.site_name)
+        if features is not None and features.review_hashes == previous['review_hash'].tolist():
+            self.tfidf = features.model
+            old_idf = self.tfidf.update(self.df['clean_review'], previous.loc[removed_rows, 'clean_review'])
+            kept_matrix = self.tfidf.rescale(features.matrix[~removed_rows.to_numpy()], old_idf)
+            new_matrix = self.tfidf.transform(self.df['clean_review'])
+            self.df = pd.concat([previous[~removed_rows], self.df], ignore_index=True)
+            self.df['year_month'] = self.df['date'].dt.to_period('M').astype(str)
+            self.tfidf_matrix = sparse.vstack([kept_matrix, new_matrix]).tocsr()
+            print("✅ TF-IDF 증분 갱신 완료 / TF-IDF shape:", self.tfidf_matrix.shape)
+        else:
+            self.df = pd.concat([previous[~removed_rows], self.df], ignore_index=True)
+            self.feature_engineering()
+        self.save_to_database()
+        save_seen_hashes(path, current)
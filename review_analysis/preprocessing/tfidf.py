@@ -0,0 +1,164 @@
+import json
+import os
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+from scipy import sparse # type: ignore
+from sklearn.feature_extraction.text import CountVectorizer # type: ignore
+from sklearn.preprocessing import normalize # type: ignore
+
+def _normalize_rows(matrix: sparse.spmatrix) -> sparse.csr_matrix:
+    # sklearn normalize는 0행 입력을 거부하므로 빈 청크는 그대로 반환
+    if matrix.shape[0] == 0:
+        return sparse.csr_matrix(matrix.shape)
+    return normalize(matrix, norm="l2").tocsr()
+
+class StreamingTfidf:
+    """
+    청크 단위로 학습할 수 있는 TF-IDF
+
+    TfidfVectorizer(max_features=N)과 같은 규칙(기본 토큰 패턴, 말뭉치 전체 빈도 상위 N개 단어,
+    smooth idf, l2 정규화)을 따르되, 전체 문서를 메모리에 올리지 않고 단어별 빈도와
+    문서 빈도만 누적한다.
+
+    사용 순서: partial_fit(청크) 반복 → finalize() → transform(청크)
+    확정 후 새 문서가 들어오면 update()로 어휘는 유지한 채 idf만 갱신할 수 있다.
+    """
+
+    def __init__(self, max_features: int = 100):
+        self.max_features = max_features
+        self._analyzer = CountVectorizer().build_analyzer()
+        self.term_counts: Counter = Counter()
+        self.doc_counts: Counter = Counter()
+        self.n_docs = 0
+        self.vocabulary_: Optional[Dict[str, int]] = None
+        self.vocab_doc_counts: Optional[np.ndarray] = None
+        self.idf_: Optional[np.ndarray] = None
+
+    def partial_fit(self, docs: Iterable[str]) -> "StreamingTfidf":
+        """
+        문서 청크의 단어 빈도와 문서 빈도를 누적하는 메서드
+        """
+        for doc in docs:
+            tokens = self._analyzer(doc)
+            self.term_counts.update(tokens)
+            self.doc_counts.update(set(tokens))
+            self.n_docs += 1
+        return self
+
+    def finalize(self) -> "StreamingTfidf":
+        """
+        누적된 통계로 어휘와 idf를 확정하는 메서드
+        """
+        # 빈도가 같은 단어도 TfidfVectorizer와 같게 고르도록 사전순 정렬 후 argsort
+        all_terms = sorted(self.term_counts)
+        tfs = np.array([self.term_counts[term] for term in all_terms], dtype=np.int64)
+        terms = sorted(all_terms[i] for i in (-tfs).argsort()[:self.max_features])
+        self.vocabulary_ = {term: i for i, term in enumerate(terms)}
+        df = np.array([self.doc_counts[term] for term in terms], dtype=np.float64)
+        self.vocab_doc_counts = df
+        self._compute_idf()
+        return self
+
+    def _compute_idf(self) -> None:
+        self.idf_ = np.log((1 + self.n_docs) / (1 + self.vocab_doc_counts)) + 1
+
+    def update(self, added_docs: Iterable[str], removed_docs: Iterable[str] = ()) -> np.ndarray:
+        """
+        어휘는 그대로 두고 문서 추가/삭제에 맞춰 문서 빈도와 idf만 갱신하는 메서드
+
+        전체 이력을 다시 학습하지 않으므로 새 단어는 어휘에 들어오지 않는다.
+        어휘 자체를 갱신하려면 전체 데이터로 다시 partial_fit/finalize 해야 한다.
+
+        Returns:
+        - np.ndarray: 갱신 전 idf (기존 행렬을 rescale()로 보정할 때 사용)
+        """
+        if self.vocabulary_ is None:
+            raise ValueError("finalize()를 먼저 호출해야 합니다.")
+        old_idf = self.idf_.copy()
+        binary = CountVectorizer(vocabulary=self.vocabulary_, binary=True)
+        for docs, sign in ((list(added_docs), 1), (list(removed_docs), -1)):
+            if docs:
+                self.vocab_doc_counts = self.vocab_doc_counts + sign * np.asarray(binary.transform(docs).sum(axis=0)).ravel()
+                self.n_docs += sign * len(docs)
+        self._compute_idf()
+        return old_idf
+
+    def rescale(self, matrix: sparse.csr_matrix, old_idf: np.ndarray) -> sparse.csr_matrix:
+        """
+        이전 idf로 만든 TF-IDF 행렬을 현재 idf 기준으로 보정하는 메서드
+
+        l2 정규화는 배율에 영향을 받지 않으므로 (idf_new / idf_old)를 곱한 뒤
+        다시 정규화하면 원래 단어 빈도를 몰라도 새 idf로 계산한 것과 같아진다.
+        """
+        return _normalize_rows(matrix @ sparse.diags(self.idf_ / old_idf))
+
+    def transform(self, docs: Iterable[str]) -> sparse.csr_matrix:
+        """
+        확정된 어휘/idf로 문서 청크를 TF-IDF 행렬로 변환하는 메서드
+        """
+        if self.vocabulary_ is None:
+            raise ValueError("finalize()를 먼저 호출해야 합니다.")
+        counts = CountVectorizer(vocabulary=self.vocabulary_).transform(docs).astype(np.float64)
+        return _normalize_rows(counts @ sparse.diags(self.idf_))
+
+    def to_dict(self) -> dict:
+        return {
+            "max_features": self.max_features,
+            "n_docs": self.n_docs,
+            "vocabulary": self.vocabulary_,
+            "doc_counts": self.vocab_doc_counts.tolist(),
+            "idf": self.idf_.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StreamingTfidf":
+        model = cls(max_features=data["max_features"])
+        model.n_docs = data["n_docs"]
+        model.vocabulary_ = data["vocabulary"]
+        model.vocab_doc_counts = np.array(data["doc_counts"], dtype=np.float64)
+        model.idf_ = np.array(data["idf"], dtype=np.float64)
+        return model
+
+
+class TfidfFeatures(NamedTuple):
+    matrix: sparse.csr_matrix
+    model: StreamingTfidf
+    review_hashes: List[str]
+
+
+def tfidf_paths(output_dir: str, site_name: str):
+    """
+    사이트별 TF-IDF 행렬(.npz)과 어휘/idf 메타데이터(.json) 경로를 반환하는 함수
+    """
+    base = os.path.join(output_dir, f"tfidf_{site_name}")
+    return base + ".npz", base + ".json"
+
+
+def save_tfidf_features(output_dir: str, site_name: str, features: TfidfFeatures) -> None:
+    """
+    TF-IDF 행렬과 어휘/idf/행 키(review_hash)를 전처리 결과 옆에 저장하는 함수
+    """
+    matrix_path, meta_path = tfidf_paths(output_dir, site_name)
+    os.makedirs(output_dir, exist_ok=True)
+    sparse.save_npz(matrix_path, features.matrix.tocsr())
+    meta = features.model.to_dict()
+    meta["review_hashes"] = list(features.review_hashes)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+
+def load_tfidf_features(output_dir: str, site_name: str) -> Optional[TfidfFeatures]:
+    """
+    save_tfidf_features로 저장한 TF-IDF 결과를 불러오는 함수 (없으면 None)
+
+    Returns:
+    - Optional[TfidfFeatures]: (행렬, 학습된 StreamingTfidf, 행 순서대로의 review_hash 목록)
+    """
+    matrix_path, meta_path = tfidf_paths(output_dir, site_name)
+    if not (os.path.exists(matrix_path) and os.path.exists(meta_path)):
+        return None
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    return TfidfFeatures(sparse.load_npz(matrix_path).tocsr(), StreamingTfidf.from_dict(meta), meta["review_hashes"])
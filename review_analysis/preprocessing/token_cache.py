@@ -0,0 +1,128 @@
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+class TokenCache:
+    """
+    리뷰 텍스트 해시 → 토큰 문자열을 저장하는 SQLite 기반 토큰화 캐시
+
+    - 키는 (토크나이저/불용어 버전, 특수문자 정리를 마친 텍스트)의 sha1 해시이므로
+      불용어나 형태소 분석기가 바뀌면 기존 항목은 자연스럽게 무효화됨
+    - max_entries를 지정하면 가장 오래 사용되지 않은 항목부터 삭제하여 크기를 제한함
+    - hits / misses 로 이번 실행의 적중률을 확인할 수 있음
+    """
+
+    _BATCH = 500  # SQLite 바인딩 변수 수 제한을 넘지 않도록 나눠서 조회
+
+    def __init__(self, path: str, version: str, max_entries: Optional[int] = None):
+        """
+        캐시 파일을 열고(없으면 생성) TokenCache 인스턴스를 초기화하는 메서드
+
+        Parameters:
+        - path (str): SQLite 파일 경로
+        - version (str): 토크나이저/불용어 버전 문자열
+        - max_entries (Optional[int]): 보관할 최대 항목 수 (None이면 무제한)
+        """
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS tokens ("
+            "key TEXT PRIMARY KEY, tokens TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tokens_last_used ON tokens(last_used)")
+        self.conn.commit()
+
+    def key(self, text: str) -> str:
+        """
+        텍스트의 캐시 키를 계산하는 메서드
+
+        Okt는 줄바꿈도 토큰으로 남기므로 공백을 합치는 등의 추가 정규화는 하지 않음
+        """
+        return hashlib.sha1(f"{self.version}\x00{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        여러 키를 한 번에 조회하는 메서드
+
+        Parameters:
+        - keys (Iterable[str]): 조회할 캐시 키 목록
+
+        Returns:
+        - Dict[str, str]: 캐시에 존재하는 키 → 토큰 문자열
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        for start in range(0, len(keys), self._BATCH):
+            batch = keys[start:start + self._BATCH]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.conn.execute(
+                f"SELECT key, tokens FROM tokens WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            found.update(rows)
+        if found:
+            now = time.time()
+            self.conn.executemany("UPDATE tokens SET last_used = ? WHERE key = ?",
+                                  [(now, k) for k in found])
+            self.conn.commit()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """
+        (키, 토큰 문자열) 목록을 저장하고 필요하면 오래된 항목을 삭제하는 메서드
+        """
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO tokens (key, tokens, last_used) VALUES (?, ?, ?)",
+            [(k, v, now) for k, v in items],
+        )
+        self.conn.commit()
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        max_entries를 넘는 만큼 가장 오래 사용되지 않은 항목을 삭제하는 메서드
+
+        Returns:
+        - int: 삭제된 항목 수
+        """
+        if self.max_entries is None:
+            return 0
+        overflow = len(self) - self.max_entries
+        if overflow <= 0:
+            return 0
+        self.conn.execute(
+            "DELETE FROM tokens WHERE key IN "
+            "(SELECT key FROM tokens ORDER BY last_used ASC LIMIT ?)", (overflow,)
+        )
+        self.conn.commit()
+        return overflow
+
+    def stats(self) -> Dict[str, int]:
+        """
+        적중/미스 횟수와 현재 항목 수를 반환하는 메서드
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    def __enter__(self) -> "TokenCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,299 @@
+import hashlib
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from review_analysis.preprocessing.token_cache import TokenCache
+from utils.stats import percentile
+
+if TYPE_CHECKING:
+    from konlpy.tag import Okt # type: ignore
+
+    # Okt 또는 KiwiAnalyzer처럼 morphs(text)를 제공하는 형태소 분석기
+    Analyzer = Union[Okt, "KiwiAnalyzer"]
+
+KOREAN_STOPWORDS = frozenset([
+    '이','그','저','것','수','들','좀','더','잘','많이','자주','같이','거의','너무','정말','그리고','또한',
+    '하지만','그러나','때문에','그래서','거나','하며','하는','에는','ㅎㅎ','ㅋㅋ','ㅠㅠ','ㅠ','...','..','…','ㅡㅡ','~~','--',
+    '거','다','까지','이다','입니다','있습니다','합니다','제','우리','그냥','또','다시','좀더','계속','항상','사실','보통',
+    '대부분','혹시','요즘','더욱','의','가','이','은','는','을','를','에','도','와','한','과','로','에서','의','과','도','를','로서',
+    '로써','에서','까지','에게','께서','만','밖에','보다','처럼','보다','까지','이며','하면서','으로','에게로','였다','했다','됐다','이다',
+    '하게','하게끔','하게나','하기','해서','했더니','해서는','하고','하며','하고서도','···'
+])
+
+def new_okt() -> "Okt":
+    """
+    Okt 인스턴스를 생성하는 함수
+
+    konlpy는 임포트만으로도 JPype/JVM 준비 비용이 크므로 실제로 토큰화가 필요할 때 임포트한다.
+    """
+    from konlpy.tag import Okt # type: ignore
+    return Okt()
+
+
+class KiwiAnalyzer:
+    """
+    kiwipiepy.Kiwi를 Okt와 같은 morphs() 인터페이스로 감싼 형태소 분석기 (JVM 불필요)
+
+    Kiwi는 "입니다" → "이" + "ᆸ니다"처럼 형태소를 원형으로 돌려주므로, Okt와 같은 불용어 목록이
+    적용되도록 원문에서 위치가 겹치는 형태소를 합쳐 표면형("입니다") 그대로 반환한다.
+    """
+
+    def __init__(self):
+        from kiwipiepy import Kiwi # type: ignore
+        self._kiwi = Kiwi()
+
+    def morphs(self, text: str) -> List[str]:
+        spans: List[List[int]] = []
+        for token in self._kiwi.tokenize(text):
+            end = token.start + token.len
+            if spans and token.start < spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([token.start, end])
+        return [text[start:end] for start, end in spans]
+
+
+# 백엔드 이름 : 형태소 분석기 생성 함수 (생성된 객체는 morphs(text) -> List[str]를 제공)
+TOKENIZER_BACKENDS: Dict[str, Callable[[], "Analyzer"]] = {
+    "okt": new_okt,
+    "kiwi": KiwiAnalyzer,
+}
+
+# 프로세서/API가 백엔드를 지정하지 않았을 때 사용할 백엔드
+DEFAULT_BACKEND = os.getenv("TOKENIZER_BACKEND", "okt")
+
+
+def tokenizer_version(backend: str) -> str:
+    """
+    토큰 캐시 키에 쓰이는 버전 문자열을 반환하는 함수
+
+    불용어 목록이나 분석기 백엔드가 바뀌면 캐시 키도 바뀌도록 둘 다 반영한다.
+    """
+    return backend + "-" + hashlib.sha1(
+        '\x00'.join(sorted(KOREAN_STOPWORDS)).encode("utf-8")
+    ).hexdigest()[:12]
+
+
+TOKENIZER_VERSION = tokenizer_version(DEFAULT_BACKEND)
+
+
+def clean_and_tokenize(analyzer: "Analyzer", text: str) -> str:
+    """
+    형태소 분석 후 불용어를 제거한 토큰을 공백으로 이어붙여 반환하는 함수
+    """
+    tokens = analyzer.morphs(text)
+    filtered = [t for t in tokens if t not in KOREAN_STOPWORDS]
+    return ' '.join(filtered)
+
+
+class TokenizerService:
+    """
+    프로세스 전체가 함께 쓰는 형태소 분석기 풀 (백엔드별로 하나)
+
+    - 분석기 인스턴스를 pool_size개만 만들어 두고 borrow()로 빌려 쓴 뒤 반납한다.
+    - 한 인스턴스는 한 번에 한 스레드만 쓰므로 API 요청 스레드들이 동시에 써도 안전하다.
+    - warm_up()은 최초 1회만 JVM 기동과 첫 분석을 수행하고 걸린 시간을 기록한다.
+    - metrics()로 워밍업 시간과 호출(텍스트 1건 분석)별 지연 시간 분위수를 확인할 수 있다.
+    """
+
+    def __init__(self, backend: str = "okt", pool_size: int = 1, latency_window: int = 10000):
+        if backend not in TOKENIZER_BACKENDS:
+            raise ValueError(f"지원하지 않는 토크나이저 백엔드: {backend}")
+        self.backend = backend
+        self.pool_size = max(1, pool_size)
+        self._pool: "queue.Queue[Analyzer]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._warmed = False
+        self.warmup_seconds: Optional[float] = None
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._calls = 0
+
+    @property
+    def warmed(self) -> bool:
+        return self._warmed
+
+    def warm_up(self) -> "TokenizerService":
+        """
+        분석기 풀을 만들고 첫 분석까지 마쳐두는 메서드 (이미 워밍업됐으면 아무것도 하지 않음)
+        """
+        if self._warmed:
+            return self
+        with self._lock:
+            if not self._warmed:
+                start = time.perf_counter()
+                factory = TOKENIZER_BACKENDS[self.backend]
+                for _ in range(self.pool_size):
+                    analyzer = factory()
+                    analyzer.morphs("워밍업")
+                    self._pool.put(analyzer)
+                self.warmup_seconds = time.perf_counter() - start
+                self._warmed = True
+        return self
+
+    @contextmanager
+    def borrow(self) -> Iterator["Analyzer"]:
+        """
+        풀에서 분석기 하나를 빌려주는 컨텍스트 매니저 (모두 사용 중이면 반납될 때까지 대기)
+        """
+        self.warm_up()
+        analyzer = self._pool.get()
+        try:
+            yield analyzer
+        finally:
+            self._pool.put(analyzer)
+
+    def tokenize(self, texts: Sequence[str]) -> List[str]:
+        """
+        빌린 분석기 하나로 텍스트 목록을 순서대로 토큰화하는 메서드
+        """
+        results: List[str] = []
+        latencies: List[float] = []
+        with self.borrow() as analyzer:
+            for text in texts:
+                start = time.perf_counter()
+                results.append(clean_and_tokenize(analyzer, text))
+                latencies.append(time.perf_counter() - start)
+        with self._lock:
+            self._latencies.extend(latencies)
+            self._calls += len(latencies)
+        return results
+
+    def metrics(self) -> Dict[str, object]:
+        """
+        워밍업 시간과 최근 호출들의 지연 시간(ms) 분위수를 반환하는 메서드
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            calls = self._calls
+        report: Dict[str, object] = {
+            "backend": self.backend,
+            "pool_size": self.pool_size,
+            "warmed": self._warmed,
+            "warmup_ms": None if self.warmup_seconds is None else round(self.warmup_seconds * 1000, 3),
+            "calls": calls,
+        }
+        if latencies:
+            report.update({
+                "latency_ms_mean": round(sum(latencies) / len(latencies) * 1000, 3),
+                "latency_ms_p50": round(percentile(latencies, 50) * 1000, 3),
+                "latency_ms_p95": round(percentile(latencies, 95) * 1000, 3),
+                "latency_ms_p99": round(percentile(latencies, 99) * 1000, 3),
+                "latency_ms_max": round(latencies[-1] * 1000, 3),
+            })
+        return report
+
+
+_services: Dict[str, TokenizerService] = {}
+_service_lock = threading.Lock()
+
+
+def get_tokenizer_service(backend: Optional[str] = None, pool_size: Optional[int] = None) -> TokenizerService:
+    """
+    백엔드별 프로세스 전역 TokenizerService를 반환하는 함수 (처음 호출될 때 생성, 워밍업은 지연)
+
+    Parameters:
+    - backend (Optional[str]): "okt" 또는 "kiwi" (None이면 환경변수 TOKENIZER_BACKEND, 없으면 "okt")
+    - pool_size (Optional[int]): 처음 생성할 때의 분석기 인스턴스 수
+      (None이면 환경변수 TOKENIZER_POOL_SIZE, 없으면 1)
+
+    Returns:
+    - TokenizerService: 프로세스 전역 토크나이저 서비스
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend not in _services:
+        with _service_lock:
+            if backend not in _services:
+                if pool_size is None:
+                    pool_size = int(os.getenv("TOKENIZER_POOL_SIZE", "1"))
+                _services[backend] = TokenizerService(backend=backend, pool_size=pool_size)
+    return _services[backend]
+
+
+def _init_worker(backend: str) -> None:
+    # 워커 프로세스마다 전역 서비스를 미리 워밍업 (분석기/JVM 기동 비용을 워커당 1회로 제한)
+    get_tokenizer_service(backend, pool_size=1).warm_up()
+
+
+def _tokenize_chunk(backend: str, texts: List[str]) -> List[str]:
+    return get_tokenizer_service(backend).tokenize(texts)
+
+
+def create_tokenizer_pool(backend: str, n_jobs: int) -> ProcessPoolExecutor:
+    """
+    워커마다 backend 분석기를 한 번만 띄우는 토큰화용 프로세스 풀을 만드는 함수
+
+    여러 청크/배치를 토큰화할 때 풀을 한 번 만들어 tokenize_texts(executor=...)로 넘기면
+    워커(와 Okt의 JVM) 기동 비용을 실행 전체에서 한 번만 치른다. with 문으로 닫는다.
+    """
+    # JVM이 떠 있는 부모 프로세스를 fork하지 않도록 spawn 사용
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=n_jobs, mp_context=context,
+                               initializer=_init_worker, initargs=(backend,))
+
+
+def _chunked(texts: Sequence[str], chunk_size: int) -> Iterable[List[str]]:
+    for start in range(0, len(texts), chunk_size):
+        yield list(texts[start:start + chunk_size])
+
+
+def tokenize_texts(texts: Sequence[str], service: Optional[TokenizerService] = None,
+                   n_jobs: int = 1, chunk_size: int = 500,
+                   cache: Optional[TokenCache] = None,
+                   executor: Optional[ProcessPoolExecutor] = None) -> List[str]:
+    """
+    리뷰 텍스트 목록을 토큰화하는 함수
+
+    - n_jobs가 1이면 현재 프로세스의 토크나이저 서비스에서 분석기를 빌려 순차적으로 처리
+    - n_jobs가 2 이상이면 워커마다 같은 백엔드의 분석기를 한 번만 띄운 프로세스 풀에 chunk_size 단위로 나눠 처리
+      (executor가 주어지면 그 풀을 재사용하고, 없으면 이번 호출 동안만 풀을 띄움)
+    - 어느 경로든 결과는 입력과 같은 순서로 반환됨
+    - cache가 주어지면 캐시에 없는 (중복 제거된) 텍스트만 분석하고 결과를 캐시에 저장
+
+    Parameters:
+    - texts (Sequence[str]): 토큰화할 텍스트 목록
+    - service (Optional[TokenizerService]): 사용할 서비스 (없으면 기본 백엔드의 프로세스 전역 서비스,
+      병렬 처리 시에는 워커가 같은 백엔드를 사용)
+    - n_jobs (int): 워커 프로세스 수
+    - chunk_size (int): 워커에 한 번에 넘길 텍스트 수
+    - cache (Optional[TokenCache]): 토큰화 결과 캐시
+    - executor (Optional[ProcessPoolExecutor]): create_tokenizer_pool로 만든 재사용할 워커 풀 (service와 같은 백엔드)
+
+    Returns:
+    - List[str]: 불용어가 제거된 토큰 문자열 목록
+    """
+    texts = list(texts)
+    if cache is not None:
+        keys = [cache.key(text) for text in texts]
+        found = cache.get_many(keys)
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in pending:
+                pending[key] = text
+        if pending:
+            tokenized = tokenize_texts(list(pending.values()), service=service,
+                                       n_jobs=n_jobs, chunk_size=chunk_size, executor=executor)
+            new_items = dict(zip(pending.keys(), tokenized))
+            cache.set_many(new_items.items())
+            found.update(new_items)
+        return [found[key] for key in keys]
+
+    service = service or get_tokenizer_service()
+    if n_jobs <= 1 or len(texts) <= chunk_size:
+        return service.tokenize(texts)
+
+    if executor is None:
+        with create_tokenizer_pool(service.backend, n_jobs) as executor:
+            return tokenize_texts(texts, service=service, n_jobs=n_jobs, chunk_size=chunk_size, executor=executor)
+
+    results: List[str] = []
+    for tokens in executor.map(partial(_tokenize_chunk, service.backend), _chunked(texts, chunk_size)):
+        results.extend(tokens)
+    return results
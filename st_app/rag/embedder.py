@@ -4,23 +4,26 @@ from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
+from review_analysis.preprocessing.dedup import near_duplicate_mask
 import pandas as pd
 import os
 
-def build_faiss_index(save_path="st_app/db/faiss_index"):
+def build_faiss_index(save_path="st_app/db/faiss_index", near_dedup=0.8):
     # CSV 불러오기 및 합치기
     # 로컬에 클론한 GitHub 경로
     BASE_PATH = "database"
 
-    # 각 파일 경로
-    aladin_csv = os.path.join(BASE_PATH, "preprocessed_reviews_aladin.csv")
-    kyobo_csv = os.path.join(BASE_PATH, "preprocessed_reviews_kyobo.csv")
-    yes24_csv = os.path.join(BASE_PATH, "preprocessed_reviews_yes24.csv")
+    # 각 사이트 전처리 결과 불러오기
+    # parquet 결과가 있으면 review 컬럼만 읽고(column projection), 없으면 CSV에서 읽음
+    def load_reviews(site):
+        parquet_path = os.path.join(BASE_PATH, f"preprocessed_reviews_{site}.parquet")
+        if os.path.exists(parquet_path):
+            return pd.read_parquet(parquet_path, columns=["review"])
+        return pd.read_csv(os.path.join(BASE_PATH, f"preprocessed_reviews_{site}.csv"), usecols=["review"])
 
-    # 불러오기
-    df_aladin = pd.read_csv(aladin_csv)
-    df_kyobo = pd.read_csv(kyobo_csv)
-    df_yes24 = pd.read_csv(yes24_csv)
+    df_aladin = load_reviews("aladin")
+    df_kyobo = load_reviews("kyobo")
+    df_yes24 = load_reviews("yes24")
 
     # 합치기
     df = pd.concat([df_aladin, df_kyobo, df_yes24], ignore_index=True)
@@ -36,6 +39,11 @@ def build_faiss_index(save_path="st_app/db/faiss_index"):
     df["review"] = df["review"].apply(clean_text)
     df = df[df["review"].str.len() >= 10]
     df = df.drop_duplicates(subset=["review"])
+    # 사이트 간에 거의 같은 리뷰(문장부호/어미만 다른 경우 등)는 하나만 임베딩 (MinHash + LSH)
+    if near_dedup is not None:
+        before = len(df)
+        df = df[~near_duplicate_mask(df["review"], threshold=near_dedup)]
+        print(f"유사 중복 리뷰 제거: {before - len(df)}건 → {len(df)}건 임베딩")
 
     documents = [Document(page_content=f"[리뷰] {row['review']}") for _, row in df.iterrows()]
     splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
@@ -0,0 +1,72 @@
+import csv
+
+import pytest
+
+from review_analysis.crawling.checkpoint import CrawlCheckpoint, ResumeError, SeenReviews, checkpoint_path
+
+def test_checkpoint_step_saves_every_n_and_clears(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path), "yes24", every=2)
+    assert checkpoint.load() is None
+    checkpoint.step(1, [["5", "2024-10-01", "첫 리뷰", "0"]])
+    assert checkpoint.load() is None
+    checkpoint.step(2, [["5", "2024-10-01", "첫 리뷰", "0"], ["4", "2024-10-02", "둘째 리뷰", "1"]])
+    state = checkpoint.load()
+    assert state["cursor"] == 2
+    assert state["rows"][1] == ["4", "2024-10-02", "둘째 리뷰", "1"]
+    assert checkpoint.path == checkpoint_path(str(tmp_path), "yes24")
+    checkpoint.clear()
+    assert checkpoint.load() is None
+
+def test_seen_reviews_early_stop_and_merge(tmp_path):
+    path = tmp_path / "reviews_kyobo.csv"
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(["review", "rating", "date"])
+        writer.writerow(["기존 리뷰 1", "4", "2024.10.02"])
+        writer.writerow(["기존 리뷰 2", "3", "2024.10.01"])
+
+    seen = SeenReviews(str(path))
+    assert len(seen) == 2
+    assert seen.all_seen(["기존 리뷰 1 ", "기존 리뷰 2"], ["2024.10.02", "2024.10.01"])
+    assert not seen.all_seen(["새 리뷰", "기존 리뷰 1"], ["2024.10.03", "2024.10.02"])
+    assert not seen.all_seen([], [])
+
+    merged = seen.merge([["새 리뷰", 4, "2024.10.03"], ["기존 리뷰 1", 4, "2024.10.02"]], ["review", "rating", "date"])
+    assert merged == [["새 리뷰", 4, "2024.10.03"], ["기존 리뷰 1", 4, "2024.10.02"], ["기존 리뷰 2", "3", "2024.10.01"]]
+
+def test_seen_reviews_without_output(tmp_path):
+    seen = SeenReviews(str(tmp_path / "missing.csv"))
+    assert len(seen) == 0
+    assert seen.merge([["r", 1, "d"]], ["review", "rating", "date"]) == [["r", 1, "d"]]
+
+@pytest.mark.parametrize("site_name", ["kyobo", "aladin"])
+def test_resume_keeps_checkpoint_when_cursor_is_unreachable(site_name, tmp_path, monkeypatch):
+    pytest.importorskip("bs4")
+    pytest.importorskip("selenium")
+    pytest.importorskip("webdriver_manager")
+    from benchmarks.synthetic_pages import record_synthetic_pages
+    from review_analysis.crawling.main import CRAWLER_CLASSES
+    from review_analysis.crawling.page_cache import PageCache
+
+    monkeypatch.chdir(tmp_path)
+    cache_dir = str(tmp_path / "page_cache")
+    record_synthetic_pages(CRAWLER_CLASSES[site_name](str(tmp_path), cache=PageCache(cache_dir, "record")), 30,
+                           per_page=10)
+    # 저장된 페이지(블록)보다 뒤를 가리키는 체크포인트
+    checkpoint = CrawlCheckpoint(str(tmp_path), site_name)
+    checkpoint.save(50, [])
+
+    crawler = CRAWLER_CLASSES[site_name](str(tmp_path), resume=True, cache=PageCache(cache_dir, "replay"))
+    with pytest.raises(ResumeError):
+        crawler.scrape_reviews()
+    assert checkpoint.load()["cursor"] == 50
+
+def test_review_key_ignores_whitespace_differences_between_parsers():
+    from review_analysis.crawling.checkpoint import review_key
+
+    # Selenium .text는 <br>/인라인 태그를 화면처럼 합치고, BeautifulSoup get_text("\n", strip=True)는
+    # 텍스트 노드마다 줄을 나누므로 같은 리뷰라도 공백이 다를 수 있음
+    selenium_text = "정말 좋은 책\n다시 읽고 싶어요 강추"
+    bs4_text = "정말 좋은 책\n다시 읽고 싶어요\n강추"
+    assert review_key(selenium_text, "2024.10.01") == review_key(bs4_text, " 2024.10.01")
+    assert review_key(selenium_text, "2024.10.01") != review_key("정말 좋은 책", "2024.10.01")
@@ -0,0 +1,34 @@
+import json
+
+from review_analysis.crawling.metrics import CrawlMetrics, write_metrics_report
+from review_analysis.crawling.politeness import Throttle
+
+def test_summary_percentiles(tmp_path):
+    metrics = CrawlMetrics("kyobo")
+    for ms in range(1, 101):
+        metrics.record("wait", ms / 1000)
+    with metrics.timed("parse"):
+        pass
+
+    summary = metrics.summary()
+    wait = summary["phases"]["wait"]
+    assert summary["site"] == "kyobo"
+    assert wait["count"] == 100
+    assert wait["p50_ms"] == 50.0
+    assert wait["p95_ms"] == 95.0
+    assert wait["max_ms"] == 100.0
+    assert wait["total_s"] == 5.05
+    assert summary["phases"]["parse"]["count"] == 1
+    # 기록이 없는 단계는 요약에서 빠진다
+    assert "fetch" not in summary["phases"]
+
+    path = tmp_path / "metrics" / "crawl.json"
+    write_metrics_report({"kyobo": {"status": "succeeded", "metrics": summary}}, str(path))
+    assert json.loads(path.read_text(encoding="utf-8"))["kyobo"]["metrics"] == summary
+
+def test_throttle_returns_waited_seconds():
+    throttle = Throttle(0.05)
+    assert throttle.wait() == 0.0
+    waited = throttle.wait()
+    assert 0.0 < waited <= 0.05
+    assert Throttle().wait() == 0.0
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from review_analysis.crawling.books import CrawlJob, book_query, job_name, read_jobs
+from review_analysis.crawling.scheduler import CrawlScheduler
+
+SITES = ["yes24", "kyobo", "aladin"]
+
+def test_read_jobs_skips_blank_and_duplicate_rows(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text("site,book_id\nyes24,1\n\nkyobo,S2\nyes24,1\naladin, 3 \n", encoding="utf-8-sig")
+    assert read_jobs(str(path), SITES) == [CrawlJob("yes24", "1"), CrawlJob("kyobo", "S2"), CrawlJob("aladin", "3")]
+
+    path.write_text("site,book_id\ninterpark,1\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_jobs(str(path), SITES)
+    assert job_name("yes24", "13137546") == "yes24"
+    assert job_name("yes24", "1") == "yes24_1"
+    # book_id가 없는 예전 문서는 기본 도서의 문서로 봄
+    assert book_query("yes24", "13137546") == {"book_id": {"$in": ["13137546", None]}}
+    assert book_query("yes24", "1") == {"book_id": "1"}
+
+def test_scheduler_limits_jobs_per_host_and_isolates_failures():
+    lock = threading.Lock()
+    active = {site: 0 for site in SITES}
+    peak = {site: 0 for site in SITES}
+    throttles = {}
+
+    def run_job(job, throttle):
+        throttles.setdefault(job.site, set()).add(id(throttle))
+        with lock:
+            active[job.site] += 1
+            peak[job.site] = max(peak[job.site], active[job.site])
+        time.sleep(0.02)
+        with lock:
+            active[job.site] -= 1
+        if job.book_id == "bad":
+            raise RuntimeError("boom")
+        return {"pages": 1, "rows": int(job.book_id), "seconds": 0.0}
+
+    jobs = [CrawlJob("yes24", str(i)) for i in range(4)] + [CrawlJob("kyobo", "bad")] + \
+           [CrawlJob("aladin", str(i)) for i in range(3)]
+    scheduler = CrawlScheduler(run_job, max_workers=4, host_concurrency={"yes24": 2, "kyobo": 1, "aladin": 1},
+                               host_intervals={"yes24": 0.01})
+    results = scheduler.run(jobs)
+
+    assert list(results) == jobs
+    assert peak == {"yes24": 2, "kyobo": 1, "aladin": 1}
+    # 같은 사이트의 작업은 하나의 Throttle을 공유
+    assert all(len(ids) == 1 for ids in throttles.values())
+    assert scheduler.throttles["yes24"].min_interval == 0.01
+    assert results[CrawlJob("kyobo", "bad")]["status"] == "failed"
+    assert "RuntimeError" in results[CrawlJob("kyobo", "bad")]["error"]
+    assert [results[job]["rows"] for job in jobs if job.site == "aladin"] == [0, 1, 2]
+
+def test_scheduler_rejects_host_concurrency_below_one():
+    # 0이면 그 사이트 작업을 꺼내지 못해 run()이 끝나지 않음
+    with pytest.raises(ValueError):
+        CrawlScheduler(lambda job, throttle: {}, host_concurrency={"yes24": 0})
+
+    # 크롤링 CLI는 크롤러 모듈(selenium/bs4)을 함께 임포트함
+    pytest.importorskip("bs4")
+    pytest.importorskip("selenium")
+    pytest.importorskip("webdriver_manager")
+    from review_analysis.crawling.main import create_parser
+
+    with pytest.raises(SystemExit):
+        create_parser().parse_args(["-o", "out", "--jobs_file", "jobs.csv", "--per_host", "0"])
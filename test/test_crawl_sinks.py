@@ -0,0 +1,110 @@
+import csv
+
+import pandas as pd
+
+from review_analysis.crawling.checkpoint import CrawlCheckpoint, SeenReviews
+from review_analysis.crawling.sinks import CsvSink, MongoSink, MultiSink, open_sink, rewrite_csv, write_rows
+
+COLUMNS = ["review", "rating", "date"]
+
+class FakeCollection:
+    def __init__(self):
+        self.batches = []
+        self.deleted = 0
+
+    def insert_many(self, documents, ordered=True):
+        self.batches.append(documents)
+
+    def delete_many(self, query):
+        self.deleted += 1
+        self.query = query
+
+def test_csv_sink_flushes_in_batches_and_appends(tmp_path):
+    path = tmp_path / "reviews_kyobo.csv"
+    sink = CsvSink(str(path), COLUMNS, buffer_size=2)
+    # 헤더는 바로 쓰이고, 행은 buffer_size개가 모여야 파일에 쓰인다
+    sink.write({"review": "리뷰 1", "rating": 5, "date": "2024.10.03"})
+    assert pd.read_csv(path).empty
+    sink.write({"review": "리뷰 2", "rating": 4, "date": "2024.10.02"})
+    assert len(pd.read_csv(path)) == 2
+    sink.write({"review": "리뷰 3", "rating": 3, "date": "2024.10.01"})
+    sink.close()
+    assert sink.written == 3
+
+    with CsvSink(str(path), COLUMNS, append=True) as appended:
+        appended.write({"review": "리뷰 4", "rating": 2, "date": "2024.09.30"})
+
+    # BOM은 파일 맨 앞에 한 번만 있어야 pandas가 그대로 읽는다
+    assert path.read_bytes().count("\ufeff".encode("utf-8")) == 1
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    assert list(df.columns) == COLUMNS
+    assert df["review"].tolist() == ["리뷰 1", "리뷰 2", "리뷰 3", "리뷰 4"]
+
+def test_mongo_sink_batches_and_multi_sink(tmp_path):
+    collection = FakeCollection()
+    csv_path = tmp_path / "reviews_aladin.csv"
+    sink = MultiSink([MongoSink(collection, buffer_size=2, reset=True), CsvSink(str(csv_path), COLUMNS)])
+    for i in range(5):
+        sink.write({"review": f"리뷰 {i}", "rating": 5, "date": "2024-10-01"})
+    sink.close()
+
+    assert collection.deleted == 1
+    assert [len(batch) for batch in collection.batches] == [2, 2, 1]
+    assert sink.written == 5
+    assert len(pd.read_csv(csv_path)) == 5
+
+def test_write_rows_skips_seen_and_checkpoint_flushes(tmp_path):
+    path = tmp_path / "reviews_kyobo.csv"
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerow(["기존 리뷰", "4", "2024.10.02"])
+
+    seen = SeenReviews(str(path))
+    sink = CsvSink(str(path), COLUMNS, append=True, buffer_size=100)
+    rows = [["새 리뷰", 5, "2024.10.03"], ["기존 리뷰", 4, "2024.10.02"]]
+    assert write_rows(sink, rows, COLUMNS, seen) == 1
+
+    # sink로 내보내는 중이면 체크포인트는 버퍼를 내보낸 뒤 cursor만 저장한다
+    checkpoint = CrawlCheckpoint(str(tmp_path), "kyobo", every=1)
+    checkpoint.step(1, [], sink)
+    assert checkpoint.load()["rows"] == []
+    assert pd.read_csv(path, encoding="utf-8-sig")["review"].tolist() == ["기존 리뷰", "새 리뷰"]
+
+def test_csv_sink_extends_legacy_header_instead_of_dropping_columns(tmp_path):
+    path = tmp_path / "reviews_kyobo.csv"
+    # book_id 컬럼이 생기기 전에 저장한 출력
+    pd.DataFrame([["기존 리뷰", 4, "2024.10.02"]], columns=COLUMNS).to_csv(path, index=False, encoding="utf-8-sig")
+    columns = COLUMNS + ["book_id"]
+    fill = {"book_id": "S000000610612"}
+
+    seen = SeenReviews(str(path), fill=fill)
+    with CsvSink(str(path), columns, append=True, fill=fill) as sink:
+        write_rows(sink, [["새 리뷰", 5, "2024.10.03", "S000000610612"]], columns, seen)
+
+    assert path.read_bytes().count("\ufeff".encode("utf-8")) == 1
+    df = pd.read_csv(path, encoding="utf-8-sig", dtype=str)
+    assert list(df.columns) == columns
+    assert df["book_id"].tolist() == ["S000000610612", "S000000610612"]
+    assert seen.merge([], columns) == [["기존 리뷰", "4", "2024.10.02", "S000000610612"]]
+
+def test_book_jobs_share_one_site_output(tmp_path):
+    path = tmp_path / "reviews_aladin.csv"
+    columns = COLUMNS + ["book_id"]
+    # 예전 출력(기본 도서, book_id 없음)에 다른 도서를 추가한 뒤 두 도서를 번갈아 다시 수집
+    pd.DataFrame([["기존 리뷰", 4, "2024-10-02"]], columns=COLUMNS).to_csv(path, index=False)
+    rewrite_csv(str(path), columns, [["다른 도서 리뷰", 5, "2024-10-03", "1"]], fill={"book_id": "40869703"},
+                drop=lambda row: row["book_id"] == "1")
+
+    collection = FakeCollection()
+    with open_sink("csv+mongo", "aladin", str(path), columns, mongo_collection=collection, book_id="40869703") as sink:
+        sink.write({"review": "새 리뷰", "rating": 3, "date": "2024-10-04", "book_id": "40869703"})
+    assert collection.query == {"book_id": {"$in": ["40869703", None]}}
+    with open_sink("csv", "aladin", str(path), columns, book_id="1") as sink:
+        sink.write({"review": "다시 수집한 리뷰", "rating": 2, "date": "2024-10-05", "book_id": "1"})
+
+    df = pd.read_csv(path, encoding="utf-8-sig", dtype=str)
+    assert list(df.columns) == columns
+    assert df.values.tolist() == [["새 리뷰", "3", "2024-10-04", "40869703"], ["다시 수집한 리뷰", "2", "2024-10-05", "1"]]
+    # 증분 수집은 이 도서의 기존 리뷰만 본다
+    assert len(SeenReviews(str(path), fill={"book_id": "40869703"}, book_id="1")) == 1
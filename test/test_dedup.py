@@ -0,0 +1,24 @@
+import pytest
+
+from review_analysis.preprocessing.dedup import NearDuplicateIndex, find_near_duplicates, near_duplicate_mask
+
+TEXTS = [
+    "이 책 정말 재미있어요 강력 추천합니다",
+    "완전히 다른 내용의 리뷰입니다 배송이 늦었어요",
+    "이 책 정말 재미있어요 강력 추천합니다!!",
+    "완전히 다른 내용의 리뷰입니다  배송이 늦었어요",
+    "한강 작가님 책은 늘 기대 이상입니다",
+]
+
+def test_near_duplicates_grouped_to_first_occurrence():
+    assert find_near_duplicates(TEXTS, threshold=0.7) == [0, 1, 0, 1, 4]
+    assert near_duplicate_mask(TEXTS, threshold=0.7).tolist() == [False, False, True, True, False]
+
+def test_index_keeps_state_across_chunks():
+    index = NearDuplicateIndex(threshold=0.7)
+    chunks = [index.duplicate_mask(TEXTS[:2]), index.duplicate_mask(TEXTS[2:])]
+    assert [flag for chunk in chunks for flag in chunk.tolist()] == near_duplicate_mask(TEXTS, threshold=0.7).tolist()
+
+def test_bands_must_divide_num_perm():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_perm=64, bands=10)
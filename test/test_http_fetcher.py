@@ -0,0 +1,100 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from review_analysis.crawling.http_fetcher import HttpPageFetcher
+
+def review_page(page_num: int) -> str:
+    # YES24 AwordReviewList 응답과 같은 구조의 한줄평 두 개
+    boxes = "".join(
+        f"""<div class="cmtInfoGrp">
+              <div class="cmt_rating"><span class="rating rating_{5 - i}"></span></div>
+              <div class="cmt_etc"><em class="txt_date">2024-10-{page_num:02d}</em></div>
+              <div class="cmt_cont"><span class="txt"> {page_num}페이지 리뷰 {i} </span></div>
+              <a class="btnC"><em class="txt">{i}</em></a>
+            </div>"""
+        for i in range(2)
+    )
+    return f"<div class='reviewList'>{boxes}</div>"
+
+class StandInHandler(BaseHTTPRequestHandler):
+    pages = 3
+    failures = {}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        page_num = int(parse_qs(url.query).get("PageNumber", ["1"])[0])
+        # 첫 요청은 503으로 응답해 재시도를 확인
+        if self.failures.get(page_num, 0) > 0:
+            self.failures[page_num] -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        body = (review_page(page_num) if page_num <= self.pages else "<div class='reviewList'></div>").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stand_in_server():
+    StandInHandler.failures = {2: 1}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def test_fetch_many_keeps_order_and_retries(stand_in_server):
+    urls = [f"{stand_in_server}/list?PageNumber={page}" for page in range(1, 5)]
+    with HttpPageFetcher(max_workers=4, backoff=0.01) as fetcher:
+        pages = fetcher.fetch_many(urls)
+    assert ["2페이지 리뷰 0" in page for page in pages] == [False, True, False, False]
+    assert "cmtInfoGrp" not in pages[3]
+    assert fetcher.retried == 1
+    assert fetcher.requests == 5
+
+def test_fetch_many_returns_none_after_retries(stand_in_server):
+    StandInHandler.failures = {1: 10}
+    with HttpPageFetcher(max_workers=2, retries=2, backoff=0.01) as fetcher:
+        assert fetcher.fetch_many([f"{stand_in_server}/list?PageNumber=1"]) == [None]
+    assert fetcher.requests == 3
+
+def test_yes24_http_mode_parses_until_empty_page(stand_in_server, tmp_path, monkeypatch):
+    pytest.importorskip("bs4")
+    pytest.importorskip("selenium")
+    from review_analysis.crawling.yes24_crawler import Yes24Crawler
+
+    monkeypatch.chdir(tmp_path)
+    crawler = Yes24Crawler(str(tmp_path), fetch_mode="http", concurrency=2, site_url=stand_in_server)
+    crawler.scrape_reviews()
+    assert len(crawler.reviews) == 6
+    assert crawler.reviews[0] == ["5", "2024-10-01", "1페이지 리뷰 0", "0", "13137546"]
+    assert crawler.reviews[-1][2] == "3페이지 리뷰 1"
+
+def test_yes24_http_mode_stops_at_failed_page_and_resumes(stand_in_server, tmp_path, monkeypatch):
+    pytest.importorskip("bs4")
+    pytest.importorskip("selenium")
+    from review_analysis.crawling.checkpoint import PageFetchError
+    from review_analysis.crawling.yes24_crawler import Yes24Crawler
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(HttpPageFetcher, "_wait", lambda self, attempt, response=None: None)
+    StandInHandler.failures = {2: 10}
+    crawler = Yes24Crawler(str(tmp_path), fetch_mode="http", concurrency=2, site_url=stand_in_server)
+    # 실패한 페이지를 건너뛰지 않고 그 앞 페이지까지 체크포인트를 남김
+    with pytest.raises(PageFetchError):
+        crawler.scrape_reviews()
+    assert crawler.checkpoint.load()["cursor"] == 1
+
+    StandInHandler.failures = {}
+    resumed = Yes24Crawler(str(tmp_path), fetch_mode="http", concurrency=2, site_url=stand_in_server, resume=True)
+    resumed.scrape_reviews()
+    assert [row[2] for row in resumed.reviews] == [f"{page}페이지 리뷰 {i}" for page in (1, 2, 3) for i in range(2)]
@@ -0,0 +1,52 @@
+import pytest
+
+from review_analysis.crawling.http_fetcher import HttpPageFetcher
+from review_analysis.crawling.page_cache import CacheMiss, PageCache
+from test.test_http_fetcher import stand_in_server  # noqa: F401 (fixture)
+
+def test_page_cache_keys_by_url_and_state(tmp_path):
+    cache = PageCache(str(tmp_path), "record")
+    cache.save("https://example.com/item", "page=1", "<p>1</p>")
+    cache.save("https://example.com/item", "page=2", "<p>2</p>", count=3)
+
+    replay = PageCache(str(tmp_path), "replay")
+    assert replay.html("https://example.com/item", "page=1") == "<p>1</p>"
+    assert replay.load("https://example.com/item", "page=2")["count"] == 3
+    assert replay.has("https://example.com/item", "page=2")
+    assert not replay.has("https://example.com/item", "page=3")
+    with pytest.raises(CacheMiss):
+        replay.html("https://example.com/item", "page=3")
+    assert replay.stats() == {"mode": "replay", "hits": 2, "misses": 1, "stored": 0}
+    with pytest.raises(ValueError):
+        PageCache(str(tmp_path), "refresh")
+
+def test_fetcher_records_then_replays_without_network(stand_in_server, tmp_path):  # noqa: F811
+    urls = [f"{stand_in_server}/list?PageNumber={page}" for page in range(1, 4)]
+    with HttpPageFetcher(max_workers=2, backoff=0.01, cache=PageCache(str(tmp_path), "record")) as fetcher:
+        recorded = fetcher.fetch_many(urls)
+
+    with HttpPageFetcher(max_workers=2, cache=PageCache(str(tmp_path), "replay")) as fetcher:
+        replayed = fetcher.fetch_many(urls + ["http://127.0.0.1:9/list?PageNumber=9"])
+    assert replayed[:3] == recorded
+    # 캐시에 없는 페이지는 요청하지 않고 실패로 처리
+    assert replayed[3] is None
+    assert fetcher.requests == 0
+
+@pytest.mark.parametrize("site_name", ["yes24", "kyobo", "aladin"])
+def test_crawlers_replay_synthetic_pages(site_name, tmp_path, monkeypatch):
+    pytest.importorskip("bs4")
+    pytest.importorskip("selenium")
+    pytest.importorskip("webdriver_manager")
+    from benchmarks.crawl_benchmark import _build_crawler
+    from benchmarks.synthetic_pages import record_synthetic_pages
+
+    monkeypatch.chdir(tmp_path)
+    cache_dir = str(tmp_path / "page_cache")
+    recorder = _build_crawler(site_name, str(tmp_path), PageCache(cache_dir, "record"), concurrency=4)
+    expected = record_synthetic_pages(recorder, 45, per_page=10)
+
+    crawler = _build_crawler(site_name, str(tmp_path), PageCache(cache_dir, "replay"), concurrency=4)
+    crawler.scrape_reviews()
+    crawler.save_to_database()
+    assert crawler.collected == expected
+    assert crawler.pages >= 5
@@ -0,0 +1,26 @@
+from app.review.review_cache import TTLCache
+
+def test_cache_hit_expiry_and_invalidate(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.review.review_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value
+
+    assert cache.get_or_compute(("kyobo", "ratings"), lambda: compute(1)) == 1
+    assert cache.get_or_compute(("kyobo", "ratings"), lambda: compute(2)) == 1
+
+    # 만료되면 다시 계산
+    now[0] += 11
+    assert cache.get_or_compute(("kyobo", "ratings"), lambda: compute(3)) == 3
+    assert cache.get_or_compute(("yes24", "ratings"), lambda: compute(4)) == 4
+
+    # 무효화는 해당 사이트만
+    cache.invalidate("kyobo")
+    assert cache.get_or_compute(("kyobo", "ratings"), lambda: compute(5)) == 5
+    assert cache.get_or_compute(("yes24", "ratings"), lambda: compute(6)) == 4
+    assert calls == [1, 3, 4, 5]
+    assert cache.stats() == {"hits": 2, "misses": 4, "size": 2}
@@ -0,0 +1,65 @@
+from concurrent.futures import Future
+
+from app.review.review_jobs import JobManager
+
+
+class FakeExecutor:
+    """제출된 작업을 실행하지 않고 future만 돌려주는 실행기"""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+class FakeManager:
+    def dict(self):
+        return {}
+
+
+def make_manager():
+    manager = JobManager()
+    manager._executor = FakeExecutor()
+    manager._manager = FakeManager()
+    return manager
+
+
+def test_submit_coalesces_same_mode_and_serializes_each_site():
+    manager = make_manager()
+    incremental, merged = manager.submit("yes24", incremental=True)
+    assert merged is False
+
+    # 전체 처리 요청은 대기 중인 증분 작업에 합쳐지지 않고, 그 작업이 끝날 때까지 풀에 넣지 않음
+    full, merged = manager.submit("yes24", incremental=False)
+    assert merged is False
+    assert full["job_id"] != incremental["job_id"]
+    assert full["incremental"] is False
+    assert full["status"] == "queued"
+    assert len(manager._executor.futures) == 1
+
+    again, merged = manager.submit("yes24", incremental=True)
+    assert merged is True
+    assert again["job_id"] == incremental["job_id"]
+    again, merged = manager.submit("yes24", incremental=False)
+    assert merged is True
+    assert again["job_id"] == full["job_id"]
+
+    # 다른 사이트는 기다리지 않음
+    manager.submit("kyobo", incremental=False)
+    assert len(manager._executor.futures) == 2
+
+    # 앞선 작업이 끝나면 기다리던 작업이 실행되고, 끝난 작업은 더 이상 합쳐지지 않음
+    manager._executor.futures[0].set_exception(RuntimeError("boom"))
+    assert manager.get(incremental["job_id"])["status"] == "failed"
+    assert len(manager._executor.futures) == 3
+    retried, merged = manager.submit("yes24", incremental=True)
+    assert merged is False
+    assert retried["job_id"] != incremental["job_id"]
+    assert len(manager._executor.futures) == 3
+
+    manager._executor.futures[2].set_result(({"worker_pid": 1, "tokenizer": {}}, "done"))
+    assert manager.get(full["job_id"])["status"] == "succeeded"
+    assert len(manager._executor.futures) == 4
@@ -0,0 +1,194 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from review_analysis.preprocessing import review_processor, tokenizer
+from review_analysis.preprocessing.yes24_processor import Yes24Processor
+
+
+class FakeAnalyzer:
+    def morphs(self, text):
+        return text.split()
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    # JVM/kiwi 없이 공백 기준으로 나누는 분석기를 "fake" 백엔드로 등록
+    monkeypatch.setitem(tokenizer.TOKENIZER_BACKENDS, "fake", FakeAnalyzer)
+    monkeypatch.setattr(tokenizer, "_services", {})
+    return "fake"
+
+
+def raw_reviews(n: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "review": [f"소년이 온다 리뷰 {i}번 정말 좋은 책입니다" for i in range(n)],
+        "rating": [i % 5 + 1 for i in range(n)],
+        "date": [f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}" for i in range(n)],
+    })
+
+
+def test_stream_run_reuses_one_tokenizer_pool(fake_backend, tmp_path, monkeypatch):
+    pools = []
+
+    def create_pool(backend, n_jobs):
+        # 워커 프로세스 대신 같은 프로세스의 스레드 풀로 대체 (만든 횟수만 확인)
+        pools.append(backend)
+        return ThreadPoolExecutor(max_workers=n_jobs)
+
+    monkeypatch.setattr(review_processor, "create_tokenizer_pool", create_pool)
+    raw = raw_reviews(30)
+
+    serial = Yes24Processor(raw, str(tmp_path / "serial"), tokenizer_backend=fake_backend)
+    serial.preprocess()
+
+    parallel = Yes24Processor(raw, str(tmp_path / "parallel"), n_jobs=2, chunk_size=4,
+                              tokenizer_backend=fake_backend)
+    parallel.process_in_chunks(chunksize=10)
+
+    assert pools == ["fake"]
+    streamed = pd.read_csv(parallel.save_path)
+    assert streamed["clean_review"].tolist() == serial.df["clean_review"].tolist()
+
+
+def run_full(processor):
+    processor.preprocess()
+    processor.feature_engineering()
+    processor.save_to_database()
+    return processor
+
+
+def test_process_in_chunks_matches_full_run(fake_backend, tmp_path):
+    path = tmp_path / "reviews_yes24.csv"
+    raw = raw_reviews(25)
+    # 결측치/범위 밖 별점/짧은 리뷰가 청크 경계에 걸쳐 있어도 결과가 같아야 함
+    raw.loc[3, "rating"] = None
+    raw.loc[11, "rating"] = 9
+    raw.loc[17, "review"] = "짧음"
+    raw.to_csv(path, index=False)
+
+    full = run_full(Yes24Processor(str(path), str(tmp_path / "full"), tokenizer_backend=fake_backend))
+    streamed = Yes24Processor(str(path), str(tmp_path / "stream"), tokenizer_backend=fake_backend)
+    total = streamed.process_in_chunks(chunksize=7)
+
+    assert total == len(full.df) == 22
+    with open(full.save_path, encoding="utf-8") as f1, open(streamed.save_path, encoding="utf-8") as f2:
+        assert f1.read() == f2.read()
+    assert (full.tfidf_matrix != streamed.tfidf_matrix).nnz == 0
+
+
+def test_review_hash_ignores_inferred_dtypes_and_date_format():
+    from review_analysis.preprocessing.incremental import compute_review_hashes
+
+    as_text = pd.DataFrame({"review": ["좋아요 ", "슬퍼요"], "rating": ["5", "4"], "date": ["2024.10.01", "2024-01-02"]})
+    # 빈 별점 행이 붙으면 rating 컬럼이 float로 추론됨
+    with_blank = pd.DataFrame({"review": ["좋아요", "슬퍼요", "새 리뷰"], "rating": [5.0, 4.0, None],
+                               "date": ["2024-10-01", "2024-01-02", "2024-03-03"]})
+    assert compute_review_hashes(as_text).tolist() == compute_review_hashes(with_blank).tolist()[:2]
+    changed = with_blank.assign(rating=[5.0, 3.0, None])
+    assert compute_review_hashes(changed)[1] != compute_review_hashes(with_blank)[1]
+
+
+def test_incremental_run_merges_added_changed_and_deleted_rows(fake_backend, tmp_path):
+    path = tmp_path / "reviews_yes24.csv"
+    raw = raw_reviews(12)
+    raw.to_csv(path, index=False)
+    out = str(tmp_path / "out")
+    Yes24Processor(str(path), out, tokenizer_backend=fake_backend).process_incremental()
+
+    # 1건 변경, 1건 삭제, 2건 추가 (빈 별점 행도 섞어 rating 컬럼이 float가 되게 함)
+    updated = raw.copy()
+    updated.loc[2, "review"] = "내용이 바뀐 리뷰 소년이 온다 다시 읽음"
+    updated = updated.drop(index=5)
+    extra = pd.DataFrame({"review": ["새로 달린 리뷰 정말 슬픈 이야기", "별점 없는 리뷰 입니다 그래도 좋아요"],
+                          "rating": [4, None], "date": ["2024-12-01", "2024-12-02"]})
+    updated = pd.concat([updated, extra], ignore_index=True)
+    updated.to_csv(path, index=False)
+
+    processor = Yes24Processor(str(path), out, tokenizer_backend=fake_backend)
+    cleaned = []
+    clean_frame = processor.clean_frame
+    processor.clean_frame = lambda df: cleaned.append(len(df)) or clean_frame(df)
+    processor.process_incremental()
+    # 바뀐 행과 새 행(별점 없는 행 포함)만 다시 전처리됨
+    assert cleaned == [3]
+
+    full = run_full(Yes24Processor(str(path), str(tmp_path / "full"), tokenizer_backend=fake_backend))
+    merged = pd.read_csv(processor.save_path).sort_values("review_hash", ignore_index=True)
+    expected = pd.read_csv(full.save_path).sort_values("review_hash", ignore_index=True)
+    pd.testing.assert_frame_equal(merged, expected)
+
+
+def test_parquet_output_round_trips_like_csv(fake_backend, tmp_path):
+    from review_analysis.preprocessing.output_format import read_output
+
+    raw = raw_reviews(20)
+    as_csv = run_full(Yes24Processor(raw, str(tmp_path), tokenizer_backend=fake_backend))
+    as_parquet = run_full(Yes24Processor(raw, str(tmp_path), output_format="parquet", tokenizer_backend=fake_backend))
+    streamed = Yes24Processor(raw, str(tmp_path / "stream"), output_format="parquet", tokenizer_backend=fake_backend)
+    streamed.process_in_chunks(chunksize=6)
+
+    expected = read_output(as_csv.save_path)
+    for path in (as_parquet.save_path, streamed.save_path):
+        df = read_output(path)
+        # parquet은 date를 datetime, year_month를 범주형으로 저장
+        assert str(df["year_month"].dtype) == "category"
+        df["year_month"] = df["year_month"].astype(str)
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert read_output(as_parquet.save_path, columns=["review_hash"]).columns.tolist() == ["review_hash"]
+
+
+def test_dataframe_and_record_batch_inputs_match_csv_input(fake_backend, tmp_path):
+    from review_analysis.preprocessing.record_batches import iter_record_batches
+
+    path = tmp_path / "reviews_yes24.csv"
+    raw = raw_reviews(23)
+    raw.to_csv(path, index=False)
+    expected = run_full(Yes24Processor(str(path), str(tmp_path / "csv"), tokenizer_backend=fake_backend)).df
+
+    # MongoDB 커서처럼 dict를 한 건씩 내보내는 소스를 배치로 묶어 넘김
+    records = iter(raw.to_dict(orient="records"))
+    sources = [raw, iter_record_batches(records, 5)]
+    for i, source in enumerate(sources):
+        processor = run_full(Yes24Processor(source, str(tmp_path / str(i)), tokenizer_backend=fake_backend))
+        pd.testing.assert_frame_equal(processor.df, expected)
+
+
+def test_run_sites_with_jobs_matches_serial_run(tmp_path):
+    # 사이트별 작업 프로세스(spawn)에서도 쓸 수 있는 JVM 없는 백엔드 필요
+    pytest.importorskip("kiwipiepy")
+    from review_analysis.preprocessing.main import create_parser, run_sites
+
+    yes24 = tmp_path / "reviews_yes24.csv"
+    kyobo = tmp_path / "reviews_kyobo.csv"
+    raw_reviews(15).to_csv(yes24, index=False)
+    raw_reviews(15).assign(rating=lambda df: df["rating"].clip(upper=4),
+                           date=lambda df: df["date"].str.replace("-", ".")).to_csv(kyobo, index=False)
+    targets = [(str(yes24), "reviews_yes24"), (str(kyobo), "reviews_kyobo"),
+               (str(tmp_path / "missing.csv"), "reviews_aladin")]
+
+    outputs = {}
+    for jobs in (1, 2):
+        out = tmp_path / f"jobs{jobs}"
+        args = create_parser().parse_args(["-o", str(out), "-t", "kiwi", "-j", str(jobs)])
+        results = run_sites(targets, args)
+        # 한 사이트가 실패해도 나머지는 처리되고, 결과는 대상 순서대로 반환됨
+        assert list(results) == ["reviews_yes24", "reviews_kyobo", "reviews_aladin"]
+        assert [result["status"] for result in results.values()] == ["succeeded", "succeeded", "failed"]
+        outputs[jobs] = {site: (out / f"preprocessed_reviews_{site}.csv").read_text(encoding="utf-8")
+                         for site in ("yes24", "kyobo")}
+    assert outputs[1] == outputs[2]
+
+
+def test_book_id_is_carried_through_output_and_hash(fake_backend, tmp_path):
+    path = tmp_path / "reviews_yes24.csv"
+    legacy = raw_reviews(6)
+    # 같은 리뷰/별점/날짜라도 도서가 다르면 다른 행 (book_id가 없는 예전 행은 기본 도서)
+    other_book = legacy.assign(book_id="1")
+    pd.concat([legacy, other_book], ignore_index=True).to_csv(path, index=False)
+
+    processor = run_full(Yes24Processor(str(path), str(tmp_path / "out"), tokenizer_backend=fake_backend))
+    output = pd.read_csv(processor.save_path, dtype={"book_id": str})
+    assert list(output.columns) == review_processor.OUTPUT_COLUMNS
+    assert output["book_id"].tolist() == ["13137546"] * 6 + ["1"] * 6
+    assert output["review_hash"].nunique() == 12
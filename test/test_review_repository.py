@@ -0,0 +1,119 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pymongo import DeleteMany, ReplaceOne, UpdateOne
+
+from app.review.review_repository import (PreprocessStateRepository, ProcessedReviewRepository, decode_cursor,
+                                         encode_cursor)
+
+
+class FakeCollection:
+    """find / bulk_write / create_index만 흉내 내는 메모리 컬렉션"""
+
+    def __init__(self, documents=()):
+        self.documents = [dict(document, _id=i) for i, document in enumerate(documents)]
+        self.next_id = len(self.documents)
+        self.operations = []
+
+    @staticmethod
+    def _matches(document, query):
+        for key, value in query.items():
+            if isinstance(value, dict) and "$in" in value:
+                if document.get(key) not in value["$in"]:
+                    return False
+            elif isinstance(value, dict) and "$exists" in value:
+                if (key in document) != value["$exists"]:
+                    return False
+            elif document.get(key) != value:
+                return False
+        return True
+
+    def create_index(self, key, **kwargs):
+        pass
+
+    def find_one(self, query, projection=None):
+        return next(iter(self.find(query)), None)
+
+    def delete_many(self, query):
+        self.documents = [d for d in self.documents if not self._matches(d, query)]
+
+    def find(self, query, projection=None):
+        return [dict(document) for document in self.documents if self._matches(document, query)]
+
+    def bulk_write(self, operations, ordered=True):
+        deleted = 0
+        for operation in operations:
+            self.operations.append(operation)
+            if isinstance(operation, DeleteMany):
+                before = len(self.documents)
+                self.documents = [d for d in self.documents if not self._matches(d, operation._filter)]
+                deleted += before - len(self.documents)
+            elif isinstance(operation, UpdateOne):
+                if not any(self._matches(d, operation._filter) for d in self.documents):
+                    self.documents.append(dict(operation._doc["$setOnInsert"], _id=self.next_id))
+                    self.next_id += 1
+            elif isinstance(operation, ReplaceOne):
+                match = next((d for d in self.documents if self._matches(d, operation._filter)), None)
+                if match is not None:
+                    document_id = match["_id"]
+                    match.clear()
+                    match.update(operation._doc, _id=document_id)
+                else:
+                    self.documents.append(dict(operation._doc, _id=self.next_id))
+                    self.next_id += 1
+        return SimpleNamespace(deleted_count=deleted)
+
+
+def review(review_hash, clean_review):
+    return {"review_hash": review_hash, "review": "원문", "clean_review": clean_review, "rating": 5}
+
+
+def test_full_sync_only_touches_changed_documents():
+    collection = FakeCollection()
+    repository = ProcessedReviewRepository(collection, batch_size=2)
+    repository.sync([review("a", "좋다"), review("b", "슬프다"), review("c", "아프다")])
+    collection.operations.clear()
+
+    counts = repository.sync([review("a", "좋다"), review("b", "슬프 다"), review("d", "기억")])
+
+    assert counts == {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+    assert len(collection.operations) == 3
+    assert sorted(d["review_hash"] for d in collection.documents) == ["a", "b", "d"]
+
+
+def test_incremental_sync_keeps_untouched_documents_and_drops_duplicates():
+    collection = FakeCollection([review("a", "좋다"), review("a", "좋다"), review("b", "슬프다")])
+    repository = ProcessedReviewRepository(collection)
+
+    counts = repository.sync([review("a", "좋다"), review("c", "새 리뷰")], removed={"b", "x"})
+
+    # doc_hash가 없는 예전 문서는 한 번 교체되고, 중복 문서와 사라진 원본(b)은 삭제
+    assert counts == {"inserted": 1, "updated": 1, "deleted": 2, "unchanged": 0}
+    assert sorted(d["review_hash"] for d in collection.documents) == ["a", "c"]
+
+
+def test_cursor_round_trip_and_invalid_token():
+    last = {"date": datetime(2024, 10, 10), "review_hash": "abc", "rating": 5}
+
+    assert decode_cursor(encode_cursor(last)) == (datetime(2024, 10, 10), "abc")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_preprocess_state_stores_one_document_per_hash():
+    # 예전 형식(사이트당 해시 배열 문서 하나)은 지워지고 처리 이력이 없는 것으로 본다
+    collection = FakeCollection([{"_id": "yes24", "hashes": ["a", "b"]}, {"site": "kyobo", "review_hash": "a"}])
+    state = PreprocessStateRepository(collection, "yes24", batch_size=2)
+    state.ensure_indexes()
+    assert not state.has_state()
+
+    state.replace(["a", "b", "c"])
+    assert state.has_state()
+    assert state.seen(["a", "c", "x"]) == {"a", "c"}
+    assert state.removed({"a", "c", "d"}) == ["b"]
+
+    state.update(["d", "a"], removed=["b"])
+    assert sorted(d["review_hash"] for d in collection.documents if d["site"] == "yes24") == ["a", "c", "d"]
+    # 다른 사이트의 이력은 건드리지 않음
+    assert [d["review_hash"] for d in collection.documents if d["site"] == "kyobo"] == ["a"]
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+# database.mongodb_connection은 임포트할 때 클라이언트를 만듦 (연결은 첫 요청 때 하므로 실제 서버는 필요 없음)
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017/test")
+
+from app.review import review_service  # noqa: E402
+from review_analysis.preprocessing import tokenizer
+
+
+class FakeAnalyzer:
+    def morphs(self, text):
+        return text.split()
+
+
+@pytest.fixture
+def mongo(monkeypatch, tmp_path):
+    mongomock = pytest.importorskip("mongomock")
+    db = mongomock.MongoClient().db
+    # JVM/kiwi 없이 공백 기준으로 나누는 분석기를 "fake" 백엔드로 등록
+    monkeypatch.setitem(tokenizer.TOKENIZER_BACKENDS, "fake", FakeAnalyzer)
+    monkeypatch.setattr(tokenizer, "_services", {})
+    monkeypatch.setattr(review_service, "TOKENIZER_BACKEND", "fake")
+    monkeypatch.setattr(review_service, "TOKEN_CACHE_PATH", str(tmp_path / "token_cache.sqlite"))
+    monkeypatch.setattr(review_service, "mongo_db", db)
+    db["yes24"].insert_many([
+        {"review": f"소년이 온다 리뷰 {i}번 정말 좋은 책입니다", "rating": i % 5 + 1,
+         "date": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}", "book_id": "13137546"}
+        for i in range(10)
+    ])
+    return db
+
+
+def test_incremental_run_with_nothing_new_succeeds(mongo):
+    data, _ = review_service.preprocess_site("yes24")
+    assert data["count"] == 10
+
+    # 바뀐 원본이 없으면 TF-IDF를 학습할 문서가 없어도 실패하지 않고 아무것도 바꾸지 않음
+    data, message = review_service.preprocess_site("yes24", incremental=True)
+    assert message == "Incremental preprocessing completed."
+    assert data["count"] == 10
+    assert data["inserted"] == data["updated"] == data["deleted"] == 0
+
+    mongo["yes24"].insert_one({"review": "새로 달린 리뷰 정말 슬픈 이야기 입니다", "rating": 4,
+                               "date": "2024-12-01", "book_id": "13137546"})
+    data, _ = review_service.preprocess_site("yes24", incremental=True)
+    assert data["count"] == 11
+    assert data["inserted"] == 1
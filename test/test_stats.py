@@ -0,0 +1,7 @@
+from utils.stats import percentile
+
+def test_percentile_uses_nearest_rank():
+    values = [15, 20, 35, 40, 50]
+    # 순위 ceil(q/100 * n)번째 값 (q=0은 최솟값)
+    assert [percentile(values, q) for q in (0, 5, 30, 40, 50, 95, 100)] == [15, 15, 20, 20, 35, 50, 50]
+    assert percentile([0.1 * i for i in range(1, 21)], 95) == 0.1 * 19
@@ -0,0 +1,39 @@
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from review_analysis.preprocessing.tfidf import StreamingTfidf
+
+DOCS = [
+    "소년 온다 작가 한강 역사",
+    "광주 역사 기억 소년",
+    "한강 작가 노벨 문학상 축하",
+    "기억 역사 광주 눈물 가슴",
+    "작가 문장 가슴 아프다",
+    "소년 온다 추천 합니다",
+]
+
+
+def test_matches_tfidf_vectorizer_when_fit_in_chunks():
+    expected = TfidfVectorizer(max_features=5)
+    expected_matrix = expected.fit_transform(DOCS)
+
+    tfidf = StreamingTfidf(max_features=5)
+    tfidf.partial_fit(DOCS[:2]).partial_fit(DOCS[2:5]).partial_fit(DOCS[5:])
+    tfidf.finalize()
+    matrix = tfidf.transform(DOCS)
+
+    assert tfidf.vocabulary_ == expected.vocabulary_
+    assert np.allclose(tfidf.idf_, expected.idf_)
+    assert np.allclose(matrix.toarray(), expected_matrix.toarray())
+
+
+def test_update_matches_refit_with_fixed_vocabulary():
+    tfidf = StreamingTfidf(max_features=5).partial_fit(DOCS[:4]).finalize()
+    old_matrix = tfidf.transform(DOCS[:4])
+
+    old_idf = tfidf.update(added_docs=DOCS[4:], removed_docs=DOCS[:1])
+    matrix = tfidf.rescale(old_matrix[1:], old_idf)
+
+    expected = TfidfVectorizer(vocabulary=tfidf.vocabulary_).fit(DOCS[1:])
+    assert tfidf.n_docs == len(DOCS) - 1
+    assert np.allclose(tfidf.idf_, expected.idf_)
+    assert np.allclose(matrix.toarray(), expected.transform(DOCS[1:4]).toarray())
@@ -0,0 +1,39 @@
+import pytest
+from review_analysis.preprocessing.token_cache import TokenCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    token_cache = TokenCache(str(tmp_path / "tokens.sqlite"), version="v1")
+    yield token_cache
+    token_cache.close()
+
+
+def test_get_many_counts_hits_and_misses(cache):
+    key = cache.key("소년이 온다")
+    cache.set_many([(key, "소년 온다")])
+
+    found = cache.get_many([key, cache.key("작별하지 않는다")])
+
+    assert found == {key: "소년 온다"}
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_key_depends_on_text_and_version(cache, tmp_path):
+    assert cache.key("소년이\n온다") != cache.key("소년이 온다")
+
+    other = TokenCache(str(tmp_path / "other.sqlite"), version="v2")
+    assert other.key("소년이 온다") != cache.key("소년이 온다")
+    other.close()
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = TokenCache(str(tmp_path / "tokens.sqlite"), version="v1", max_entries=2)
+    cache.set_many([("a", "A")])
+    cache.set_many([("b", "B")])
+    cache.get_many(["a"])
+    cache.set_many([("c", "C")])
+
+    assert len(cache) == 2
+    assert cache.get_many(["a", "b", "c"]) == {"a": "A", "c": "C"}
+    cache.close()
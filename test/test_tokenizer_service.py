@@ -0,0 +1,47 @@
+import threading
+
+import pytest
+
+from review_analysis.preprocessing import tokenizer
+from review_analysis.preprocessing.tokenizer import TokenizerService
+
+
+class FakeOkt:
+    created = 0
+
+    def __init__(self):
+        FakeOkt.created += 1
+
+    def morphs(self, text):
+        return text.split()
+
+
+def test_pool_is_created_once_and_shared_between_threads(monkeypatch):
+    FakeOkt.created = 0
+    monkeypatch.setitem(tokenizer.TOKENIZER_BACKENDS, "okt", FakeOkt)
+    service = TokenizerService(pool_size=2)
+    results = []
+
+    def work():
+        results.append(service.tokenize(["정말 좋은 책", "그냥 그래요"]))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert FakeOkt.created == 2
+    assert results == [["좋은 책", "그래요"]] * 8
+
+    metrics = service.metrics()
+    assert metrics["warmed"] is True
+    assert metrics["calls"] == 16
+    assert metrics["latency_ms_p50"] <= metrics["latency_ms_p99"]
+
+
+def test_backends_have_separate_services_and_cache_versions():
+    assert tokenizer.get_tokenizer_service("okt") is not tokenizer.get_tokenizer_service("kiwi")
+    assert tokenizer.tokenizer_version("okt") != tokenizer.tokenizer_version("kiwi")
+    with pytest.raises(ValueError):
+        TokenizerService(backend="mecab")
@@ -1,17 +1,23 @@
 import logging
+import os
 
 def setup_logger(log_file='app.log'):
-    """Set up logging configuration."""
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-
-    file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-
+    """Set up logging configuration (safe to call again, e.g. from crawlers run in threads)."""
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG)
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    if not any(type(handler) is logging.StreamHandler for handler in logger.handlers):
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+
+    log_path = os.path.abspath(log_file)
+    if not any(isinstance(handler, logging.FileHandler) and handler.baseFilename == log_path
+               for handler in logger.handlers):
+        file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
     return logger
@@ -0,0 +1,7 @@
+import math
+from typing import Sequence
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of already sorted values using the nearest rank (ceil(q/100 * n))."""
+    index = max(0, math.ceil(q * len(sorted_values) / 100) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]